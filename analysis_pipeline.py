@@ -0,0 +1,198 @@
+import threading
+import time
+
+from deepface import fast
+from emoji import UltraEmoji
+from frame_ring import FrameRing
+from tracker import FaceTracker, TrackManager
+from smoothing import EmotionSmoother
+from rate_control import RateController, scene_hints
+from motion_gate import MotionGate
+
+from config import (
+    SMOOTHING_MODE,
+    SMOOTHING_HYSTERESIS,
+    SCAN_DIR,
+    SCAN_INTERVAL,
+    DETECTION_SIZE,
+    FACE_ALIGN,
+)
+
+
+class AnalysisPipeline:
+    """
+    Capture dan inferensi di thread masing-masing, display tetap di thread utama
+    (cv2.imshow / waitKey harus di sana).
+
+    - capture: cap.read() terus-menerus ke FrameRing (bounded, frame lama ditimpa)
+    - inference: selalu mengambil frame terbaru; deteksi + emosi tiap N frame
+      (dibatasi RateController), di antaranya kotak dilacak optical flow.
+      Hasilnya disimpan sebagai snapshot anotasi terbaru (latest-only).
+    - display: gambar frame terbaru dengan snapshot anotasi terakhir.
+
+    Jadi FPS display mengikuti kamera, inferensi berjalan di kecepatannya sendiri.
+    """
+
+    def __init__(self, cap, scan_writer=None, scan_interval=SCAN_INTERVAL):
+        self.cap = cap
+        self.scan_writer = scan_writer
+        self.scan_interval = scan_interval
+        self.frames = FrameRing()
+        self.tracker = FaceTracker()
+        self.tracks = TrackManager(emoji_factory=UltraEmoji)
+        self.smoother = EmotionSmoother(mode=SMOOTHING_MODE, hysteresis=SMOOTHING_HYSTERESIS)
+        self.rate = RateController()
+        self.motion_gate = MotionGate()
+        self._prev_regions = []
+        self.infer_fps = 0.0
+        self._annotations = []
+        self._annotations_seq = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._last_scan_time = 0
+
+    def start(self):
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, daemon=True),
+            threading.Thread(target=self._inference_loop, daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout=timeout)
+        self._threads = []
+
+    @property
+    def running(self):
+        return not self._stop.is_set()
+
+    def annotations(self):
+        """(seq frame yang dianalisis, list anotasi) terbaru: dict id, region, emotion, emoji."""
+        with self._lock:
+            return self._annotations_seq, list(self._annotations)
+
+    # ===============================
+    # CAPTURE
+    # ===============================
+    def _capture_loop(self):
+        while not self._stop.is_set():
+            if not self.frames.capture(self.cap):
+                # kamera putus / video habis
+                self._stop.set()
+                break
+
+    # ===============================
+    # INFERENCE
+    # ===============================
+    def _inference_loop(self):
+        last_seq = 0
+        while not self._stop.is_set():
+            seq, frame_view = self.frames.wait_newer(last_seq, timeout=0.5)
+            if frame_view is None or seq == last_seq:
+                continue
+            last_seq = seq
+            # salin supaya slot ring boleh ditimpa capture selama inferensi
+            frame = frame_view.copy()
+            started = time.time()
+            try:
+                annotations = self._analyze(frame)
+            except Exception:
+                self.tracker.force_detection()
+                continue
+            with self._lock:
+                self._annotations = annotations
+                self._annotations_seq = seq
+            elapsed = time.time() - started
+            if elapsed > 0:
+                fps = 1.0 / elapsed
+                self.infer_fps = fps if self.infer_fps == 0 else 0.9 * self.infer_fps + 0.1 * fps
+
+    def _analyze(self, frame):
+        # Deteksi + emosi hanya tiap N frame, di antaranya kotak wajah dilacak.
+        # Jeda minimal antar deteksi diatur RateController, kecuali track hilang.
+        detected = self.tracker.needs_detection(stable=self.tracks.all_stable()) and (
+            self.tracker.lost or self.rate.ready()
+        )
+        # Wajah & scene diam sejak deteksi terakhir -> pakai hasil sebelumnya
+        if (
+            detected
+            and not self.tracker.lost
+            and not self.motion_gate.changed(frame, self._prev_regions)
+        ):
+            self.rate.skip()
+            self.rate.notify(motion=False)
+            detected = False
+        if detected:
+            started = self.rate.begin()
+            try:
+                results = fast.analyze(
+                    frame,
+                    actions=["emotion"],
+                    enforce_detection=False,
+                    detection_size=DETECTION_SIZE,
+                    align=FACE_ALIGN,
+                    find_eyes=FACE_ALIGN,
+                    # satu kamera = satu stream: posisi mata boleh dipakai ulang antar frame
+                    eye_cache_key=id(self),
+                )
+            finally:
+                self.rate.end(started)
+            self.motion_gate.commit(frame)
+            if not isinstance(results, list):
+                results = [results]
+            results = self.tracker.reset(frame, results)
+        else:
+            results = self.tracker.track(frame)
+
+        # ID wajah tetap antar frame, emoji menempel di track masing-masing
+        active_tracks = self.tracks.update(results)
+
+        # Smoothing skor semua wajah sekaligus, hanya saat ada hasil inferensi baru
+        if detected:
+            self.smoother.update(
+                [t.id for t in active_tracks], [r.get("emotion", {}) for r in results]
+            )
+            self.smoother.retain([t.id for t in self.tracks.tracks])
+
+        # Gerakan / wajah baru -> deteksi lebih sering, scene statis -> lebih jarang
+        regions = [
+            tuple(int(r["region"][k]) for k in ("x", "y", "w", "h"))
+            for r in results
+            if r.get("face_confidence", 0) > 0
+        ]
+        motion, new_face = scene_hints(self._prev_regions, regions)
+        if motion or new_face or detected:
+            self.rate.notify(motion=motion, new_face=new_face)
+        self._prev_regions = regions
+
+        annotations = []
+        for track, r in zip(active_tracks, results):
+            region = tuple(int(r["region"][k]) for k in ("x", "y", "w", "h"))
+            dominant = self.smoother.dominant(track.id, r["dominant_emotion"])
+            annotations.append(
+                {"id": track.id, "region": region, "emotion": dominant, "emoji": track.emoji}
+            )
+        self._scan(frame, annotations)
+        return annotations
+
+    def _scan(self, frame, annotations):
+        # Auto Scan setiap `scan_interval` detik, crop dari frame bersih (tanpa overlay)
+        if self.scan_writer is None or not annotations:
+            return
+        current_time = time.time()
+        if current_time - self._last_scan_time < self.scan_interval:
+            return
+        a = annotations[0]
+        x, y, ww, hh = a["region"]
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        filename = f"{SCAN_DIR}/{timestamp}_{a['emotion']}.jpg"
+        face_crop = frame[max(y, 0) : y + hh, max(x, 0) : x + ww]
+        if face_crop.size > 0:
+            self.scan_writer.submit(timestamp, a["emotion"], filename, face_crop)
+        self._last_scan_time = current_time
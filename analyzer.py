@@ -1,13 +1,12 @@
 import cv2
 import time
-import os
-import csv
-from deepface import DeepFace
 from renderer import SuperEmojiRenderer
-from emoji import UltraEmoji
+from scan_writer import ScanWriter
+from analysis_pipeline import AnalysisPipeline
+from compositing import CompositeLayer
 
 from config import *
-from effects import add_scanlines, add_glitch, add_rgb_split
+from effects import EffectChain
 
 
 def analyze_simple_vector():
@@ -15,14 +14,11 @@ def analyze_simple_vector():
     if not cap.isOpened():
         return
 
-    # === Folder & File Penyimpanan ===
-    os.makedirs("scans", exist_ok=True)
-    csv_path = "scans/emotions_log.csv"
+    # === Penyimpanan hasil scan (background writer) ===
+    scan_writer = ScanWriter().start()
 
-    if not os.path.exists(csv_path):
-        with open(csv_path, mode="w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp", "emotion", "filename"])
+    # === Capture & inferensi di thread sendiri, display di thread ini ===
+    pipeline = AnalysisPipeline(cap, scan_writer=scan_writer).start()
 
     # === Window ===
     cv2.namedWindow(WINDOW_TITLE, cv2.WINDOW_NORMAL)
@@ -33,80 +29,46 @@ def analyze_simple_vector():
     emojis = []
     renderer = SuperEmojiRenderer(mode=EMOJI_MODES[EMOJI_MODE_IDX])
     effects_enabled = False
-    results = []
-    last_scan_time = 0
-
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    effects = EffectChain(scanline_intensity=25, scanline_thickness=2, rgb_shift=2)
+    last_seq = 0
+    # semua panel transparan HUD di-blend per ROI, tanpa copy frame penuh
+    hud = CompositeLayer()
+
+    while pipeline.running:
+        # selalu frame terbaru; frame yang terlewat tidak ditampilkan
+        seq, frame_view = pipeline.frames.wait_newer(last_seq, timeout=0.1)
+        if frame_view is None or seq == last_seq:
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
+            continue
+        last_seq = seq
+        frame = frame_view.copy()
         frame_idx += 1
         fh, fw = frame.shape[:2]
 
-        try:
-            results = DeepFace.analyze(
-                frame, actions=["emotion"], enforce_detection=False
+        # Anotasi terbaru dari thread inferensi (bisa dari frame sebelumnya)
+        _, annotations = pipeline.annotations()
+        emojis = [a["emoji"] for a in annotations]
+        for a in annotations:
+            x, y, ww, hh = a["region"]
+            dominant = a["emotion"]
+
+            a["emoji"].update(x, y, ww, hh)
+            a["emoji"].emotion = dominant
+
+            # Kotak wajah & label emosi
+            cv2.rectangle(frame, (x, y), (x + ww, y + hh), (0, 255, 255), 2)
+            color = renderer.colors.get(dominant, (0, 255, 255))
+            cv2.putText(
+                frame,
+                dominant.upper(),
+                (x, max(y - 8, 16)),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.55,
+                color,
+                2,
+                cv2.LINE_AA,
             )
-            if not isinstance(results, list):
-                results = [results]
-
-            if len(results) == 0:
-                emojis = []
-            else:
-                if len(emojis) != len(results):
-                    emojis = [
-                        UltraEmoji(
-                            r["dominant_emotion"],
-                            r["region"]["x"],
-                            r["region"]["y"],
-                            r["region"]["w"],
-                            r["region"]["h"],
-                        )
-                        for r in results
-                    ]
-
-                for idx, r in enumerate(results):
-                    x, y, ww, hh = map(
-                        int,
-                        (
-                            r["region"]["x"],
-                            r["region"]["y"],
-                            r["region"]["w"],
-                            r["region"]["h"],
-                        ),
-                    )
-                    dominant = r["dominant_emotion"]
-
-                    emojis[idx].update(x, y, ww, hh)
-                    emojis[idx].emotion = dominant
-
-                    # Kotak wajah & label emosi
-                    cv2.rectangle(frame, (x, y), (x + ww, y + hh), (0, 255, 255), 2)
-                    color = renderer.colors.get(dominant, (0, 255, 255))
-                    cv2.putText(
-                        frame,
-                        dominant.upper(),
-                        (x, max(y - 8, 16)),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.55,
-                        color,
-                        2,
-                        cv2.LINE_AA,
-                    )
-
-                    # Auto Scan setiap 1 detik
-                    current_time = time.time()
-                    if current_time - last_scan_time >= 1.0:
-                        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-                        filename = f"scans/{timestamp}_{dominant}.jpg"
-                        face_crop = frame[y : y + hh, x : x + ww]
-                        if face_crop.size > 0:
-                            cv2.imwrite(filename, face_crop)
-                            with open(csv_path, mode="a", newline="") as f:
-                                csv.writer(f).writerow([timestamp, dominant, filename])
-                        last_scan_time = current_time
-        except Exception:
-            pass
 
         # === Render emoji kecil kiri atas ===
         current_emotion = emojis[0].emotion if emojis else "neutral"
@@ -126,12 +88,11 @@ def analyze_simple_vector():
         label_x = emoji_x + (emoji_size // 2) - (label_size[0] // 2)
         label_y = emoji_y + emoji_size + 18
 
-        overlay = frame.copy()
         bg_padding = 4
         bg_top_left = (label_x - bg_padding, label_y - label_size[1] - bg_padding)
         bg_bottom_right = (label_x + label_size[0] + bg_padding, label_y + bg_padding)
-        cv2.rectangle(overlay, bg_top_left, bg_bottom_right, (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.45, frame, 0.55, 0, frame)
+        hud.rect(bg_top_left, bg_bottom_right, (0, 0, 0), 0.45)
+        hud.flush(frame)
 
         cv2.putText(
             frame,
@@ -149,6 +110,7 @@ def analyze_simple_vector():
         text_y = emoji_y + 20
         info_texts = [
             f"FPS: {fps:.2f}",
+            f"Infer: {pipeline.infer_fps:.1f}",
             f"Mode: {renderer.mode.upper()}",
             f"Effects: {'ON' if effects_enabled else 'OFF'}",
         ]
@@ -180,9 +142,7 @@ def analyze_simple_vector():
 
         # === Efek opsional ===
         if effects_enabled:
-            frame = add_scanlines(frame, 25, 2)
-            frame = add_glitch(frame, frame_idx)
-            frame = add_rgb_split(frame, 2)
+            frame = effects.apply(frame, frame_idx)
 
         cv2.imshow(WINDOW_TITLE, frame)
 
@@ -195,5 +155,7 @@ def analyze_simple_vector():
         elif key & 0xFF == ord("f"):
             effects_enabled = not effects_enabled
 
+    pipeline.stop()
     cap.release()
+    scan_writer.stop()
     cv2.destroyAllWindows()
@@ -0,0 +1,102 @@
+"""
+Benchmark waktu import deepface (cold start API).
+
+Tiap target di-import di proses Python baru beberapa kali, dilaporkan median-nya.
+Untuk `deepface.fast` dan modul app (smoothing, analysis_pipeline, emotion_api) juga dicek
+bahwa tensorflow / pandas tidak ikut ter-import oleh thread utama. Import di thread
+background (preload model di emotion_api) memang disengaja dan tidak dihitung.
+
+    python bench_import.py
+    python bench_import.py --runs 7 --max-fast-seconds 1.5   # gagal (exit 1) jika regresi
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+TARGETS = {
+    "fast": "from deepface import fast",
+    "smoothing": "import smoothing",
+    "analysis_pipeline": "import analysis_pipeline",
+    "emotion_api": "import emotion_api",
+    "full": "from deepface import DeepFace",
+}
+
+# target yang boleh mengimport modul berat
+HEAVY_ALLOWED = {"full"}
+
+# modul berat yang tidak boleh ikut ter-import oleh target lain
+HEAVY_MODULES = ["tensorflow", "pandas", "keras", "torch"]
+
+# catat import modul berat dari thread utama saja; os._exit supaya thread
+# daemon (mis. preload model) tidak ikut ditunggu / mengganggu exit
+PROBE = """
+import builtins, os, sys, threading, time
+heavy = set()
+_import = builtins.__import__
+def _tracking_import(name, *args, **kwargs):
+    root = name.split(".")[0]
+    if root in {heavy!r} and threading.current_thread() is threading.main_thread():
+        heavy.add(root)
+    return _import(name, *args, **kwargs)
+builtins.__import__ = _tracking_import
+t = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - t
+print(elapsed, ",".join(sorted(heavy)), flush=True)
+os._exit(0)
+"""
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(stmt, runs):
+    timings, heavy = [], ""
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(stmt=stmt, heavy=HEAVY_MODULES)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        ).stdout.strip().splitlines()[-1]
+        elapsed, heavy = (out.split(" ", 1) + [""])[:2]
+        timings.append(float(elapsed))
+    return statistics.median(timings), heavy.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-fast-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    results = {}
+    for name, stmt in TARGETS.items():
+        try:
+            results[name] = measure(stmt, args.runs)
+        except subprocess.CalledProcessError as e:
+            print(f"{name:17s}  import gagal:\n{e.stderr}")
+            failed = True
+            continue
+        median, heavy = results[name]
+        print(f"{name:17s}  {median * 1000:9.1f} ms  heavy modules: {heavy or '-'}")
+        if heavy and name not in HEAVY_ALLOWED:
+            print(f"REGRESSION: `{stmt}` mengimport {heavy}")
+            failed = True
+
+    if "fast" in results:
+        median, heavy = results["fast"]
+        if args.max_fast_seconds is not None and median > args.max_fast_seconds:
+            print(f"REGRESSION: import deepface.fast {median:.2f}s > {args.max_fast_seconds:.2f}s")
+            failed = True
+    if "fast" in results and "full" in results:
+        print(f"speedup: {results['full'][0] / max(results['fast'][0], 1e-9):.1f}x")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
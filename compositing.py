@@ -0,0 +1,79 @@
+import cv2
+import numpy as np
+
+# mask lingkaran per (radius, thickness), dipakai ulang antar frame
+_circle_masks = {}
+
+
+def _clip_box(frame, x0, y0, x1, y1):
+    fh, fw = frame.shape[:2]
+    return max(0, x0), max(0, y0), min(fw, x1), min(fh, y1)
+
+
+def blend_rect(frame, pt1, pt2, color, alpha):
+    """
+    Tint persegi panjang transparan langsung di ROI (in place).
+    Sama dengan rectangle(FILLED) di overlay = frame.copy() lalu
+    addWeighted(overlay, alpha, frame, 1 - alpha), tanpa menyalin frame penuh.
+    """
+    x0, y0, x1, y1 = _clip_box(
+        frame, min(pt1[0], pt2[0]), min(pt1[1], pt2[1]),
+        max(pt1[0], pt2[0]) + 1, max(pt1[1], pt2[1]) + 1,
+    )
+    if x0 >= x1 or y0 >= y1:
+        return frame
+    roi = frame[y0:y1, x0:x1]
+    fill = np.empty_like(roi)
+    fill[...] = color
+    roi[...] = cv2.addWeighted(fill, alpha, roi, 1 - alpha, 0)
+    return frame
+
+
+def _circle_mask(radius, thickness):
+    key = (radius, thickness)
+    mask = _circle_masks.get(key)
+    if mask is None:
+        half = radius + max(thickness, 0) + 1
+        mask = np.zeros((2 * half + 1, 2 * half + 1), dtype=np.uint8)
+        cv2.circle(mask, (half, half), radius, 255, thickness)
+        _circle_masks[key] = mask
+    return mask
+
+
+def blend_circle(frame, center, radius, color, alpha, thickness=-1):
+    """Lingkaran transparan (isi atau outline) yang hanya di-blend di piksel mask-nya."""
+    mask = _circle_mask(int(radius), int(thickness))
+    half = mask.shape[0] // 2
+    cx, cy = int(center[0]), int(center[1])
+    x0, y0, x1, y1 = _clip_box(frame, cx - half, cy - half, cx + half + 1, cy + half + 1)
+    if x0 >= x1 or y0 >= y1:
+        return frame
+    mx0, my0 = x0 - (cx - half), y0 - (cy - half)
+    sub_mask = mask[my0 : my0 + (y1 - y0), mx0 : mx0 + (x1 - x0)] > 0
+    roi = frame[y0:y1, x0:x1]
+    pixels = roi[sub_mask].astype(np.float32)
+    pixels = pixels * (1 - alpha) + np.float32(color) * alpha
+    roi[sub_mask] = np.clip(pixels + 0.5, 0, 255).astype(np.uint8)
+    return frame
+
+
+class CompositeLayer:
+    """
+    Kumpulkan semua gambar transparan satu frame, lalu terapkan sekaligus
+    dengan flush(frame). Urutan gambar dipertahankan.
+    """
+
+    def __init__(self):
+        self._ops = []
+
+    def rect(self, pt1, pt2, color, alpha):
+        self._ops.append((blend_rect, (pt1, pt2, color, alpha), {}))
+
+    def circle(self, center, radius, color, alpha, thickness=-1):
+        self._ops.append((blend_circle, (center, radius, color, alpha), {"thickness": thickness}))
+
+    def flush(self, frame):
+        for fn, args, kwargs in self._ops:
+            fn(frame, *args, **kwargs)
+        self._ops = []
+        return frame
@@ -12,3 +12,61 @@ EMOJI_MODES = ["vector", "cartoon", "neon", "cyberpunk"]
 # Direktori penyimpanan hasil scan
 SAVE_DIR = "scanned_faces"
 os.makedirs(SAVE_DIR, exist_ok=True)
+
+# Inference scheduler (micro-batching lintas kamera / request)
+INFER_MAX_BATCH_SIZE = 8
+INFER_MAX_WAIT_MS = 15
+
+# Deteksi wajah di salinan frame yang diperkecil (sisi terpanjang, piksel);
+# crop wajah untuk emosi tetap dari frame resolusi penuh. None = tanpa resize
+DETECTION_SIZE = 640
+# Model emosi 48x48 cukup toleran terhadap rotasi: tanpa alignment, deteksi mata dilewati
+FACE_ALIGN = False
+
+# Cache hasil emosi untuk wajah yang nyaris identik antar frame (perceptual hash).
+# Di library default-nya mati; emotion_api mengaktifkannya setelah preload lewat
+# fast.configure_emotion_cache. Statistik hit rate ada di /ready ("emotion_cache").
+EMOTION_CACHE_SIZE = 1024
+EMOTION_CACHE_TTL = 300
+
+# Model yang di-build + warm-up saat API start (lihat /ready)
+PRELOAD_MODELS = ["Emotion", "opencv"]
+PRELOAD_WARMUP_BATCHES = [1, 4, INFER_MAX_BATCH_SIZE]
+
+# Tracker: deteksi + emosi tiap N frame, di antaranya kotak wajah diikuti optical flow
+TRACK_DETECT_EVERY = 5
+TRACK_MIN_CONFIDENCE = 0.5
+TRACK_IOU_THRESHOLD = 0.3
+TRACK_MAX_MISSES = 10
+TRACK_STABLE_HITS = 15
+
+# Smoothing skor emosi (lihat smoothing.EmotionSmoother)
+SMOOTHING_MODE = "ema"
+SMOOTHING_HYSTERESIS = 8.0
+
+# Penyimpanan hasil scan (ditulis di background oleh scan_writer.ScanWriter)
+SCAN_DIR = "scans"
+SCAN_CSV_PATH = os.path.join(SCAN_DIR, "emotions_log.csv")
+SCAN_QUEUE_SIZE = 64
+SCAN_FSYNC_INTERVAL = 5.0
+SCAN_INTERVAL = 1.0
+HISTORY_DB_PATH = os.path.join(SCAN_DIR, "history.sqlite3")
+HISTORY_PAGE_SIZE = 100
+HISTORY_MAX_PAGE_SIZE = 1000
+
+# Ring buffer frame kamera (jumlah slot yang dipakai bergantian)
+FRAME_RING_SIZE = 16
+
+# Laju inferensi adaptif (lihat rate_control.RateController), dalam detik
+RATE_MIN_INTERVAL = 0.05
+RATE_BASE_INTERVAL = 0.5
+RATE_MAX_INTERVAL = 2.0
+RATE_MAX_DUTY = 0.5
+RATE_BOOST_SECONDS = 2.0
+
+# Motion gate: inferensi dilewati jika wajah / scene tidak berubah (lihat motion_gate.MotionGate)
+MOTION_DOWNSCALE_WIDTH = 160
+MOTION_PIXEL_DELTA = 25
+MOTION_ROI_THRESHOLD = 8.0
+MOTION_SCENE_THRESHOLD = 0.02
+MOTION_MAX_REUSE = 10.0
@@ -2,7 +2,7 @@
 import os
 import warnings
 import logging
-from typing import Any, Dict, IO, List, Union, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Hashable, IO, List, Union, Optional, Sequence
 
 # this has to be set before importing tensorflow
 os.environ["TF_USE_LEGACY_KERAS"] = "1"
@@ -11,9 +11,12 @@ os.environ["TF_USE_LEGACY_KERAS"] = "1"
 
 # 3rd party dependencies
 import numpy as np
-import pandas as pd
 import tensorflow as tf
 
+if TYPE_CHECKING:
+    # only needed for annotations, pandas is imported by the modules that use it
+    import pandas as pd
+
 # package dependencies
 from deepface.commons import package_utils, folder_utils
 from deepface.commons.logger import Logger
@@ -181,6 +184,9 @@ def analyze(
     expand_percentage: int = 0,
     silent: bool = False,
     anti_spoofing: bool = False,
+    detection_size: Optional[int] = None,
+    find_eyes: bool = True,
+    eye_cache_key: Optional[Hashable] = None,
 ) -> Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
     """
     Analyze facial attributes such as age, gender, emotion, and race in the provided image.
@@ -212,6 +218,18 @@ def analyze(
 
         anti_spoofing (boolean): Flag to enable anti spoofing (default is False).
 
+        detection_size (int): if set, the image is downscaled so that its longer side is at most
+            this many pixels before running the detector. Facial areas and landmarks are mapped
+            back and faces are cropped and aligned from the original image (default is None).
+
+        find_eyes (bool): Flag to find eye coordinates of faces. Set to False to skip the
+            eye detection when neither alignment nor the eye landmarks in "region" are
+            needed (default is True).
+
+        eye_cache_key (hashable): id of the stream the image(s) belong to, e.g. a camera id.
+            If set, eyes found by the opencv eye detector in previous frames of the same stream
+            are reused for matching faces. Leave it None for unrelated images (default is None).
+
     Returns:
         (List[List[Dict[str, Any]]]): A list of analysis results if received batched image,
                                       explained below.
@@ -272,6 +290,9 @@ def analyze(
         expand_percentage=expand_percentage,
         silent=silent,
         anti_spoofing=anti_spoofing,
+        detection_size=detection_size,
+        find_eyes=find_eyes,
+        eye_cache_key=eye_cache_key,
     )
 
 
@@ -290,7 +311,7 @@ def find(
     refresh_database: bool = True,
     anti_spoofing: bool = False,
     batched: bool = False,
-) -> Union[List[pd.DataFrame], List[List[Dict[str, Any]]]]:
+) -> Union[List["pd.DataFrame"], List[List[Dict[str, Any]]]]:
     """
     Identify individuals in a database
     Args:
@@ -1,3 +1,7 @@
+# built-in dependencies
+import os
+import threading
+
 # 3rd parth dependencies
 from flask import Flask
 from flask_cors import CORS
@@ -6,6 +10,7 @@ from flask_cors import CORS
 from deepface import DeepFace
 from deepface.api.src.modules.core.routes import blueprint
 from deepface.commons.logger import Logger
+from deepface.modules import modeling
 
 logger = Logger()
 
@@ -14,5 +19,26 @@ def create_app():
     app = Flask(__name__)
     CORS(app)
     app.register_blueprint(blueprint)
+
+    # models to build and warm up in the background before traffic arrives, e.g.
+    # DEEPFACE_PRELOAD_MODELS=Emotion,opencv DEEPFACE_WARMUP_BATCHES=1,4,16
+    preload_models = [
+        model_name.strip()
+        for model_name in os.getenv("DEEPFACE_PRELOAD_MODELS", "").split(",")
+        if model_name.strip()
+    ]
+    warmup_batches = [
+        int(batch_size)
+        for batch_size in os.getenv("DEEPFACE_WARMUP_BATCHES", "1,4,16").split(",")
+        if batch_size.strip()
+    ]
+    app.config["DEEPFACE_PRELOAD_MODELS"] = preload_models
+    if preload_models:
+        threading.Thread(
+            target=modeling.preload,
+            kwargs={"models": preload_models, "warmup_batches": warmup_batches},
+            daemon=True,
+        ).start()
+
     logger.info(f"Welcome to DeepFace API v{DeepFace.__version__}!")
     return app
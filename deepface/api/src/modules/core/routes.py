@@ -2,7 +2,7 @@
 from typing import Union
 
 # 3rd party dependencies
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request
 import numpy as np
 
 # project dependencies
@@ -10,6 +10,7 @@ from deepface import DeepFace
 from deepface.api.src.modules.core import service
 from deepface.commons import image_utils
 from deepface.commons.logger import Logger
+from deepface.modules import modeling
 
 logger = Logger()
 
@@ -23,6 +24,15 @@ def home():
     return f"<h1>Welcome to DeepFace API v{DeepFace.__version__}!</h1>"
 
 
+@blueprint.route("/ready")
+def ready():
+    readiness = modeling.get_readiness()
+    # preloading runs in the background, models may not be registered yet
+    expected = current_app.config.get("DEEPFACE_PRELOAD_MODELS", [])
+    readiness["ready"] = readiness["ready"] and len(readiness["models"]) >= len(expected)
+    return readiness, 200 if readiness["ready"] else 503
+
+
 def extract_image_from_request(img_key: str) -> Union[str, np.ndarray]:
     """
     Extracts an image from the request either from json or a multipart/form-data file.
@@ -0,0 +1,86 @@
+# built-in dependencies
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# 3rd party dependencies
+import numpy as np
+import cv2
+
+
+def perceptual_hash(img: np.ndarray, hash_size: int = 16) -> bytes:
+    """
+    Difference hash (dHash) of a grayscale image.
+    Near-identical images (e.g. the same face in consecutive frames or a re-uploaded photo)
+    map to the same hash, while visibly different ones do not.
+    Args:
+        img (np.ndarray): grayscale image, e.g. the 48x48 emotion model input
+        hash_size (int): hash is hash_size x hash_size bits
+    Returns:
+        hash (bytes)
+    """
+    resized = cv2.resize(img, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    diff = resized[:, 1:] > resized[:, :-1]
+    return np.packbits(diff).tobytes()
+
+
+class LRUCache:
+    """
+    Thread-safe least recently used cache with an optional time to live.
+    Args:
+        max_size (int): maximum number of entries, 0 disables the cache
+        ttl (float): entry lifetime in seconds, 0 means entries never expire
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl > 0 and time.time() - entry[1] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,156 @@
+"""
+Analyze-only entry point with a fast import.
+
+`from deepface import fast` does not import tensorflow, pandas or any model module.
+They are loaded, and the one-off environment checks done by `deepface.DeepFace` at import time
+run, on the first call to `analyze`. Results are the same as `DeepFace.analyze`.
+"""
+
+# built-in dependencies
+import os
+import threading
+import warnings
+import logging
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    IO,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# this has to be set before importing tensorflow
+os.environ.setdefault("TF_USE_LEGACY_KERAS", "1")
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def initialize() -> None:
+    """
+    Run the dependency configuration that `deepface.DeepFace` does at import time:
+    validate tf-keras availability, quiet tensorflow logging and create the weights folder.
+    Called implicitly by `analyze`, call it explicitly to pay the cost at start-up instead.
+    """
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if _initialized:
+            return
+
+        # pylint: disable=import-outside-toplevel
+        import tensorflow as tf
+        from deepface.commons import package_utils, folder_utils
+
+        # users should install tf_keras package if they are using tf 2.16 or later versions
+        package_utils.validate_for_keras3()
+
+        warnings.filterwarnings("ignore")
+        os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+        if package_utils.get_tf_major_version() == 2:
+            tf.get_logger().setLevel(logging.ERROR)
+
+        # create required folders if necessary to store model weights
+        folder_utils.initialize_folder()
+        _initialized = True
+
+
+def analyze(
+    img_path: Union[str, "np.ndarray", IO[bytes], List[str], List["np.ndarray"], List[IO[bytes]]],
+    actions: Union[tuple, list] = ("emotion", "age", "gender", "race"),
+    enforce_detection: bool = True,
+    detector_backend: str = "opencv",
+    align: bool = True,
+    expand_percentage: int = 0,
+    silent: bool = False,
+    anti_spoofing: bool = False,
+    detection_size: Optional[int] = None,
+    find_eyes: bool = True,
+    eye_cache_key: Optional[Hashable] = None,
+) -> Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+    """
+    Analyze facial attributes such as age, gender, emotion, and race in the provided image.
+    Arguments and return value are identical to `deepface.DeepFace.analyze`.
+    """
+    initialize()
+
+    # pylint: disable=import-outside-toplevel
+    from deepface.modules import demography
+
+    return demography.analyze(
+        img_path=img_path,
+        actions=actions,
+        enforce_detection=enforce_detection,
+        detector_backend=detector_backend,
+        align=align,
+        expand_percentage=expand_percentage,
+        silent=silent,
+        anti_spoofing=anti_spoofing,
+        detection_size=detection_size,
+        find_eyes=find_eyes,
+        eye_cache_key=eye_cache_key,
+    )
+
+
+def preload(
+    models: Sequence[Union[str, Tuple[str, str]]] = ("Emotion", "opencv"),
+    warmup_batches: Sequence[int] = (1, 4, 16),
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build and warm up models before serving traffic, see `deepface.modules.modeling.preload`.
+    """
+    initialize()
+
+    # pylint: disable=import-outside-toplevel
+    from deepface.modules import modeling
+
+    return modeling.preload(models=models, warmup_batches=warmup_batches)
+
+
+def readiness() -> Dict[str, Any]:
+    """
+    Readiness of preloaded models, see `deepface.modules.modeling.get_readiness`.
+    """
+    # pylint: disable=import-outside-toplevel
+    from deepface.modules import modeling
+
+    return modeling.get_readiness()
+
+
+def configure_emotion_cache(max_size: int, ttl: float = 300) -> None:
+    """
+    Enable (max_size > 0) or disable the result cache of the Emotion model for this process,
+    see `deepface.models.demography.Emotion.EmotionClient.configure_cache`.
+    Near-identical faces, e.g. the same face in consecutive video frames, are served from it;
+    different faces with the same perceptual hash get each other's scores.
+    Builds the Emotion model if it is not built yet.
+    """
+    initialize()
+
+    # pylint: disable=import-outside-toplevel
+    from deepface.modules import modeling
+
+    model = modeling.build_model(task="facial_attribute", model_name="Emotion")
+    model.configure_cache(max_size=max_size, ttl=ttl)
+
+
+def emotion_cache_stats() -> Optional[Dict[str, Any]]:
+    """
+    Statistics of the emotion result cache (size, hits, misses, hit_rate),
+    see `deepface.commons.cache_utils.LRUCache.stats`.
+    None until the Emotion model is built. Does not build it.
+    """
+    # pylint: disable=import-outside-toplevel
+    from deepface.modules import modeling
+
+    model = getattr(modeling, "cached_models", {}).get("facial_attribute", {}).get("Emotion")
+    return None if model is None else model.cache.stats()
@@ -1,4 +1,5 @@
 # stdlib dependencies
+import os
 from typing import List, Union
 
 # 3rd party dependencies
@@ -7,7 +8,9 @@ import cv2
 
 # project dependencies
 from deepface.commons import package_utils, weight_utils
+from deepface.commons.cache_utils import LRUCache, perceptual_hash
 from deepface.models.Demography import Demography
+from deepface.models.demography.labels import EMOTION_LABELS
 from deepface.commons.logger import Logger
 
 # dependency configuration
@@ -28,7 +31,10 @@ else:
     )
 
 # Labels for the emotions that can be detected by the model.
-labels = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
+labels = EMOTION_LABELS
+
+# input shape of the model, (height, width, channels)
+INPUT_SHAPE = (48, 48, 1)
 
 logger = Logger()
 
@@ -36,6 +42,47 @@ logger = Logger()
 
 WEIGHTS_URL = "https://github.com/serengil/deepface_models/releases/download/v1.0/facial_expression_model_weights.h5"
 
+# result cache for near-identical faces, keyed by a perceptual hash of the 48x48 model input.
+# it is disabled by default because different faces sharing a hash get each other's scores,
+# set DEEPFACE_EMOTION_CACHE_SIZE > 0 before the model is built, or call
+# EmotionClient.configure_cache, to enable it for video streams
+CACHE_SIZE_ENV = "DEEPFACE_EMOTION_CACHE_SIZE"
+CACHE_TTL_ENV = "DEEPFACE_EMOTION_CACHE_TTL"
+CACHE_HASH_SIZE_ENV = "DEEPFACE_EMOTION_CACHE_HASH_SIZE"
+
+
+def preprocess_face(img: np.ndarray) -> np.ndarray:
+    """
+    Convert a face crop straight into the emotion model input in a single resize.
+    The face is letterboxed into 48x48 the same way preprocessing.resize_image does for 224x224,
+    without the round trip through the 224x224 float image.
+    Args:
+        img (np.ndarray): face crop in BGR (or grayscale), uint8 in [0, 255]
+    Returns:
+        img (np.ndarray): grayscale face as float32 (48, 48, 1) in [0, 1]
+    """
+    target_h, target_w, _ = INPUT_SHAPE
+    img_gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+
+    factor = min(target_h / img_gray.shape[0], target_w / img_gray.shape[1])
+    dsize = (
+        max(1, min(target_w, int(img_gray.shape[1] * factor))),
+        max(1, min(target_h, int(img_gray.shape[0] * factor))),
+    )
+    resized = cv2.resize(img_gray, dsize, interpolation=cv2.INTER_AREA)
+
+    # put the resized face in the middle of a black canvas
+    processed = np.zeros(INPUT_SHAPE, dtype=np.float32)
+    top = (target_h - dsize[1]) // 2
+    left = (target_w - dsize[0]) // 2
+    np.multiply(
+        resized,
+        np.float32(1 / 255),
+        out=processed[top : top + dsize[1], left : left + dsize[0], 0],
+        casting="unsafe",
+    )
+    return processed
+
 
 class EmotionClient(Demography):
     """
@@ -45,6 +92,20 @@ class EmotionClient(Demography):
     def __init__(self):
         self.model = load_model()
         self.model_name = "Emotion"
+        self.cache = LRUCache(
+            max_size=int(os.environ.get(CACHE_SIZE_ENV, "0")),
+            ttl=float(os.environ.get(CACHE_TTL_ENV, "300")),
+        )
+        self.cache_hash_size = int(os.environ.get(CACHE_HASH_SIZE_ENV, "16"))
+
+    def configure_cache(self, max_size: int, ttl: float = 300) -> None:
+        """
+        Replace the result cache, dropping its entries and statistics
+        Args:
+            max_size (int): maximum number of cached faces, 0 disables the cache
+            ttl (float): entry lifetime in seconds, 0 means entries never expire
+        """
+        self.cache = LRUCache(max_size=max_size, ttl=ttl)
 
     def _preprocess_image(self, img: np.ndarray) -> np.ndarray:
         """
@@ -64,7 +125,9 @@ class EmotionClient(Demography):
         Args:
             img: Single image as np.ndarray (224, 224, 3) or
                 List of images as List[np.ndarray] or
-                Batch of images as np.ndarray (n, 224, 224, 3)
+                Batch of images as np.ndarray (n, 224, 224, 3) or
+                Batch of already preprocessed faces as np.ndarray (n, 48, 48, 1),
+                    see preprocess_face
         Returns:
             np.ndarray (n, n_emotions)
             where n_emotions is the number of emotion categories
@@ -72,11 +135,33 @@ class EmotionClient(Demography):
         # Preprocessing input image or image list.
         imgs = self._preprocess_batch_or_single_input(img)
 
-        processed_imgs = np.expand_dims(np.array([self._preprocess_image(img) for img in imgs]), axis=-1)
-
-        # Prediction
-        predictions = self._predict_internal(processed_imgs)
-
+        if imgs.ndim == 4 and imgs.shape[1:] == INPUT_SHAPE:
+            # already preprocessed by preprocess_face
+            processed_imgs = imgs[:, :, :, 0]
+        else:
+            processed_imgs = np.array([self._preprocess_image(img) for img in imgs])
+
+        if not self.cache.enabled:
+            return self._predict_internal(np.expand_dims(processed_imgs, axis=-1))
+
+        # Serve near-identical faces from cache, predict the rest in one batch
+        keys = [perceptual_hash(processed, self.cache_hash_size) for processed in processed_imgs]
+        predictions = [self.cache.get(key) for key in keys]
+        missing = [idx for idx, prediction in enumerate(predictions) if prediction is None]
+
+        if missing:
+            missing_predictions = self._predict_internal(
+                np.expand_dims(processed_imgs[missing], axis=-1)
+            )
+            # single image prediction is 1-D, batch prediction is 2-D
+            missing_predictions = np.reshape(missing_predictions, (len(missing), -1))
+            for idx, prediction in zip(missing, missing_predictions):
+                self.cache.put(keys[idx], prediction)
+                predictions[idx] = prediction
+
+        predictions = np.stack(predictions)
+        if predictions.shape[0] == 1:
+            return predictions[0]
         return predictions
 
 
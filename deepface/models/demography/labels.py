@@ -0,0 +1,5 @@
+# Labels of the demography models, kept out of the model modules
+# so that they can be imported without tensorflow.
+
+# Labels for the emotions that can be detected by the model.
+EMOTION_LABELS = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
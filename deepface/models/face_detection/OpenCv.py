@@ -1,6 +1,8 @@
 # built-in dependencies
 import os
-from typing import Any, List
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 # 3rd party dependencies
 import cv2
@@ -9,6 +11,15 @@ import numpy as np
 # project dependencies
 from deepface.models.Detector import Detector, FacialAreaRegion
 
+# eye positions found for a facial area are reused for a matching facial area in the next frames
+# of the same stream. Reuse only happens for callers passing an eye_cache_key (e.g. a camera
+# or track id), so unrelated images never share eyes.
+# set DEEPFACE_EYE_CACHE_SIZE=0 to run the eye cascade for every face
+EYE_CACHE_SIZE = int(os.environ.get("DEEPFACE_EYE_CACHE_SIZE", "16"))
+EYE_CACHE_STREAMS = int(os.environ.get("DEEPFACE_EYE_CACHE_STREAMS", "64"))
+EYE_CACHE_IOU = float(os.environ.get("DEEPFACE_EYE_CACHE_IOU", "0.7"))
+EYE_CACHE_MAX_REUSE = int(os.environ.get("DEEPFACE_EYE_CACHE_MAX_REUSE", "5"))
+
 
 class OpenCvClient(Detector):
     """
@@ -17,6 +28,9 @@ class OpenCvClient(Detector):
 
     def __init__(self):
         self.model = self.build_model()
+        # eye_cache_key -> facial areas of that stream with their relative eyes
+        self._eye_cache: "OrderedDict[Hashable, List[Dict[str, Any]]]" = OrderedDict()
+        self._eye_cache_lock = threading.Lock()
 
     def build_model(self):
         """
@@ -29,13 +43,25 @@ class OpenCvClient(Detector):
         detector["eye_detector"] = self.__build_cascade("haarcascade_eye")
         return detector
 
-    def detect_faces(self, img: np.ndarray) -> List[FacialAreaRegion]:
+    def detect_faces(
+        self,
+        img: np.ndarray,
+        find_eyes: bool = True,
+        eye_cache_key: Optional[Hashable] = None,
+    ) -> List[FacialAreaRegion]:
         """
         Detect and align face with opencv
 
         Args:
             img (np.ndarray): pre-loaded image as numpy array
 
+            find_eyes (bool): run eye detection for each face. Set to False when eye
+                coordinates are not needed (default is True).
+
+            eye_cache_key (hashable): id of the stream the image belongs to, e.g. a camera id.
+                If set, eyes found in previous frames of the same stream are reused for
+                matching faces, see find_eyes_in_area (default is None, no reuse).
+
         Returns:
             results (List[FacialAreaRegion]): A list of FacialAreaRegion objects
         """
@@ -56,15 +82,13 @@ class OpenCvClient(Detector):
 
         if len(faces) > 0:
             for (x, y, w, h), confidence in zip(faces, scores):
-                detected_face = img[int(y) : int(y + h), int(x) : int(x + w)]
-                left_eye, right_eye = self.find_eyes(img=detected_face)
-
-                # eyes found in the detected face instead image itself
-                # detected face's coordinates should be added
-                if left_eye is not None:
-                    left_eye = (int(x + left_eye[0]), int(y + left_eye[1]))
-                if right_eye is not None:
-                    right_eye = (int(x + right_eye[0]), int(y + right_eye[1]))
+                left_eye, right_eye = None, None
+                if find_eyes is True:
+                    left_eye, right_eye = self.find_eyes_in_area(
+                        img=img,
+                        facial_area=(int(x), int(y), int(w), int(h)),
+                        cache_key=eye_cache_key,
+                    )
 
                 facial_area = FacialAreaRegion(
                     x=x,
@@ -136,6 +160,85 @@ class OpenCvClient(Detector):
             )
         return left_eye, right_eye
 
+    def find_eyes_in_area(
+        self,
+        img: np.ndarray,
+        facial_area: Tuple[int, int, int, int],
+        cache_key: Optional[Hashable] = None,
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """
+        Find the left and right eye coordinates of a facial area in the given image.
+        If cache_key is set, eyes of a facial area of the same stream overlapping the given one
+        by at least EYE_CACHE_IOU in a previous call are reused, relative to the facial area,
+        up to EYE_CACHE_MAX_REUSE times.
+        Args:
+            img (np.ndarray): whole image
+            facial_area (tuple): x, y, w, h of the face in the image
+            cache_key (hashable): id of the stream (e.g. camera or track) the image belongs to.
+                None disables the reuse (default is None).
+        Returns:
+            left and right eye (tuple) with respect to the whole image
+        """
+        x, y, w, h = facial_area
+        if w <= 0 or h <= 0:
+            return None, None
+
+        use_cache = cache_key is not None and EYE_CACHE_SIZE > 0 and EYE_CACHE_STREAMS > 0
+
+        entry = None
+        if use_cache:
+            with self._eye_cache_lock:
+                best_iou = EYE_CACHE_IOU
+                for candidate in self._eye_cache.get(cache_key, []):
+                    iou = _box_iou(candidate["facial_area"], facial_area)
+                    if iou >= best_iou:
+                        best_iou, entry = iou, candidate
+                if entry is not None and entry["reused"] < EYE_CACHE_MAX_REUSE:
+                    entry["reused"] += 1
+                    entry["facial_area"] = facial_area
+                else:
+                    entry = None
+
+        if entry is None:
+            left_eye, right_eye = self.find_eyes(img=img[y : y + h, x : x + w])
+            # keep eyes relative to the facial area so that they follow a moving face
+            entry = {
+                "facial_area": facial_area,
+                "left_eye": None if left_eye is None else (left_eye[0] / w, left_eye[1] / h),
+                "right_eye": None if right_eye is None else (right_eye[0] / w, right_eye[1] / h),
+                "reused": 0,
+            }
+            if use_cache:
+                with self._eye_cache_lock:
+                    # the new entry replaces the ones of the same face, oldest entries are dropped
+                    entries = [
+                        candidate
+                        for candidate in self._eye_cache.get(cache_key, [])
+                        if _box_iou(candidate["facial_area"], facial_area) < EYE_CACHE_IOU
+                    ]
+                    entries.append(entry)
+                    del entries[:-EYE_CACHE_SIZE]
+                    self._eye_cache[cache_key] = entries
+                    self._eye_cache.move_to_end(cache_key)
+                    # least recently seen streams are dropped
+                    while len(self._eye_cache) > EYE_CACHE_STREAMS:
+                        self._eye_cache.popitem(last=False)
+
+        # eyes found in the detected face instead image itself
+        # detected face's coordinates should be added
+        left_eye, right_eye = None, None
+        if entry["left_eye"] is not None:
+            left_eye = (
+                int(round(x + entry["left_eye"][0] * w)),
+                int(round(y + entry["left_eye"][1] * h)),
+            )
+        if entry["right_eye"] is not None:
+            right_eye = (
+                int(round(x + entry["right_eye"][0] * w)),
+                int(round(y + entry["right_eye"][1] * h)),
+            )
+        return left_eye, right_eye
+
     def __build_cascade(self, model_name="haarcascade") -> Any:
         """
         Build a opencv face&eye detector models
@@ -175,3 +278,16 @@ class OpenCvClient(Detector):
             installation_path (str)
         """
         return os.path.join(os.path.dirname(cv2.__file__), "data")
+
+
+def _box_iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """
+    Intersection over union of two x, y, w, h boxes
+    """
+    iw = min(a[0] + a[2], b[0] + b[2]) - max(a[0], b[0])
+    ih = min(a[1] + a[3], b[1] + b[3]) - max(a[1], b[1])
+    if iw <= 0 or ih <= 0:
+        return 0.0
+    inter = iw * ih
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
@@ -1,5 +1,5 @@
 # built-in dependencies
-from typing import Union
+from typing import List, Sequence, Tuple, Union
 
 # 3rd party dependencies
 import cv2
@@ -103,85 +103,60 @@ class Fasnet:
         Returns:
             result (tuple): a result tuple consisting of is_real and score
         """
+        return self.analyze_batch(img=img, facial_areas=[facial_area])[0]
+
+    def analyze_batch(
+        self, img: np.ndarray, facial_areas: Sequence[Union[list, tuple]]
+    ) -> List[Tuple[bool, float]]:
+        """
+        Analyze all faces of a given image spoofed or not with a single forward pass per model
+        Args:
+            img (np.ndarray): pre loaded image
+            facial_areas (list): facial rectangle area coordinates with x, y, w, h respectively
+        Returns:
+            results (list): a result tuple consisting of is_real and score for each facial area
+        """
         import torch
         import torch.nn.functional as F
 
-        x, y, w, h = facial_area
-        first_img = crop(img, (x, y, w, h), 2.7, 80, 80)
-        second_img = crop(img, (x, y, w, h), 4, 80, 80)
+        if len(facial_areas) == 0:
+            return []
 
-        test_transform = Compose(
-            [
-                ToTensor(),
-            ]
-        )
-
-        first_img = test_transform(first_img)
-        first_img = first_img.unsqueeze(0).to(self.device)
+        first_imgs = np.stack([crop(img, tuple(area), 2.7, 80, 80) for area in facial_areas])
+        second_imgs = np.stack([crop(img, tuple(area), 4, 80, 80) for area in facial_areas])
 
-        second_img = test_transform(second_img)
-        second_img = second_img.unsqueeze(0).to(self.device)
+        # (n, h, w, c) crops to (n, c, h, w) float tensors, pixels are not rescaled
+        first_batch = torch.from_numpy(
+            np.ascontiguousarray(first_imgs.transpose((0, 3, 1, 2)), dtype=np.float32)
+        ).to(self.device)
+        second_batch = torch.from_numpy(
+            np.ascontiguousarray(second_imgs.transpose((0, 3, 1, 2)), dtype=np.float32)
+        ).to(self.device)
 
         with torch.no_grad():
-            first_result = self.first_model.forward(first_img)
-            first_result = F.softmax(first_result).cpu().numpy()
+            first_result = self.first_model.forward(first_batch)
+            first_result = F.softmax(first_result, dim=1).cpu().numpy()
 
-            second_result = self.second_model.forward(second_img)
-            second_result = F.softmax(second_result).cpu().numpy()
+            second_result = self.second_model.forward(second_batch)
+            second_result = F.softmax(second_result, dim=1).cpu().numpy()
 
-        prediction = np.zeros((1, 3))
+        prediction = np.zeros((len(facial_areas), 3))
         prediction += first_result
         prediction += second_result
 
-        label = np.argmax(prediction)
-        is_real = True if label == 1 else False  # pylint: disable=simplifiable-if-expression
-        score = prediction[0][label] / 2
+        results = []
+        for face_prediction in prediction:
+            label = np.argmax(face_prediction)
+            is_real = True if label == 1 else False  # pylint: disable=simplifiable-if-expression
+            score = face_prediction[label] / 2
+            results.append((is_real, score))
 
-        return is_real, score
+        return results
 
 
 # subsdiary classes and functions
 
 
-def to_tensor(pic):
-    """Convert a ``numpy.ndarray`` to tensor.
-
-    See ``ToTensor`` for more details.
-
-    Args:
-        pic (PIL Image or numpy.ndarray): Image to be converted to tensor.
-
-    Returns:
-        Tensor: Converted image.
-    """
-    import torch
-
-    # handle numpy array
-    # IR image channel=1: modify by lzc --> 20190730
-    if pic.ndim == 2:
-        pic = pic.reshape((pic.shape[0], pic.shape[1], 1))
-
-    img = torch.from_numpy(pic.transpose((2, 0, 1)))
-    # backward compatibility
-    # return img.float().div(255)  modify by zkx
-    return img.float()
-
-
-class Compose:
-    def __init__(self, transforms):
-        self.transforms = transforms
-
-    def __call__(self, img):
-        for t in self.transforms:
-            img = t(img)
-        return img
-
-
-class ToTensor:
-    def __call__(self, pic):
-        return to_tensor(pic)
-
-
 def _get_new_box(src_w, src_h, bbox, scale):
     x = bbox[0]
     y = bbox[1]
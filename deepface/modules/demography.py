@@ -1,5 +1,6 @@
 # built-in dependencies
-from typing import Any, Dict, List, Union, IO
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Union, IO
 
 # 3rd party dependencies
 import numpy as np
@@ -7,7 +8,7 @@ from tqdm import tqdm
 
 # project dependencies
 from deepface.modules import modeling, detection, preprocessing
-from deepface.models.demography import Gender, Race, Emotion
+from deepface.models.demography import Emotion
 
 
 def analyze(
@@ -19,6 +20,9 @@ def analyze(
     expand_percentage: int = 0,
     silent: bool = False,
     anti_spoofing: bool = False,
+    detection_size: Optional[int] = None,
+    find_eyes: bool = True,
+    eye_cache_key: Optional[Hashable] = None,
 ) -> Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
     """
     Analyze facial attributes such as age, gender, emotion, and race in the provided image.
@@ -51,6 +55,18 @@ def analyze(
 
         anti_spoofing (boolean): Flag to enable anti spoofing (default is False).
 
+        detection_size (int): if set, the image is downscaled so that its longer side is at most
+            this many pixels before running the detector. Facial areas and landmarks are mapped
+            back and faces are cropped and aligned from the original image (default is None).
+
+        find_eyes (bool): Flag to find eye coordinates of faces. Set to False to skip the
+            eye detection when neither alignment nor the eye landmarks in "region" are
+            needed (default is True).
+
+        eye_cache_key (hashable): id of the stream the image(s) belong to, e.g. a camera id.
+            If set, eyes found by the opencv eye detector in previous frames of the same stream
+            are reused for matching faces. Leave it None for unrelated images (default is None).
+
     Returns:
         results (List[Dict[str, Any]]): A list of dictionaries, where each dictionary represents
            the analysis results for a detected face.
@@ -101,29 +117,6 @@ def analyze(
                - 'white': Confidence score for White ethnicity.
     """
 
-    # batch input
-    if (isinstance(img_path, np.ndarray) and img_path.ndim == 4 and img_path.shape[0] > 1) or (
-        isinstance(img_path, list)
-    ):
-        batch_resp_obj = []
-        # Execute analysis for each image in the batch.
-        for single_img in img_path:
-            # Call the analyze function for each image in the batch.
-            resp_obj = analyze(
-                img_path=single_img,
-                actions=actions,
-                enforce_detection=enforce_detection,
-                detector_backend=detector_backend,
-                align=align,
-                expand_percentage=expand_percentage,
-                silent=silent,
-                anti_spoofing=anti_spoofing,
-            )
-
-            # Append the response object to the batch response list.
-            batch_resp_obj.append(resp_obj)
-        return batch_resp_obj
-
     # if actions is passed as tuple with single item, interestingly it becomes str here
     if isinstance(actions, str):
         actions = (actions,)
@@ -142,95 +135,199 @@ def analyze(
                 "Valid actions are `emotion`, `age`, `gender`, `race`."
             )
     # ---------------------------------
-    resp_objects = []
-
-    img_objs = detection.extract_faces(
-        img_path=img_path,
-        detector_backend=detector_backend,
-        enforce_detection=enforce_detection,
-        grayscale=False,
-        align=align,
-        expand_percentage=expand_percentage,
-        anti_spoofing=anti_spoofing,
-    )
 
-    for img_obj in img_objs:
-        if anti_spoofing is True and img_obj.get("is_real", True) is False:
-            raise ValueError("Spoof detected in the given image.")
+    # batch input
+    is_batch = (
+        isinstance(img_path, np.ndarray) and img_path.ndim == 4 and img_path.shape[0] > 1
+    ) or isinstance(img_path, list)
+
+    images = img_path if is_batch else [img_path]
+
+    # detect faces of every image first, then analyze the faces of all images together
+    # so that each model runs a single forward pass for the whole batch
+    # emotion model gets grayscale 48x48 faces straight from the crops,
+    # the 224x224 float images are only built for age, gender and race models
+    needs_224 = any(action in ("age", "gender", "race") for action in actions)
+    batch_faces = []
+    emotion_images = []
+    batch_regions = []
+    batch_confidences = []
+    batch_indexes = []
+    for idx, single_img in enumerate(images):
+        img_objs = detection.extract_faces(
+            img_path=single_img,
+            detector_backend=detector_backend,
+            enforce_detection=enforce_detection,
+            grayscale=False,
+            color_face="bgr",
+            normalize_face=False,
+            align=align,
+            expand_percentage=expand_percentage,
+            anti_spoofing=anti_spoofing,
+            detection_size=detection_size,
+            find_eyes=find_eyes,
+            eye_cache_key=eye_cache_key,
+        )
+
+        for img_obj in img_objs:
+            if anti_spoofing is True and img_obj.get("is_real", True) is False:
+                raise ValueError("Spoof detected in the given image.")
+
+            img_content = img_obj["face"]
+            if img_content.shape[0] == 0 or img_content.shape[1] == 0:
+                continue
+
+            if "emotion" in actions:
+                emotion_images.append(Emotion.preprocess_face(img_content))
 
-        img_content = img_obj["face"]
-        img_region = img_obj["facial_area"]
-        img_confidence = img_obj["confidence"]
-        if img_content.shape[0] == 0 or img_content.shape[1] == 0:
-            continue
+            if needs_224:
+                batch_faces.append(img_content)
 
-        # rgb to bgr
-        img_content = img_content[:, :, ::-1]
+            batch_regions.append(img_obj["facial_area"])
+            batch_confidences.append(img_obj["confidence"])
+            batch_indexes.append(idx)
 
-        # resize input image
-        img_content = preprocessing.resize_image(img=img_content, target_size=(224, 224))
+    resp_objs_dict = defaultdict(list)
 
-        obj = {}
-        # facial attribute analysis
-        pbar = tqdm(
-            range(0, len(actions)),
-            desc="Finding actions",
-            disable=silent if len(actions) > 1 else True,
+    if len(batch_regions) > 0:
+        batch_images = None
+        if batch_faces:
+            # resize input images into a single reusable buffer
+            batch_images = preprocessing.arena.get(
+                batch_size=len(batch_faces), height=224, width=224
+            )
+            for slot, img_content in zip(batch_images, batch_faces):
+                preprocessing.resize_image_into(img=img_content, out=slot)
+
+        attribute_objs = analyze_faces(
+            batch_images=batch_images,
+            actions=actions,
+            silent=silent,
+            emotion_images=np.stack(emotion_images, axis=0) if emotion_images else None,
         )
-        for index in pbar:
-            action = actions[index]
-            pbar.set_description(f"Action: {action}")
 
-            if action == "emotion":
-                emotion_predictions = modeling.build_model(
-                    task="facial_attribute", model_name="Emotion"
-                ).predict(img_content)
-                sum_of_predictions = emotion_predictions.sum()
+        for obj, img_region, img_confidence, batch_index in zip(
+            attribute_objs, batch_regions, batch_confidences, batch_indexes
+        ):
+            # mention facial areas
+            obj["region"] = img_region
+            # include image confidence
+            obj["face_confidence"] = img_confidence
+
+            resp_objs_dict[batch_index].append(obj)
+
+    resp_objects = [resp_objs_dict[idx] for idx in range(len(images))]
+
+    return resp_objects if is_batch else resp_objects[0]
+
+
+def analyze_faces(
+    batch_images: Optional[np.ndarray],
+    actions: List[str],
+    silent: bool = False,
+    emotion_images: Optional[np.ndarray] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Analyze facial attributes of already extracted and resized faces in a single
+        forward pass per action.
+
+    Args:
+        batch_images (np.ndarray): faces as 4-D array (n, 224, 224, 3) in BGR format
+            normalized in scale of [0, 1].
+
+        actions (list): attributes to analyze. Options: emotion, age, gender, race.
+
+        silent (boolean): Suppress or allow some log messages for a quieter analysis process
+            (default is False).
+
+        emotion_images (np.ndarray): optional faces preprocessed for the emotion model as
+            4-D array (n, 48, 48, 1), see Emotion.preprocess_face. If given, the emotion
+            model uses these instead of batch_images, and batch_images may be None
+            when only emotion is requested.
+
+    Returns:
+        results (List[Dict[str, Any]]): A list of dictionaries with the requested attributes
+            for each face in the same order as the given batch.
+    """
+    if batch_images is None and emotion_images is None:
+        raise ValueError("Either batch_images or emotion_images must be given.")
+
+    num_faces = (batch_images if batch_images is not None else emotion_images).shape[0]
+
+    resp_objects: List[Dict[str, Any]] = [{} for _ in range(num_faces)]
+
+    # facial attribute analysis
+    pbar = tqdm(
+        range(0, len(actions)),
+        desc="Finding actions",
+        disable=silent if len(actions) > 1 else True,
+    )
+    for index in pbar:
+        action = actions[index]
+        pbar.set_description(f"Action: {action}")
+
+        if action == "emotion":
+            emotion_predictions = modeling.build_model(
+                task="facial_attribute", model_name="Emotion"
+            ).predict(emotion_images if emotion_images is not None else batch_images)
+            # single image predictions come as 1-D array, batched ones as 2-D
+            emotion_predictions = np.reshape(emotion_predictions, (num_faces, -1))
+
+            for obj, predictions in zip(resp_objects, emotion_predictions):
+                sum_of_predictions = predictions.sum()
 
                 obj["emotion"] = {}
                 for i, emotion_label in enumerate(Emotion.labels):
-                    emotion_prediction = 100 * emotion_predictions[i] / sum_of_predictions
+                    emotion_prediction = 100 * predictions[i] / sum_of_predictions
                     obj["emotion"][emotion_label] = emotion_prediction
 
-                obj["dominant_emotion"] = Emotion.labels[np.argmax(emotion_predictions)]
+                obj["dominant_emotion"] = Emotion.labels[np.argmax(predictions)]
 
-            elif action == "age":
-                apparent_age = modeling.build_model(
-                    task="facial_attribute", model_name="Age"
-                ).predict(img_content)
+        elif action == "age":
+            apparent_ages = modeling.build_model(
+                task="facial_attribute", model_name="Age"
+            ).predict(batch_images)
+            apparent_ages = np.reshape(apparent_ages, (num_faces,))
+
+            for obj, apparent_age in zip(resp_objects, apparent_ages):
                 # int cast is for exception - object of type 'float32' is not JSON serializable
                 obj["age"] = int(apparent_age)
 
-            elif action == "gender":
-                gender_predictions = modeling.build_model(
-                    task="facial_attribute", model_name="Gender"
-                ).predict(img_content)
+        elif action == "gender":
+            # imported lazily, Gender and Race modules pull in the VGG-Face graph
+            # pylint: disable=import-outside-toplevel
+            from deepface.models.demography import Gender
+
+            gender_predictions = modeling.build_model(
+                task="facial_attribute", model_name="Gender"
+            ).predict(batch_images)
+            gender_predictions = np.reshape(gender_predictions, (num_faces, -1))
+
+            for obj, predictions in zip(resp_objects, gender_predictions):
                 obj["gender"] = {}
                 for i, gender_label in enumerate(Gender.labels):
-                    gender_prediction = 100 * gender_predictions[i]
+                    gender_prediction = 100 * predictions[i]
                     obj["gender"][gender_label] = gender_prediction
 
-                obj["dominant_gender"] = Gender.labels[np.argmax(gender_predictions)]
+                obj["dominant_gender"] = Gender.labels[np.argmax(predictions)]
+
+        elif action == "race":
+            # pylint: disable=import-outside-toplevel
+            from deepface.models.demography import Race
+
+            race_predictions = modeling.build_model(
+                task="facial_attribute", model_name="Race"
+            ).predict(batch_images)
+            race_predictions = np.reshape(race_predictions, (num_faces, -1))
 
-            elif action == "race":
-                race_predictions = modeling.build_model(
-                    task="facial_attribute", model_name="Race"
-                ).predict(img_content)
-                sum_of_predictions = race_predictions.sum()
+            for obj, predictions in zip(resp_objects, race_predictions):
+                sum_of_predictions = predictions.sum()
 
                 obj["race"] = {}
                 for i, race_label in enumerate(Race.labels):
-                    race_prediction = 100 * race_predictions[i] / sum_of_predictions
+                    race_prediction = 100 * predictions[i] / sum_of_predictions
                     obj["race"][race_label] = race_prediction
 
-                obj["dominant_race"] = Race.labels[np.argmax(race_predictions)]
-
-            # -----------------------------
-            # mention facial areas
-            obj["region"] = img_region
-            # include image confidence
-            obj["face_confidence"] = img_confidence
-
-        resp_objects.append(obj)
+                obj["dominant_race"] = Race.labels[np.argmax(predictions)]
 
     return resp_objects
@@ -1,5 +1,5 @@
 # built-in dependencies
-from typing import Any, Dict, IO, List, Tuple, Union, Optional
+from typing import Any, Dict, Hashable, IO, List, Tuple, Union, Optional
 from heapq import nlargest
 
 # 3rd part dependencies
@@ -49,6 +49,9 @@ def extract_faces(
     normalize_face: bool = True,
     anti_spoofing: bool = False,
     max_faces: Optional[int] = None,
+    detection_size: Optional[int] = None,
+    find_eyes: bool = True,
+    eye_cache_key: Optional[Hashable] = None,
 ) -> List[Dict[str, Any]]:
     """
     Extract faces from a given image
@@ -81,6 +84,18 @@ def extract_faces(
 
         anti_spoofing (boolean): Flag to enable anti spoofing (default is False).
 
+        detection_size (int): if set, the image is downscaled so that its longer side is at most
+            this many pixels before running the detector. Facial areas and landmarks are mapped
+            back and faces are cropped and aligned from the original image (default is None).
+
+        find_eyes (bool): Flag to find eye coordinates of faces. Set to False to skip the
+            eye detection when neither alignment nor the left_eye / right_eye landmarks are
+            needed. Detectors returning landmarks themselves are not affected (default is True).
+
+        eye_cache_key (hashable): id of the stream the image belongs to, e.g. a camera id.
+            If set, eyes found by the opencv eye detector in previous frames of the same stream
+            are reused for matching faces. Leave it None for unrelated images (default is None).
+
     Returns:
         results (List[Dict[str, Any]]): A list of dictionaries, where each dictionary contains:
 
@@ -122,6 +137,9 @@ def extract_faces(
             align=align,
             expand_percentage=expand_percentage,
             max_faces=max_faces,
+            detection_size=detection_size,
+            find_eyes=find_eyes,
+            eye_cache_key=eye_cache_key,
         )
 
     # in case of no face found
@@ -206,14 +224,27 @@ def extract_faces(
             "confidence": round(float(current_region.confidence or 0), 2),
         }
 
-        if anti_spoofing is True:
-            antispoof_model = modeling.build_model(task="spoofing", model_name="Fasnet")
-            is_real, antispoof_score = antispoof_model.analyze(img=img, facial_area=(x, y, w, h))
+        resp_objs.append(resp_obj)
+
+    if anti_spoofing is True and len(resp_objs) > 0:
+        # all faces are checked in a single batch
+        antispoof_model = modeling.build_model(task="spoofing", model_name="Fasnet")
+        antispoof_results = antispoof_model.analyze_batch(
+            img=img,
+            facial_areas=[
+                (
+                    resp_obj["facial_area"]["x"],
+                    resp_obj["facial_area"]["y"],
+                    resp_obj["facial_area"]["w"],
+                    resp_obj["facial_area"]["h"],
+                )
+                for resp_obj in resp_objs
+            ],
+        )
+        for resp_obj, (is_real, antispoof_score) in zip(resp_objs, antispoof_results):
             resp_obj["is_real"] = is_real
             resp_obj["antispoof_score"] = antispoof_score
 
-        resp_objs.append(resp_obj)
-
     if len(resp_objs) == 0 and enforce_detection == True:
         raise ValueError(
             f"Exception while extracting faces from {img_name}."
@@ -229,6 +260,9 @@ def detect_faces(
     align: bool = True,
     expand_percentage: int = 0,
     max_faces: Optional[int] = None,
+    detection_size: Optional[int] = None,
+    find_eyes: bool = True,
+    eye_cache_key: Optional[Hashable] = None,
 ) -> List[DetectedFace]:
     """
     Detect face(s) from a given image
@@ -241,6 +275,20 @@ def detect_faces(
 
         expand_percentage (int): expand detected facial area with a percentage (default is 0).
 
+        max_faces (int): keep only the given number of largest faces (default is None).
+
+        detection_size (int): if set, the image is downscaled so that its longer side is at most
+            this many pixels before running the detector. Facial areas and landmarks are mapped
+            back and faces are cropped and aligned from the original image (default is None).
+
+        find_eyes (bool): Flag to find eye coordinates of faces. Set to False to skip the
+            eye detection when neither alignment nor the left_eye / right_eye landmarks are
+            needed. Detectors returning landmarks themselves are not affected (default is True).
+
+        eye_cache_key (hashable): id of the stream the image belongs to, e.g. a camera id.
+            If set, eyes found by the opencv eye detector in previous frames of the same stream
+            are reused for matching faces. Leave it None for unrelated images (default is None).
+
     Returns:
         results (List[DetectedFace]): A list of DetectedFace objects
             where each object contains:
@@ -253,7 +301,6 @@ def detect_faces(
 
         - confidence (float): The confidence score associated with the detected face.
     """
-    height, width, _ = img.shape
     face_detector: Detector = modeling.build_model(
         task="face_detector", model_name=detector_backend
     )
@@ -266,23 +313,35 @@ def detect_faces(
         )
         expand_percentage = 0
 
-    # If faces are close to the upper boundary, alignment move them outside
-    # Add a black border around an image to avoid this.
-    height_border = int(0.5 * height)
-    width_border = int(0.5 * width)
-    if align is True:
-        img = cv2.copyMakeBorder(
+    # find facial areas of given image
+    # no black border is added for alignment anymore, extract_face aligns a per-face sub image
+    # which extract_sub_image pads with black pixels if the face is close to the boundary
+    height, width = img.shape[:2]
+    scale = 1.0
+    if detection_size is not None and max(height, width) > detection_size:
+        # detection cost grows with the pixel count, so detect on a smaller copy
+        scale = detection_size / max(height, width)
+        detection_img = cv2.resize(
             img,
-            height_border,
-            height_border,
-            width_border,
-            width_border,
-            cv2.BORDER_CONSTANT,
-            value=[0, 0, 0],  # Color of the border (black)
+            (max(1, int(width * scale)), max(1, int(height * scale))),
+            interpolation=cv2.INTER_AREA,
         )
+    else:
+        detection_img = img
 
-    # find facial areas of given image
-    facial_areas = face_detector.detect_faces(img)
+    if detector_backend == "opencv":
+        facial_areas = face_detector.detect_faces(
+            detection_img, find_eyes=find_eyes, eye_cache_key=eye_cache_key
+        )
+    else:
+        facial_areas = face_detector.detect_faces(detection_img)
+
+    if scale != 1.0:
+        # crop and align from the original image to keep full quality
+        facial_areas = [
+            rescale_facial_area(facial_area=facial_area, factor=1 / scale)
+            for facial_area in facial_areas
+        ]
 
     if max_faces is not None and max_faces < len(facial_areas):
         facial_areas = nlargest(
@@ -295,22 +354,51 @@ def detect_faces(
             img=img,
             align=align,
             expand_percentage=expand_percentage,
-            width_border=width_border,
-            height_border=height_border,
             detector_backend=detector_backend,
+            find_eyes=find_eyes,
+            eye_cache_key=eye_cache_key,
         )
         for facial_area in facial_areas
     ]
 
 
+def rescale_facial_area(facial_area: FacialAreaRegion, factor: float) -> FacialAreaRegion:
+    """
+    Scale a facial area and its landmarks, e.g. to map detections on a resized image back
+    Args:
+        facial_area (FacialAreaRegion): detected facial area
+        factor (float): multiplier applied to all coordinates
+    Returns:
+        facial_area (FacialAreaRegion): scaled facial area
+    """
+
+    def scale_point(point: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        if point is None:
+            return None
+        return (int(round(point[0] * factor)), int(round(point[1] * factor)))
+
+    return FacialAreaRegion(
+        x=int(round(facial_area.x * factor)),
+        y=int(round(facial_area.y * factor)),
+        w=int(round(facial_area.w * factor)),
+        h=int(round(facial_area.h * factor)),
+        left_eye=scale_point(facial_area.left_eye),
+        right_eye=scale_point(facial_area.right_eye),
+        confidence=facial_area.confidence,
+        nose=scale_point(facial_area.nose),
+        mouth_right=scale_point(facial_area.mouth_right),
+        mouth_left=scale_point(facial_area.mouth_left),
+    )
+
+
 def extract_face(
     facial_area: FacialAreaRegion,
     img: np.ndarray,
     align: bool,
     expand_percentage: int,
-    width_border: int,
-    height_border: int,
     detector_backend: str,
+    find_eyes: bool = True,
+    eye_cache_key: Optional[Hashable] = None,
 ) -> DetectedFace:
     x = facial_area.x
     y = facial_area.y
@@ -338,18 +426,24 @@ def extract_face(
     detected_face = img[int(y) : int(y + h), int(x) : int(x + w)]
 
     # use opencv if eyes aren't provided by the detector (e.g. ssd, yolo)
-    if detector_backend != "opencv" and (left_eye is None or right_eye is None):
+    if (
+        find_eyes is True
+        and detector_backend != "opencv"
+        and (left_eye is None or right_eye is None)
+    ):
         default_detector: OpenCv.OpenCvClient = modeling.build_model(
             task="face_detector", model_name="opencv"
         )
-        left_eye_new, right_eye_new = default_detector.find_eyes(detected_face)
+        left_eye_new, right_eye_new = default_detector.find_eyes_in_area(
+            img=img, facial_area=(int(x), int(y), int(w), int(h)), cache_key=eye_cache_key
+        )
         if left_eye is None and left_eye_new is not None:
-            left_eye = (int(left_eye_new[0]) + x, int(left_eye_new[1]) + y)
+            left_eye = left_eye_new
             logger.debug(
                 f"left eye wasn't detected by {detector_backend}, overwritten by cv2 - {left_eye}"
             )
         if right_eye is None and right_eye_new is not None:
-            right_eye = (int(right_eye_new[0]) + x, int(right_eye_new[1]) + y)
+            right_eye = right_eye_new
             logger.debug(
                 f"right eye wasn't detected by {detector_backend}, overwritten by cv2 - {right_eye}"
             )
@@ -382,21 +476,6 @@ def extract_face(
         # do not spend memory for these temporary variables anymore
         del aligned_sub_img, sub_img
 
-        # restore x, y, le and re before border added
-        x = x - width_border
-        y = y - height_border
-        # w and h will not change
-        if left_eye is not None:
-            left_eye = (left_eye[0] - width_border, left_eye[1] - height_border)
-        if right_eye is not None:
-            right_eye = (right_eye[0] - width_border, right_eye[1] - height_border)
-        if nose is not None:
-            nose = (nose[0] - width_border, nose[1] - height_border)
-        if mouth_left is not None:
-            mouth_left = (mouth_left[0] - width_border, mouth_left[1] - height_border)
-        if mouth_right is not None:
-            mouth_right = (mouth_right[0] - width_border, mouth_right[1] - height_border)
-
     return DetectedFace(
         img=detected_face,
         facial_area=FacialAreaRegion(
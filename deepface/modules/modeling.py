@@ -1,97 +1,107 @@
 from __future__ import annotations
 
 # built-in dependencies
-from typing import TYPE_CHECKING, Any, Final, TypedDict
+import importlib
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Final, Optional, Sequence, Tuple, TypedDict, Union
 
 # project dependencies
-from deepface.models.facial_recognition import (
-    VGGFace,
-    OpenFace,
-    FbDeepFace,
-    DeepID,
-    ArcFace,
-    SFace,
-    Dlib,
-    Facenet,
-    GhostFaceNet,
-    Buffalo_L,
-)
-from deepface.models.face_detection import (
-    FastMtCnn,
-    MediaPipe,
-    MtCnn,
-    OpenCv,
-    Dlib as DlibDetector,
-    RetinaFace,
-    Ssd,
-    Yolo as YoloFaceDetector,
-    YuNet,
-    CenterFace,
-)
-from deepface.models.demography import Age, Gender, Race, Emotion
-from deepface.models.spoofing import FasNet
+from deepface.commons.logger import Logger
 
 if TYPE_CHECKING:
     from deepface.models.Demography import Demography
     from deepface.models.Detector import Detector
     from deepface.models.FacialRecognition import FacialRecognition
+    from deepface.models.spoofing.FasNet import Fasnet
+
+# model classes are registered by dotted path and imported on first build_model call,
+# so that importing this module does not pull in every recognition / detection graph
+_RECOGNITION = "deepface.models.facial_recognition"
+_DETECTION = "deepface.models.face_detection"
+_DEMOGRAPHY = "deepface.models.demography"
+_SPOOFING = "deepface.models.spoofing"
+
+logger = Logger()
 
 
 class AvailableModels(TypedDict):
-    facial_recognition: dict[str, type[FacialRecognition]]
-    spoofing: dict[str, type[FasNet.Fasnet]]
-    facial_attribute: dict[str, type[Demography]]
-    face_detector: dict[str, type[Detector]]
+    facial_recognition: dict[str, str]
+    spoofing: dict[str, str]
+    facial_attribute: dict[str, str]
+    face_detector: dict[str, str]
 
 
 AVAILABLE_MODELS: Final[AvailableModels] = {
     "facial_recognition": {
-        "VGG-Face": VGGFace.VggFaceClient,
-        "OpenFace": OpenFace.OpenFaceClient,
-        "Facenet": Facenet.FaceNet128dClient,
-        "Facenet512": Facenet.FaceNet512dClient,
-        "DeepFace": FbDeepFace.DeepFaceClient,
-        "DeepID": DeepID.DeepIdClient,
-        "Dlib": Dlib.DlibClient,
-        "ArcFace": ArcFace.ArcFaceClient,
-        "SFace": SFace.SFaceClient,
-        "GhostFaceNet": GhostFaceNet.GhostFaceNetClient,
-        "Buffalo_L": Buffalo_L.Buffalo_L,
+        "VGG-Face": f"{_RECOGNITION}.VGGFace.VggFaceClient",
+        "OpenFace": f"{_RECOGNITION}.OpenFace.OpenFaceClient",
+        "Facenet": f"{_RECOGNITION}.Facenet.FaceNet128dClient",
+        "Facenet512": f"{_RECOGNITION}.Facenet.FaceNet512dClient",
+        "DeepFace": f"{_RECOGNITION}.FbDeepFace.DeepFaceClient",
+        "DeepID": f"{_RECOGNITION}.DeepID.DeepIdClient",
+        "Dlib": f"{_RECOGNITION}.Dlib.DlibClient",
+        "ArcFace": f"{_RECOGNITION}.ArcFace.ArcFaceClient",
+        "SFace": f"{_RECOGNITION}.SFace.SFaceClient",
+        "GhostFaceNet": f"{_RECOGNITION}.GhostFaceNet.GhostFaceNetClient",
+        "Buffalo_L": f"{_RECOGNITION}.Buffalo_L.Buffalo_L",
     },
     "spoofing": {
-        "Fasnet": FasNet.Fasnet,
+        "Fasnet": f"{_SPOOFING}.FasNet.Fasnet",
     },
     "facial_attribute": {
-        "Emotion": Emotion.EmotionClient,
-        "Age": Age.ApparentAgeClient,
-        "Gender": Gender.GenderClient,
-        "Race": Race.RaceClient,
+        "Emotion": f"{_DEMOGRAPHY}.Emotion.EmotionClient",
+        "Age": f"{_DEMOGRAPHY}.Age.ApparentAgeClient",
+        "Gender": f"{_DEMOGRAPHY}.Gender.GenderClient",
+        "Race": f"{_DEMOGRAPHY}.Race.RaceClient",
     },
     "face_detector": {
-        "opencv": OpenCv.OpenCvClient,
-        "mtcnn": MtCnn.MtCnnClient,
-        "ssd": Ssd.SsdClient,
-        "dlib": DlibDetector.DlibClient,
-        "retinaface": RetinaFace.RetinaFaceClient,
-        "mediapipe": MediaPipe.MediaPipeClient,
-        "yolov8n": YoloFaceDetector.YoloDetectorClientV8n,
-        "yolov8m": YoloFaceDetector.YoloDetectorClientV8m,
-        "yolov8l": YoloFaceDetector.YoloDetectorClientV8l,
-        "yolov11n": YoloFaceDetector.YoloDetectorClientV11n,
-        "yolov11s": YoloFaceDetector.YoloDetectorClientV11s,
-        "yolov11m": YoloFaceDetector.YoloDetectorClientV11m,
-        "yolov11l": YoloFaceDetector.YoloDetectorClientV11l,
-        "yolov12n": YoloFaceDetector.YoloDetectorClientV12n,
-        "yolov12s": YoloFaceDetector.YoloDetectorClientV12s,
-        "yolov12m": YoloFaceDetector.YoloDetectorClientV12m,
-        "yolov12l": YoloFaceDetector.YoloDetectorClientV12l,
-        "yunet": YuNet.YuNetClient,
-        "fastmtcnn": FastMtCnn.FastMtCnnClient,
-        "centerface": CenterFace.CenterFaceClient,
+        "opencv": f"{_DETECTION}.OpenCv.OpenCvClient",
+        "mtcnn": f"{_DETECTION}.MtCnn.MtCnnClient",
+        "ssd": f"{_DETECTION}.Ssd.SsdClient",
+        "dlib": f"{_DETECTION}.Dlib.DlibClient",
+        "retinaface": f"{_DETECTION}.RetinaFace.RetinaFaceClient",
+        "mediapipe": f"{_DETECTION}.MediaPipe.MediaPipeClient",
+        "yolov8n": f"{_DETECTION}.Yolo.YoloDetectorClientV8n",
+        "yolov8m": f"{_DETECTION}.Yolo.YoloDetectorClientV8m",
+        "yolov8l": f"{_DETECTION}.Yolo.YoloDetectorClientV8l",
+        "yolov11n": f"{_DETECTION}.Yolo.YoloDetectorClientV11n",
+        "yolov11s": f"{_DETECTION}.Yolo.YoloDetectorClientV11s",
+        "yolov11m": f"{_DETECTION}.Yolo.YoloDetectorClientV11m",
+        "yolov11l": f"{_DETECTION}.Yolo.YoloDetectorClientV11l",
+        "yolov12n": f"{_DETECTION}.Yolo.YoloDetectorClientV12n",
+        "yolov12s": f"{_DETECTION}.Yolo.YoloDetectorClientV12s",
+        "yolov12m": f"{_DETECTION}.Yolo.YoloDetectorClientV12m",
+        "yolov12l": f"{_DETECTION}.Yolo.YoloDetectorClientV12l",
+        "yunet": f"{_DETECTION}.YuNet.YuNetClient",
+        "fastmtcnn": f"{_DETECTION}.FastMtCnn.FastMtCnnClient",
+        "centerface": f"{_DETECTION}.CenterFace.CenterFaceClient",
     },
 }
 
 
+def resolve_model_class(
+    task: str, model_name: str
+) -> type[FacialRecognition] | type[Demography] | type[Detector] | type[Fasnet]:
+    """
+    Import the module of a registered model and return its class
+    Parameters:
+        task (str): facial_recognition, facial_attribute, face_detector, spoofing
+        model_name (str): model identifier
+    Returns:
+        model class
+    """
+    if task not in AVAILABLE_MODELS.keys():
+        raise ValueError(f"unimplemented task - {task}")
+
+    dotted_path = AVAILABLE_MODELS[task].get(model_name)
+    if dotted_path is None:
+        raise ValueError(f"Invalid model_name passed - {task}/{model_name}")
+
+    module_path, class_name = dotted_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 def build_model(task: str, model_name: str) -> Any:
     """
     This function loads a pre-trained models as singletonish way
@@ -115,13 +125,157 @@ def build_model(task: str, model_name: str) -> Any:
         raise ValueError(f"unimplemented task - {task}")
 
     if "cached_models" not in globals():
-        cached_models = {current_task: {} for current_task in AVAILABLE_MODELS.keys()}
+        with _build_locks_lock:
+            if "cached_models" not in globals():
+                cached_models = {current_task: {} for current_task in AVAILABLE_MODELS.keys()}
+
+    model = cached_models[task].get(model_name)
+    if model is None:
+        # concurrent callers (e.g. preload thread and a request) must not build
+        # the same model twice and race on downloading its weights
+        with _build_lock(task, model_name):
+            model = cached_models[task].get(model_name)
+            if model is None:
+                model = resolve_model_class(task, model_name)()
+                cached_models[task][model_name] = model
+                _mark_built(f"{task}/{model_name}")
+
+    return model
+
+
+# one lock per (task, model_name) so that building different models is not serialized
+_build_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_build_locks_lock = threading.Lock()
+
+# readiness of preloaded models, keyed by "task/model_name"
+_readiness: Dict[str, Dict[str, Any]] = {}
+_readiness_lock = threading.Lock()
+
+
+def _build_lock(task: str, model_name: str) -> threading.Lock:
+    with _build_locks_lock:
+        return _build_locks.setdefault((task, model_name), threading.Lock())
+
+
+def _mark_built(key: str) -> None:
+    # a model whose preload failed becomes ready once a later build succeeds,
+    # pending entries are marked ready by preload itself after warming up
+    with _readiness_lock:
+        entry = _readiness.get(key)
+        if entry is not None and not entry["ready"] and entry["error"] is not None:
+            entry.update(ready=True, error=None)
+
 
-    if cached_models[task].get(model_name) is None:
-        model = AVAILABLE_MODELS[task].get(model_name)
-        if model:
-            cached_models[task][model_name] = model()
-        else:
+def find_task(model_name: str) -> str:
+    """
+    Find the task of a registered model
+    Parameters:
+        model_name (str): model identifier, e.g. Emotion or opencv
+    Returns:
+        task (str)
+    """
+    for task, models in AVAILABLE_MODELS.items():
+        if model_name in models:
+            return task
+    raise ValueError(f"Invalid model_name passed - {model_name}")
+
+
+def preload(
+    models: Sequence[Union[str, Tuple[str, str]]],
+    warmup_batches: Sequence[int] = (1, 4, 16),
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build models ahead of the first request and run them once per batch size
+    so that weight loading and graph tracing are not paid by live traffic.
+    Parameters:
+        models (list): model names (e.g. "Emotion", "opencv") or (task, model_name) tuples
+        warmup_batches (list): batch sizes traced for recognition and facial attribute models.
+            Detectors and spoofing models are warmed up with a single blank image.
+    Returns:
+        readiness (dict): per model readiness, see get_readiness
+    """
+    targets = []
+    for item in models:
+        task, model_name = item if isinstance(item, (tuple, list)) else (find_task(item), item)
+        if model_name not in AVAILABLE_MODELS.get(task, {}):
             raise ValueError(f"Invalid model_name passed - {task}/{model_name}")
+        targets.append((task, model_name))
+
+    # register everything as pending first so that readiness is reported as not ready
+    with _readiness_lock:
+        for task, model_name in targets:
+            _readiness[f"{task}/{model_name}"] = {
+                "task": task,
+                "model_name": model_name,
+                "ready": False,
+                "build_seconds": None,
+                "warmup_seconds": {},
+                "error": None,
+            }
+
+    for task, model_name in targets:
+        key = f"{task}/{model_name}"
+        tic = time.time()
+        try:
+            model = build_model(task=task, model_name=model_name)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.error(f"preloading {key} failed - {err}")
+            _update_readiness(key, error=str(err))
+            continue
+        _update_readiness(key, build_seconds=round(time.time() - tic, 4))
+
+        warmup_seconds: Dict[str, float] = {}
+        error: Optional[str] = None
+        batch_sizes = warmup_batches if task in ("facial_recognition", "facial_attribute") else [1]
+        for batch_size in batch_sizes:
+            tic = time.time()
+            try:
+                _warmup(task, model, batch_size)
+            except Exception as err:  # pylint: disable=broad-except
+                # model itself is built, first real request just pays the tracing cost
+                logger.warn(f"warming up {key} with batch size {batch_size} failed - {err}")
+                error = str(err)
+                break
+            warmup_seconds[str(batch_size)] = round(time.time() - tic, 4)
+
+        _update_readiness(key, ready=True, warmup_seconds=warmup_seconds, error=error)
+        logger.debug(f"{key} is ready - {_readiness[key]}")
+
+    return get_readiness()["models"]
+
+
+def get_readiness() -> Dict[str, Any]:
+    """
+    Readiness of the models registered with preload
+    Returns:
+        readiness (dict): "ready" is True once every preloaded model is built and warmed up,
+            "models" holds per model ready flag, build_seconds, warmup_seconds and error
+    """
+    with _readiness_lock:
+        models = {
+            key: dict(value, warmup_seconds=dict(value["warmup_seconds"]))
+            for key, value in _readiness.items()
+        }
+    return {"ready": all(value["ready"] for value in models.values()), "models": models}
+
+
+def _update_readiness(key: str, **kwargs: Any) -> None:
+    with _readiness_lock:
+        _readiness[key].update(kwargs)
+
+
+def _warmup(task: str, model: Any, batch_size: int) -> None:
+    # pylint: disable=import-outside-toplevel, protected-access
+    import numpy as np
 
-    return cached_models[task][model_name]
+    if task == "facial_attribute":
+        # _predict_internal is called directly so that result caches are not filled with zeros
+        input_shape = tuple(model.model.input_shape[1:])
+        model._predict_internal(np.zeros((batch_size,) + input_shape, dtype=np.float32))
+    elif task == "facial_recognition":
+        width, height = model.input_shape
+        model.forward(np.zeros((batch_size, height, width, 3), dtype=np.float32))
+    elif task == "face_detector":
+        model.detect_faces(np.zeros((240, 320, 3), dtype=np.uint8))
+    elif task == "spoofing":
+        model.analyze(img=np.zeros((240, 320, 3), dtype=np.uint8), facial_area=(80, 60, 160, 120))
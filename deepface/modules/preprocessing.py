@@ -1,19 +1,14 @@
 # built-in dependencies
-from typing import Tuple
+import os
+import threading
+from typing import Dict, Tuple
 
 # 3rd party
 import numpy as np
 import cv2
 
-# project dependencies
-from deepface.commons import package_utils
-
-
-tf_major_version = package_utils.get_tf_major_version()
-if tf_major_version == 1:
-    from keras.preprocessing import image
-elif tf_major_version == 2:
-    from tensorflow.keras.preprocessing import image
+# memory kept by TensorArena per thread for reuse, larger batches are allocated one-off
+ARENA_MAX_BYTES = int(os.environ.get("DEEPFACE_ARENA_MAX_BYTES", str(64 * 1024 * 1024)))
 
 
 def normalize_input(img: np.ndarray, normalization: str = "base") -> np.ndarray:
@@ -43,7 +38,8 @@ def normalize_input(img: np.ndarray, normalization: str = "base") -> np.ndarray:
 
     elif normalization == "Facenet":
         mean, std = img.mean(), img.std()
-        img = (img - mean) / std
+        img -= mean
+        img /= std
 
     elif normalization == "Facenet2018":
         # simply / 127.5 - 1 (similar to facenet 2018 model preprocessing step as @iamrishab posted)
@@ -83,39 +79,108 @@ def resize_image(img: np.ndarray, target_size: Tuple[int, int]) -> np.ndarray:
     Returns:
         img (np.ndarray): resized input image
     """
-    factor_0 = target_size[0] / img.shape[0]
-    factor_1 = target_size[1] / img.shape[1]
-    factor = min(factor_0, factor_1)
+    channels = img.shape[2] if img.ndim == 3 else 1
+    # make it 4-dimensional how ML models expect
+    out = np.empty((1, target_size[0], target_size[1], channels), dtype=np.float32)
+    resize_image_into(img=img, out=out[0])
+    return out
+
+
+def resize_image_into(img: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Resize an image to expected size of a ml model with adding black pixels,
+        writing the result into a preallocated buffer instead of allocating a new one.
+    Args:
+        img (np.ndarray): pre-loaded image as numpy array
+        out (np.ndarray): float32 buffer of shape (height, width, channels) to write into,
+            e.g. one slot of a batch from TensorArena.get. Its shape defines the target size.
+            Pixels are scaled into [0, 1] if the image is in scale of [0, 255].
+    Returns:
+        out (np.ndarray): the given buffer
+    """
+    target_h, target_w = out.shape[0], out.shape[1]
+    factor = min(target_h / img.shape[0], target_w / img.shape[1])
 
     dsize = (
-        int(img.shape[1] * factor),
-        int(img.shape[0] * factor),
+        max(1, min(target_w, int(img.shape[1] * factor))),
+        max(1, min(target_h, int(img.shape[0] * factor))),
     )
-    img = cv2.resize(img, dsize)
-
-    diff_0 = target_size[0] - img.shape[0]
-    diff_1 = target_size[1] - img.shape[1]
+    resized = cv2.resize(img, dsize).reshape(dsize[1], dsize[0], -1)
 
     # Put the base image in the middle of the padded image
-    img = np.pad(
-        img,
-        (
-            (diff_0 // 2, diff_0 - diff_0 // 2),
-            (diff_1 // 2, diff_1 - diff_1 // 2),
-            (0, 0),
-        ),
-        "constant",
+    top = (target_h - dsize[1]) // 2
+    left = (target_w - dsize[0]) // 2
+    out[:top] = 0
+    out[top + dsize[1] :] = 0
+    out[top : top + dsize[1], :left] = 0
+    out[top : top + dsize[1], left + dsize[0] :] = 0
+
+    scale = 1 / 255 if resized.max() > 1 else 1
+    np.multiply(
+        resized,
+        np.float32(scale),
+        out=out[top : top + dsize[1], left : left + dsize[0]],
+        casting="unsafe",
     )
+    return out
 
-    # double check: if target image is not still the same size with target.
-    if img.shape[0:2] != target_size:
-        img = cv2.resize(img, target_size)
-
-    # make it 4-dimensional how ML models expect
-    img = image.img_to_array(img)
-    img = np.expand_dims(img, axis=0)
 
-    if img.max() > 1:
-        img = (img.astype(np.float32) / 255.0).astype(np.float32)
+class TensorArena(threading.local):
+    """
+    Reusable float32 model input buffers, one set per thread.
+    A buffer returned by get is overwritten by the next get call of the same thread
+        for the same shape, so it must not be kept beyond a single forward pass.
+    """
 
-    return img
+    def __init__(self, max_bytes: int = ARENA_MAX_BYTES):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._buffers: Dict[Tuple[int, int, int], np.ndarray] = {}
+
+    @property
+    def retained_bytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def get(self, batch_size: int, height: int, width: int, channels: int = 3) -> np.ndarray:
+        """
+        Get a (batch_size, height, width, channels) float32 buffer.
+        Buffers up to max_bytes are kept for reuse by this thread; larger batches get a
+            one-off buffer that is released with the caller's reference.
+        Args:
+            batch_size (int): number of images
+            height (int): image height
+            width (int): image width
+            channels (int): number of channels
+        Returns:
+            buffer (np.ndarray): uninitialized buffer, every slot has to be filled by caller
+        """
+        key = (height, width, channels)
+        buffer = self._buffers.get(key)
+        if buffer is not None and buffer.shape[0] >= batch_size:
+            return buffer[:batch_size]
+
+        item_bytes = height * width * channels * np.dtype(np.float32).itemsize
+        max_items = self.max_bytes // item_bytes
+        if batch_size > max_items:
+            # oversized request, do not keep it alive for the rest of the thread's life
+            return np.empty((batch_size, height, width, channels), dtype=np.float32)
+
+        # grow geometrically so that slowly increasing batch sizes do not reallocate each time
+        capacity = max(batch_size, 2 * buffer.shape[0] if buffer is not None else 1)
+        capacity = min(capacity, max_items)
+        self._buffers.pop(key, None)
+        # buffers of other shapes are dropped if all of them would not fit into max_bytes
+        while self._buffers and self.retained_bytes + capacity * item_bytes > self.max_bytes:
+            self._buffers.pop(next(iter(self._buffers)))
+        buffer = np.empty((capacity, height, width, channels), dtype=np.float32)
+        self._buffers[key] = buffer
+        return buffer[:batch_size]
+
+    def trim(self) -> None:
+        """
+        Release the buffers retained by the calling thread
+        """
+        self._buffers.clear()
+
+
+arena = TensorArena()
@@ -83,11 +83,10 @@ def represent(
     else:
         images = [img_path]
 
-    batch_images, batch_regions, batch_confidences, batch_indexes = [], [], [], []
+    batch_faces, batch_regions, batch_confidences, batch_indexes = [], [], [], []
 
     for idx, single_img_path in enumerate(images):
         # we have run pre-process in verification. so, skip if it is coming from verify.
-        target_size = model.input_shape
         if detector_backend != "skip":
             # Images are returned in RGB format.
             img_objs = detection.extract_faces(
@@ -142,23 +141,26 @@ def represent(
             region = img_obj["facial_area"]
             confidence = img_obj["confidence"]
 
-            # resize to expected shape of ml model
-            img = preprocessing.resize_image(
-                img=img,
-                # thanks to DeepId (!)
-                target_size=(target_size[1], target_size[0]),
-            )
-
-            # custom normalization
-            img = preprocessing.normalize_input(img=img, normalization=normalization)
-
-            batch_images.append(img)
+            batch_faces.append(img)
             batch_regions.append(region)
             batch_confidences.append(confidence)
             batch_indexes.append(idx)
 
-    # Convert list of images to a numpy array for batch processing
-    batch_images = np.concatenate(batch_images, axis=0)
+    if len(batch_faces) == 0:
+        raise ValueError("No face found in the given image(s) to represent.")
+
+    # resize every face into a single reusable buffer for batch processing
+    # thanks to DeepId (!) - input_shape is (width, height)
+    target_size = model.input_shape
+    batch_images = preprocessing.arena.get(
+        batch_size=len(batch_faces), height=target_size[1], width=target_size[0]
+    )
+    for slot, img in zip(batch_images, batch_faces):
+        # resize to expected shape of ml model
+        preprocessing.resize_image_into(img=img, out=slot)
+
+        # custom normalization, per face
+        preprocessing.normalize_input(img=slot, normalization=normalization)
 
     # Forward pass through the model for the entire batch
     embeddings = model.forward(batch_images)
@@ -587,6 +587,40 @@ def perform_demography_analysis(
     return img
 
 
+def blend_rectangle(
+    img: np.ndarray,
+    pt1: Tuple[int, int],
+    pt2: Tuple[int, int],
+    color: Tuple[int, int, int],
+    opacity: float,
+) -> np.ndarray:
+    """
+    Draw a translucent filled rectangle by blending only its region of interest in place.
+    Each pixel in the rectangle becomes opacity * original + (1 - opacity) * color,
+    the same result as drawing the filled rectangle on a copy of the image and calling
+    cv2.addWeighted(img, opacity, copy, 1 - opacity, 0), without the full-frame copy.
+    Args:
+        img (np.ndarray): image itself
+        pt1 (tuple): one corner of the rectangle
+        pt2 (tuple): opposite corner of the rectangle
+        color (tuple): fill color in bgr
+        opacity (float): weight kept from the original pixels
+    Returns:
+        img (np.ndarray): image with the blended rectangle
+    """
+    x1, x2 = sorted((int(pt1[0]), int(pt2[0])))
+    y1, y2 = sorted((int(pt1[1]), int(pt2[1])))
+    x1, y1 = max(x1, 0), max(y1, 0)
+    x2, y2 = min(x2 + 1, img.shape[1]), min(y2 + 1, img.shape[0])
+    if x1 >= x2 or y1 >= y2:
+        return img
+    roi = img[y1:y2, x1:x2]
+    fill = np.empty_like(roi)
+    fill[:] = color
+    roi[:] = cv2.addWeighted(roi, opacity, fill, 1 - opacity, 0)
+    return img
+
+
 def overlay_identified_face(
     img: np.ndarray,
     target_img: np.ndarray,
@@ -622,22 +656,12 @@ def overlay_identified_face(
                 x + w : x + w + IDENTIFIED_IMG_SIZE,
             ] = target_img
 
-            overlay = img.copy()
-            opacity = 0.4
-            cv2.rectangle(
-                img,
-                (x + w, y),
-                (x + w + IDENTIFIED_IMG_SIZE, y + 20),
-                (46, 200, 255),
-                cv2.FILLED,
-            )
-            cv2.addWeighted(
-                overlay,
-                opacity,
-                img,
-                1 - opacity,
-                0,
-                img,
+            blend_rectangle(
+                img=img,
+                pt1=(x + w, y),
+                pt2=(x + w + IDENTIFIED_IMG_SIZE, y + 20),
+                color=(46, 200, 255),
+                opacity=0.4,
             )
 
             cv2.putText(
@@ -673,22 +697,12 @@ def overlay_identified_face(
                 x - IDENTIFIED_IMG_SIZE : x,
             ] = target_img
 
-            overlay = img.copy()
-            opacity = 0.4
-            cv2.rectangle(
-                img,
-                (x - IDENTIFIED_IMG_SIZE, y + h - 20),
-                (x, y + h),
-                (46, 200, 255),
-                cv2.FILLED,
-            )
-            cv2.addWeighted(
-                overlay,
-                opacity,
-                img,
-                1 - opacity,
-                0,
-                img,
+            blend_rectangle(
+                img=img,
+                pt1=(x - IDENTIFIED_IMG_SIZE, y + h - 20),
+                pt2=(x, y + h),
+                color=(46, 200, 255),
+                opacity=0.4,
             )
 
             cv2.putText(
@@ -727,22 +741,12 @@ def overlay_identified_face(
             # top left
             img[y - IDENTIFIED_IMG_SIZE : y, x - IDENTIFIED_IMG_SIZE : x] = target_img
 
-            overlay = img.copy()
-            opacity = 0.4
-            cv2.rectangle(
-                img,
-                (x - IDENTIFIED_IMG_SIZE, y),
-                (x, y + 20),
-                (46, 200, 255),
-                cv2.FILLED,
-            )
-            cv2.addWeighted(
-                overlay,
-                opacity,
-                img,
-                1 - opacity,
-                0,
-                img,
+            blend_rectangle(
+                img=img,
+                pt1=(x - IDENTIFIED_IMG_SIZE, y),
+                pt2=(x, y + 20),
+                color=(46, 200, 255),
+                opacity=0.4,
             )
 
             cv2.putText(
@@ -787,22 +791,12 @@ def overlay_identified_face(
                 x + w : x + w + IDENTIFIED_IMG_SIZE,
             ] = target_img
 
-            overlay = img.copy()
-            opacity = 0.4
-            cv2.rectangle(
-                img,
-                (x + w, y + h - 20),
-                (x + w + IDENTIFIED_IMG_SIZE, y + h),
-                (46, 200, 255),
-                cv2.FILLED,
-            )
-            cv2.addWeighted(
-                overlay,
-                opacity,
-                img,
-                1 - opacity,
-                0,
-                img,
+            blend_rectangle(
+                img=img,
+                pt1=(x + w, y + h - 20),
+                pt2=(x + w + IDENTIFIED_IMG_SIZE, y + h),
+                color=(46, 200, 255),
+                opacity=0.4,
             )
 
             cv2.putText(
@@ -864,30 +858,27 @@ def overlay_emotion(
     # background of mood box
 
     # transparency
-    overlay = img.copy()
     opacity = 0.4
 
     # put gray background to the right of the detected image
     if x + w + IDENTIFIED_IMG_SIZE < img.shape[1]:
-        cv2.rectangle(
-            img,
-            (x + w, y),
-            (x + w + IDENTIFIED_IMG_SIZE, y + h),
-            (64, 64, 64),
-            cv2.FILLED,
+        blend_rectangle(
+            img=img,
+            pt1=(x + w, y),
+            pt2=(x + w + IDENTIFIED_IMG_SIZE, y + h),
+            color=(64, 64, 64),
+            opacity=opacity,
         )
-        cv2.addWeighted(overlay, opacity, img, 1 - opacity, 0, img)
 
     # put gray background to the left of the detected image
     elif x - IDENTIFIED_IMG_SIZE > 0:
-        cv2.rectangle(
-            img,
-            (x - IDENTIFIED_IMG_SIZE, y),
-            (x, y + h),
-            (64, 64, 64),
-            cv2.FILLED,
+        blend_rectangle(
+            img=img,
+            pt1=(x - IDENTIFIED_IMG_SIZE, y),
+            pt2=(x, y + h),
+            color=(64, 64, 64),
+            opacity=opacity,
         )
-        cv2.addWeighted(overlay, opacity, img, 1 - opacity, 0, img)
 
     for index, instance in emotion_df.iterrows():
         current_emotion = instance["emotion"]
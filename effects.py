@@ -2,26 +2,102 @@ import cv2
 import random
 import numpy as np
 
+# baris scanline per (tinggi frame, thickness), dihitung sekali per resolusi
+_scanline_rows = {}
+# LUT peredupan per intensitas
+_dim_luts = {}
+
+
+def _get_scanline_rows(height, thickness):
+    key = (height, thickness)
+    rows = _scanline_rows.get(key)
+    if rows is None:
+        all_rows = np.arange(height)
+        rows = all_rows[(all_rows % (thickness * 2)) < thickness]
+        _scanline_rows[key] = rows
+    return rows
+
+
+def _get_dim_lut(intensity):
+    lut = _dim_luts.get(intensity)
+    if lut is None:
+        scale = 1 - intensity / 100
+        lut = np.clip(np.arange(256) * scale + 0.5, 0, 255).astype(np.uint8)
+        _dim_luts[intensity] = lut
+    return lut
+
+
+def _apply_scanlines(img, intensity, thickness):
+    # in place: hanya baris garis yang digelapkan lewat LUT, baris lain tidak disentuh
+    rows = _get_scanline_rows(img.shape[0], thickness)
+    img[rows] = cv2.LUT(img[rows], _get_dim_lut(intensity))
+    return img
+
+
+def _apply_glitch(img, frame_idx):
+    # in place: geser beberapa pita horizontal (hanya pita yang disalin)
+    h = img.shape[0]
+    if frame_idx % 7 != 0 or h < 25:
+        return img
+    for _ in range(random.randint(2, 5)):
+        y1 = random.randint(0, h-25)
+        y2 = y1 + random.randint(5, 25)
+        shift = random.randint(-30, 30)
+        if shift:
+            img[y1:y2] = np.roll(img[y1:y2], shift, axis=1)
+    return img
+
+
+def _rgb_split_into(src, dst, shift):
+    # R digeser ke kanan, B ke kiri, G tetap; tepi yang kosong diisi hitam
+    if shift <= 0 or shift >= src.shape[1]:
+        dst[...] = src
+        return dst
+    dst[:, :, 1] = src[:, :, 1]
+    dst[:, shift:, 2] = src[:, :-shift, 2]
+    dst[:, :shift, 2] = 0
+    dst[:, :-shift, 0] = src[:, shift:, 0]
+    dst[:, -shift:, 0] = 0
+    return dst
+
+
 def add_scanlines(frame, intensity=40, thickness=2):
-    overlay = frame.copy()
-    for y in range(0, frame.shape[0], thickness*2):
-        cv2.line(overlay, (0, y), (frame.shape[1], y), (0, 0, 0), thickness)
-    return cv2.addWeighted(overlay, intensity/100, frame, 1-intensity/100, 0)
+    return _apply_scanlines(frame.copy(), intensity, thickness)
 
 def add_glitch(frame, frame_idx):
-    h, w, _ = frame.shape
-    output = frame.copy()
-    if frame_idx % 7 == 0:
-        for _ in range(random.randint(2, 5)):
-            y1 = random.randint(0, h-25)
-            y2 = y1 + random.randint(5, 25)
-            shift = random.randint(-30, 30)
-            output[y1:y2, :] = np.roll(output[y1:y2, :], shift, axis=1)
-    return output
+    return _apply_glitch(frame.copy(), frame_idx)
 
 def add_rgb_split(frame, shift=3):
-    b, g, r = cv2.split(frame)
-    rows, cols = b.shape
-    r_shifted = cv2.warpAffine(r, np.float32([[1, 0, shift], [0, 1, 0]]), (cols, rows))
-    b_shifted = cv2.warpAffine(b, np.float32([[1, 0, -shift], [0, 1, 0]]), (cols, rows))
-    return cv2.merge([b_shifted, g, r_shifted])
+    return _rgb_split_into(frame, np.empty_like(frame), shift)
+
+
+class EffectChain:
+    """
+    Scanlines -> glitch -> RGB split (urutan sama dengan add_scanlines,
+    add_glitch, add_rgb_split) tanpa alokasi per frame.
+    Frame disalin ke buffer kerja, scanlines dan glitch dikerjakan in place
+    di sana, lalu RGB split menulis ke buffer output. Kedua buffer
+    dialokasikan sekali per resolusi. Hasil apply() selalu buffer yang sama,
+    jadi tampilkan/copy sebelum frame berikutnya.
+    """
+
+    def __init__(self, scanline_intensity=25, scanline_thickness=2, rgb_shift=2, glitch=True):
+        self.scanline_intensity = scanline_intensity
+        self.scanline_thickness = scanline_thickness
+        self.rgb_shift = rgb_shift
+        self.glitch = glitch
+        self._work = None
+        self._out = None
+
+    def apply(self, frame, frame_idx):
+        if self._out is None or self._out.shape != frame.shape or self._out.dtype != frame.dtype:
+            self._work = np.empty_like(frame)
+            self._out = np.empty_like(frame)
+        work = self._work
+        np.copyto(work, frame)
+        if self.scanline_intensity:
+            _apply_scanlines(work, self.scanline_intensity, self.scanline_thickness)
+        if self.glitch:
+            _apply_glitch(work, frame_idx)
+        # split terakhir: tepi hitam hasil split tidak ikut tergeser glitch
+        return _rgb_split_into(work, self._out, self.rgb_shift)
@@ -1,7 +1,16 @@
-from flask import Flask, Response, jsonify, render_template
+from flask import Flask, Response, jsonify, render_template, request
 import threading
-import cv2, time, csv, os
-from deepface import DeepFace
+import cv2, time
+from deepface import fast
+from deepface.commons import image_utils
+from inference_server import InferenceScheduler
+from smoothing import EmotionSmoother
+from scan_writer import ScanWriter
+from history_store import HistoryStore
+from frame_ring import FrameRing
+from rate_control import RateController, scene_hints
+from motion_gate import MotionGate
+from stream_broadcaster import StreamBroadcaster
 from renderer import SuperEmojiRenderer
 from emoji import UltraEmoji
 from config import *
@@ -9,16 +18,16 @@ from effects import add_scanlines, add_glitch, add_rgb_split
 
 app = Flask(__name__)
 
-# Folder log
-os.makedirs("scans", exist_ok=True)
-CSV_PATH = "scans/emotions_log.csv"
-if not os.path.exists(CSV_PATH):
-    with open(CSV_PATH, "w", newline="") as f:
-        csv.writer(f).writerow(["timestamp", "emotion", "filename"])
+# Folder log (ditulis di background oleh ScanWriter, di-indeks oleh HistoryStore)
+CSV_PATH = SCAN_CSV_PATH
+scan_writer = ScanWriter(CSV_PATH)
+history_store = HistoryStore(csv_path=CSV_PATH)
+scan_writer.on_rows = lambda rows: history_store.sync_from_csv()
+scan_writer.start()
 
 # Global variables
 cap = None
-current_frame = None
+frame_ring = FrameRing()
 last_emotion = {
     "timestamp": None,
     "emotion": "neutral",
@@ -26,6 +35,24 @@ last_emotion = {
     "region": None,
 }
 lock = threading.Lock()
+scheduler = InferenceScheduler().start()
+
+
+def preload_models():
+    fast.preload(models=PRELOAD_MODELS, warmup_batches=PRELOAD_WARMUP_BATCHES)
+    # cache hasil emosi khusus app kamera, diaktifkan setelah warm-up
+    # supaya input warm-up tidak ikut tersimpan
+    fast.configure_emotion_cache(EMOTION_CACHE_SIZE, EMOTION_CACHE_TTL)
+
+
+# build + warm-up model di background, status lewat /ready
+preload_thread = threading.Thread(target=preload_models, daemon=True)
+preload_thread.start()
+smoother = EmotionSmoother(mode=SMOOTHING_MODE, hysteresis=SMOOTHING_HYSTERESIS)
+# laju analisis kamera diatur otomatis (latency, CPU, gerakan / wajah baru)
+rate = RateController()
+# wajah / scene tidak berubah -> hasil sebelumnya dipakai ulang tanpa inferensi
+motion_gate = MotionGate()
 renderer = SuperEmojiRenderer(mode=EMOJI_MODES[EMOJI_MODE_IDX])
 stop_threads = False
 threads = []
@@ -38,38 +65,60 @@ camera_on = False
 # THREADS
 # ===============================
 def camera_capture():
-    global cap, current_frame, stop_threads
+    global cap, stop_threads
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("❌ Kamera gagal dibuka")
         return
     print("📷 Kamera dinyalakan")
     while not stop_threads:
-        ret, frame = cap.read()
-        if ret:
-            with lock:
-                current_frame = frame.copy()
+        # frame langsung dibaca ke slot ring buffer, tanpa copy
+        frame_ring.capture(cap)
         time.sleep(0.01)
     cap.release()
     print("📷 Kamera dimatikan")
 
 
 def emotion_analyzer():
-    global current_frame, last_emotion, stop_threads
+    global last_emotion, stop_threads
     last_scan_time = 0
+    prev_regions = []
     while not stop_threads:
-        with lock:
-            frame_copy = None if current_frame is None else current_frame.copy()
-        if frame_copy is not None and (time.time() - last_scan_time >= 1.0):
+        # view read-only slot terbaru, tidak di-copy
+        seq, frame_view = frame_ring.latest()
+        if frame_view is not None and rate.ready():
+            if not motion_gate.changed(frame_view, prev_regions):
+                rate.skip()
+                rate.notify(motion=False)
+                time.sleep(min(max(rate.remaining(), 0.01), 0.1))
+                continue
+            # salin sekali sebelum inferensi: slot ring ditimpa kamera setelah
+            # FRAME_RING_SIZE - 1 frame, sementara antrian scheduler bisa lebih lama
+            frame = frame_view.copy()
+            if not frame_ring.is_valid(seq):
+                # slot sudah ditimpa saat disalin
+                continue
+            started = rate.begin()
             try:
-                result = DeepFace.analyze(
-                    frame_copy, actions=["emotion"], enforce_detection=False
-                )
-                if not isinstance(result, list):
-                    result = [result]
+                try:
+                    result = scheduler.analyze(frame)
+                finally:
+                    # latency hanya dari inferensi, dicatat tepat sekali
+                    rate.end(started)
+                # referensi motion gate hanya diganti oleh frame yang benar-benar dianalisis
+                motion_gate.commit(frame)
+                regions = [
+                    tuple(int(r["region"][k]) for k in ("x", "y", "w", "h"))
+                    for r in result
+                    if r.get("face_confidence", 0) > 0
+                ]
+                motion, new_face = scene_hints(prev_regions, regions)
+                rate.notify(motion=motion, new_face=new_face)
+                prev_regions = regions
                 if len(result) > 0:
                     r = result[0]
-                    dominant = r["dominant_emotion"]
+                    smoother.update([0], [r.get("emotion", {})])
+                    dominant = smoother.dominant(0, r["dominant_emotion"])
                     x, y, w, h = map(
                         int,
                         (
@@ -80,71 +129,63 @@ def emotion_analyzer():
                         ),
                     )
                     timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-                    filename = f"scans/{timestamp}_{dominant}.jpg"
-                    face_crop = frame_copy[y : y + h, x : x + w]
-                    if face_crop.size > 0:
-                        cv2.imwrite(filename, face_crop)
+                    update = {"timestamp": timestamp, "emotion": dominant, "region": (x, y, w, h)}
+                    # analisis bisa lebih sering dari scan; scan tetap tiap SCAN_INTERVAL
+                    if time.time() - last_scan_time >= SCAN_INTERVAL:
+                        filename = f"{SCAN_DIR}/{timestamp}_{dominant}.jpg"
+                        face_crop = frame[max(y, 0) : y + h, max(x, 0) : x + w]
+                        scan_writer.submit(timestamp, dominant, filename, face_crop)
+                        update["filename"] = filename
+                        last_scan_time = time.time()
                     with lock:
-                        last_emotion.update(
-                            {
-                                "timestamp": timestamp,
-                                "emotion": dominant,
-                                "filename": filename,
-                                "region": (x, y, w, h),
-                            }
-                        )
-                    with open(CSV_PATH, "a", newline="") as f:
-                        csv.writer(f).writerow([timestamp, dominant, filename])
-                    last_scan_time = time.time()
+                        last_emotion.update(update)
             except Exception as e:
                 print("[DeepFace Warning]", e)
-        time.sleep(0.1)
+        time.sleep(min(max(rate.remaining(), 0.01), 0.1))
 
 
 # ===============================
 # STREAM GENERATOR
 # ===============================
-def generate_stream():
-    frame_count = 0
-    while True:
-        if not camera_on or current_frame is None:
-            time.sleep(0.1)
-            continue
-        with lock:
-            frame = current_frame.copy()
-            emotion = last_emotion.get("emotion", "neutral")
-            region = last_emotion.get("region")
-        if region:
-            x, y, w, h = region
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-            cv2.putText(
-                frame,
-                emotion.upper(),
-                (x, y - 10),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.8,
-                (0, 255, 0),
-                2,
-            )
-        renderer.draw(frame, (40, 70), 55, emotion, frame_count)
-        color = renderer.colors.get(emotion, (0, 255, 255))
+def render_overlay(frame, frame_count):
+    with lock:
+        emotion = last_emotion.get("emotion", "neutral")
+        region = last_emotion.get("region")
+    if region:
+        x, y, w, h = region
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
         cv2.putText(
             frame,
-            f"Emosi: {emotion.upper()}",
-            (40, 150),
+            emotion.upper(),
+            (x, y - 10),
             cv2.FONT_HERSHEY_SIMPLEX,
-            0.6,
-            color,
+            0.8,
+            (0, 255, 0),
             2,
         )
-        ret, buffer = cv2.imencode(".jpg", frame)
-        if not ret:
+    renderer.draw(frame, (40, 70), 55, emotion, frame_count)
+    color = renderer.colors.get(emotion, (0, 255, 255))
+    cv2.putText(
+        frame,
+        f"Emosi: {emotion.upper()}",
+        (40, 150),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.6,
+        color,
+        2,
+    )
+
+
+# overlay + JPEG encode sekali per frame, dibagikan ke semua viewer /stream
+broadcaster = StreamBroadcaster(frame_ring, render=render_overlay)
+
+
+def generate_stream():
+    while True:
+        if not camera_on:
+            time.sleep(0.1)
             continue
-        yield (
-            b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + buffer.tobytes() + b"\r\n"
-        )
-        frame_count += 1
-        time.sleep(0.03)
+        yield from broadcaster.subscribe(is_active=lambda: camera_on)
 
 
 # ===============================
@@ -160,7 +201,10 @@ def index():
                 "/camera/start": "Turn on camera",
                 "/camera/stop": "Turn off camera",
                 "/last": "Get last detected emotion",
-                "/history": "Full log",
+                "/history": "Log (?start=&end=&emotion=&limit=&cursor=), "
+                "start/end: ISO 8601 (2024-05-01T10:00:00) or 2024-05-01_10-00-00, local time",
+                "/history/summary": "Counts per emotion per time bucket (?bucket=minute)",
+                "/analyze": "Analyze an uploaded image (POST)",
                 "/ui": "Web front-end",
             },
         }
@@ -199,6 +243,15 @@ def camera_stop():
     return jsonify({"status": "Camera stopped"})
 
 
+@app.route("/ready")
+def ready():
+    status = fast.readiness()
+    # belum ada model terdaftar = thread preload belum mulai
+    status["ready"] = status["ready"] and len(status["models"]) > 0
+    status["emotion_cache"] = fast.emotion_cache_stats()
+    return jsonify(status), (200 if status["ready"] else 503)
+
+
 @app.route("/last")
 def last():
     with lock:
@@ -207,13 +260,77 @@ def last():
 
 @app.route("/history")
 def history():
-    data = []
-    if os.path.exists(CSV_PATH):
-        with open(CSV_PATH, "r") as f:
-            data = list(csv.DictReader(f))
+    """
+    start / end (inklusif): ISO 8601 ("2024-05-01", "2024-05-01T10:00",
+    "2024-05-01T10:00:00+07:00") atau format scan "2024-05-01_10-00-00",
+    waktu lokal jika tanpa zona. Format lain -> 400.
+    """
+    try:
+        items, next_cursor = history_store.query(
+            start=request.args.get("start"),
+            end=request.args.get("end"),
+            emotion=request.args.get("emotion"),
+            limit=request.args.get("limit", HISTORY_PAGE_SIZE),
+            cursor=request.args.get("cursor"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"items": items, "next_cursor": next_cursor})
+
+
+@app.route("/history/summary")
+def history_summary():
+    try:
+        data = history_store.aggregate(
+            start=request.args.get("start"),
+            end=request.args.get("end"),
+            emotion=request.args.get("emotion"),
+            bucket=request.args.get("bucket", "minute"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     return jsonify(data)
 
 
+@app.route("/analyze", methods=["POST"])
+def analyze():
+    # input rusak / tidak ada -> 400
+    try:
+        if request.files.get("img") is not None:
+            img = image_utils.load_image_from_file_storage(request.files["img"])
+        else:
+            input_args = request.get_json(silent=True) or request.form.to_dict()
+            img_b64 = input_args.get("img")
+            if not img_b64:
+                return jsonify({"error": "'img' not found in request"}), 400
+            # hanya base64, jangan buka path / url dari sisi server
+            img = image_utils.load_image_from_base64(img_b64)
+    except Exception as e:
+        return jsonify({"error": f"invalid image: {e}"}), 400
+    if img is None or getattr(img, "size", 0) == 0:
+        return jsonify({"error": "invalid image: could not be decoded"}), 400
+
+    # kegagalan model / server -> 500
+    try:
+        result = scheduler.analyze(img)
+    except Exception as e:
+        print("[DeepFace Error]", e)
+        return jsonify({"error": f"analysis failed: {e}"}), 500
+    return jsonify(
+        {
+            "results": [
+                {
+                    "dominant_emotion": r["dominant_emotion"],
+                    "emotion": {k: float(v) for k, v in r["emotion"].items()},
+                    "region": r["region"],
+                    "face_confidence": float(r["face_confidence"]),
+                }
+                for r in result
+            ]
+        }
+    )
+
+
 # ===============================
 # FRONT-END
 # ===============================
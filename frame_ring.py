@@ -0,0 +1,95 @@
+import threading
+
+import numpy as np
+
+from config import FRAME_RING_SIZE
+
+
+class FrameRing:
+    """
+    Ring buffer frame yang dialokasikan sekali.
+    Thread capture menulis langsung ke slot berikutnya (cap.read(image=slot)),
+    pembaca mendapat view read-only dari slot terbaru tanpa copy.
+    Slot baru ditimpa lagi setelah `size - 1` frame berikutnya; pembaca yang
+    memegang frame lebih lama bisa mengecek dengan is_valid(seq).
+    """
+
+    def __init__(self, size=FRAME_RING_SIZE):
+        self.size = max(2, int(size))
+        self._slots = None
+        self._seq = 0
+        self._latest = -1
+        self._cond = threading.Condition()
+
+    def _needs_allocation(self, frame, slot):
+        return slot is None or frame.shape != slot.shape or frame.dtype != slot.dtype
+
+    def _reallocate_and_publish(self, frame):
+        # slot pertama / resolusi berubah: slot baru diisi dulu, baru ditukar dan
+        # dipublikasikan sekaligus, supaya latest() tidak pernah melihat buffer kosong
+        slots = [np.empty(frame.shape, dtype=frame.dtype) for _ in range(self.size)]
+        slots[0][...] = frame
+        with self._cond:
+            self._slots = slots
+            self._publish_locked(0)
+
+    def capture(self, cap):
+        """Baca satu frame dari cv2.VideoCapture ke slot berikutnya. Kembalikan ret."""
+        idx = (self._latest + 1) % self.size
+        slot = None if self._slots is None else self._slots[idx]
+        ret, frame = cap.read(image=slot) if slot is not None else cap.read()
+        if not ret or frame is None:
+            return False
+        if frame is slot:
+            self._publish(idx)
+        elif self._needs_allocation(frame, slot):
+            self._reallocate_and_publish(frame)
+        else:
+            slot[...] = frame
+            self._publish(idx)
+        return True
+
+    def write(self, frame):
+        """Salin frame dari sumber lain (bukan VideoCapture) ke slot berikutnya."""
+        idx = (self._latest + 1) % self.size
+        slot = None if self._slots is None else self._slots[idx]
+        if self._needs_allocation(frame, slot):
+            self._reallocate_and_publish(frame)
+            return
+        slot[...] = frame
+        self._publish(idx)
+
+    def _publish(self, idx):
+        with self._cond:
+            self._publish_locked(idx)
+
+    def _publish_locked(self, idx):
+        self._seq += 1
+        self._latest = idx
+        self._cond.notify_all()
+
+    def latest(self):
+        """(seq, view read-only) frame terbaru, atau (0, None) jika belum ada frame."""
+        with self._cond:
+            if self._latest < 0 or self._slots is None:
+                return 0, None
+            view = self._slots[self._latest].view()
+            seq = self._seq
+        view.flags.writeable = False
+        return seq, view
+
+    def wait_newer(self, seq, timeout=None):
+        """Tunggu sampai ada frame dengan seq lebih baru dari `seq`."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq > seq, timeout=timeout)
+        return self.latest()
+
+    def is_valid(self, seq):
+        """True jika slot frame `seq` belum ditimpa frame baru."""
+        with self._cond:
+            return seq > 0 and self._seq - seq < self.size - 1
+
+    def reset(self):
+        with self._cond:
+            self._latest = -1
+            self._slots = None
@@ -0,0 +1,186 @@
+import csv
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from config import HISTORY_DB_PATH, SCAN_CSV_PATH, HISTORY_PAGE_SIZE, HISTORY_MAX_PAGE_SIZE
+
+# format timestamp yang ditulis ScanWriter (waktu lokal)
+TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+# panjang prefix timestamp "%Y-%m-%d_%H-%M-%S" untuk tiap ukuran bucket agregasi
+BUCKET_PREFIX = {"day": 10, "hour": 13, "minute": 16, "second": 19}
+
+
+def normalize_time(value, upper=False):
+    """
+    Parameter start / end -> string TIMESTAMP_FORMAT yang bisa dibandingkan
+    langsung dengan kolom timestamp.
+
+    Diterima: format scan ("2024-05-01_10-00-00") atau ISO 8601
+    ("2024-05-01", "2024-05-01T10:00", "2024-05-01 10:00:00", "...+07:00").
+    Zona waktu eksplisit dikonversi ke waktu lokal. Untuk batas atas (`upper`),
+    input tanpa detik / tanpa jam mencakup seluruh menit / hari tersebut.
+    ValueError jika format tidak dikenali.
+    """
+    value = str(value).strip()
+    try:
+        return datetime.strptime(value, TIMESTAMP_FORMAT).strftime(TIMESTAMP_FORMAT)
+    except ValueError:
+        pass
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(
+            f"invalid time {value!r}, use ISO 8601 (e.g. 2024-05-01T10:00:00) "
+            "or 2024-05-01_10-00-00"
+        ) from None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    if upper:
+        time_part = value[11:]
+        if len(value) == 10:
+            dt += timedelta(days=1, seconds=-1)
+        elif time_part[:5].count(":") == 1 and time_part[5:6] != ":":
+            # HH:MM tanpa detik
+            dt = dt.replace(second=59)
+    return dt.strftime(TIMESTAMP_FORMAT)
+
+
+class HistoryStore:
+    """
+    Riwayat scan ter-indeks di SQLite.
+    CSV tetap menjadi log utama; store ini mengikuti CSV secara inkremental
+    (membaca mulai dari offset byte terakhir yang sudah diimpor), sehingga
+    /history bisa query rentang waktu, filter emosi, paginasi cursor dan
+    agregasi tanpa membaca seluruh file.
+    """
+
+    def __init__(self, db_path=HISTORY_DB_PATH, csv_path=SCAN_CSV_PATH):
+        self.db_path = db_path
+        self.csv_path = csv_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scans ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "timestamp TEXT NOT NULL, emotion TEXT NOT NULL, filename TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_scans_ts ON scans (timestamp)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scans_emotion_ts ON scans (emotion, timestamp)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+        self.sync_from_csv()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ===============================
+    # INGEST
+    # ===============================
+    def _get_offset(self):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'csv_offset'").fetchone()
+        return int(row["value"]) if row else 0
+
+    def sync_from_csv(self):
+        """Impor baris CSV yang belum ada di store. Aman dipanggil berulang kali."""
+        if not os.path.exists(self.csv_path):
+            return 0
+        with self._lock:
+            offset = self._get_offset()
+            size = os.path.getsize(self.csv_path)
+            if size < offset:
+                # file CSV dirotasi / dibuat ulang
+                offset = 0
+            if size == offset:
+                return 0
+            imported = 0
+            rows = []
+            with open(self.csv_path, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    # baris terakhir yang belum lengkap diimpor pada sync berikutnya
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    row = next(csv.reader([line.decode("utf-8")]), [])
+                    if len(row) >= 2 and row[0] != "timestamp":
+                        rows.append((row[0], row[1], row[2] if len(row) > 2 else None))
+                    if len(rows) >= 5000:
+                        self._insert(rows, offset)
+                        imported += len(rows)
+                        rows = []
+            self._insert(rows, offset)
+            imported += len(rows)
+            return imported
+
+    def _insert(self, rows, offset):
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO scans (timestamp, emotion, filename) VALUES (?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('csv_offset', ?)",
+                (str(offset),),
+            )
+
+    # ===============================
+    # QUERY
+    # ===============================
+    @staticmethod
+    def _filters(start=None, end=None, emotion=None):
+        clauses, params = [], []
+        if start:
+            clauses.append("timestamp >= ?")
+            params.append(normalize_time(start))
+        if end:
+            clauses.append("timestamp <= ?")
+            params.append(normalize_time(end, upper=True))
+        if emotion:
+            clauses.append("emotion = ?")
+            params.append(emotion)
+        return clauses, params
+
+    def query(self, start=None, end=None, emotion=None, limit=HISTORY_PAGE_SIZE, cursor=None):
+        """
+        Scan terbaru lebih dulu. `cursor` adalah id terakhir dari halaman sebelumnya.
+        `start` / `end` (inklusif) lihat normalize_time.
+        Kembalikan (items, next_cursor); next_cursor None jika sudah halaman terakhir.
+        """
+        limit = max(1, min(int(limit), HISTORY_MAX_PAGE_SIZE))
+        clauses, params = self._filters(start, end, emotion)
+        if cursor is not None:
+            clauses.append("id < ?")
+            params.append(int(cursor))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT id, timestamp, emotion, filename FROM scans {where} "
+            "ORDER BY id DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+        items = [dict(r) for r in rows[:limit]]
+        next_cursor = items[-1]["id"] if len(rows) > limit else None
+        return items, next_cursor
+
+    def aggregate(self, start=None, end=None, emotion=None, bucket="minute"):
+        """Jumlah scan per emosi per bucket waktu (day / hour / minute / second)."""
+        if bucket not in BUCKET_PREFIX:
+            raise ValueError(f"bucket must be one of {list(BUCKET_PREFIX)}")
+        clauses, params = self._filters(start, end, emotion)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT substr(timestamp, 1, {BUCKET_PREFIX[bucket]}) AS bucket, emotion, "
+            f"COUNT(*) AS count FROM scans {where} GROUP BY bucket, emotion ORDER BY bucket"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
@@ -0,0 +1,129 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from deepface import fast
+
+from config import INFER_MAX_BATCH_SIZE, INFER_MAX_WAIT_MS, DETECTION_SIZE, FACE_ALIGN
+
+
+class InferenceScheduler:
+    """
+    Antrian inferensi terpusat: frame dari banyak kamera / klien HTTP dikumpulkan
+    menjadi satu batch (max_batch_size atau max_wait_ms, mana yang lebih dulu),
+    lalu deepface.fast.analyze dijalankan sekali untuk seluruh batch.
+    Setiap pemanggil mendapat Future miliknya sendiri.
+    """
+
+    def __init__(
+        self,
+        max_batch_size=INFER_MAX_BATCH_SIZE,
+        max_wait_ms=INFER_MAX_WAIT_MS,
+        actions=("emotion",),
+        detector_backend="opencv",
+        detection_size=DETECTION_SIZE,
+        align=FACE_ALIGN,
+    ):
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, max_wait_ms / 1000.0)
+        self.actions = list(actions)
+        self.detector_backend = detector_backend
+        self.detection_size = detection_size
+        self.align = align
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._fail_pending()
+
+    def submit(self, frame):
+        """Masukkan satu frame BGR ke antrian, kembalikan Future berisi list hasil analyze."""
+        future = Future()
+        self._queue.put((frame, future))
+        if self._stop.is_set():
+            # worker sudah berhenti, jangan biarkan pemanggil menunggu selamanya
+            self._fail_pending()
+        return future
+
+    def _fail_pending(self):
+        """Gagalkan semua Future yang masih di antrian (dipanggil setelah stop)."""
+        while True:
+            try:
+                _, fut = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if fut.set_running_or_notify_cancel():
+                fut.set_exception(RuntimeError("InferenceScheduler is stopped"))
+
+    def analyze(self, frame, timeout=None):
+        """Versi blocking dari submit()."""
+        return self.submit(frame).result(timeout=timeout)
+
+    # ===============================
+    # WORKER
+    # ===============================
+    def _collect_batch(self):
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _analyze_frames(self, frames):
+        return fast.analyze(
+            list(frames),
+            actions=self.actions,
+            detector_backend=self.detector_backend,
+            detection_size=self.detection_size,
+            align=self.align,
+            # mata hanya dipakai untuk alignment; frame dari klien berbeda tidak berbagi cache mata
+            find_eyes=self.align,
+            enforce_detection=False,
+            silent=True,
+        )
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._collect_batch()
+            if not batch:
+                continue
+            # pemanggil yang sudah membatalkan tidak perlu dihitung
+            batch = [(f, fut) for f, fut in batch if fut.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            frames = [f for f, _ in batch]
+            try:
+                results = self._analyze_frames(frames)
+                for (_, fut), result in zip(batch, results):
+                    fut.set_result(result)
+            except Exception:
+                # satu frame bermasalah tidak boleh menggagalkan seluruh batch
+                for frame, fut in batch:
+                    try:
+                        fut.set_result(self._analyze_frames([frame])[0])
+                    except Exception as e:
+                        fut.set_exception(e)
@@ -0,0 +1,115 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from config import (
+    MOTION_DOWNSCALE_WIDTH,
+    MOTION_PIXEL_DELTA,
+    MOTION_ROI_THRESHOLD,
+    MOTION_SCENE_THRESHOLD,
+    MOTION_MAX_REUSE,
+)
+
+
+class MotionGate:
+    """
+    Gerbang murah di depan DeepFace.analyze berbasis frame differencing.
+
+    Frame diperkecil ke lebar `downscale_width` dalam grayscale lalu dibandingkan
+    dengan frame referensi (frame inferensi terakhir):
+    - scene: rasio piksel yang berubah > `pixel_delta` melebihi `scene_threshold`
+      (orang masuk / keluar, lampu berubah, kamera bergeser)
+    - wajah: rata-rata selisih di ROI tiap wajah melebihi `roi_threshold`
+    Jika tidak ada yang berubah, hasil inferensi sebelumnya boleh dipakai ulang.
+    Inferensi tetap dipaksa paling lambat tiap `max_reuse` detik.
+    """
+
+    def __init__(
+        self,
+        downscale_width=MOTION_DOWNSCALE_WIDTH,
+        pixel_delta=MOTION_PIXEL_DELTA,
+        roi_threshold=MOTION_ROI_THRESHOLD,
+        scene_threshold=MOTION_SCENE_THRESHOLD,
+        max_reuse=MOTION_MAX_REUSE,
+    ):
+        self.downscale_width = downscale_width
+        self.pixel_delta = pixel_delta
+        self.roi_threshold = roi_threshold
+        self.scene_threshold = scene_threshold
+        self.max_reuse = max_reuse
+        self.checked = 0
+        self.skipped = 0
+        self._reference = None
+        # resolusi frame asli referensi: frame berbeda resolusi bisa sama setelah diperkecil
+        self._reference_size = None
+        self._reference_time = 0.0
+        self._lock = threading.Lock()
+
+    def _small_gray(self, frame):
+        h, w = frame.shape[:2]
+        scale = min(1.0, self.downscale_width / float(w))
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        if scale < 1.0:
+            size = (max(1, int(w * scale)), max(1, int(h * scale)))
+            gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+        # blur kecil supaya noise sensor tidak dihitung sebagai gerakan
+        return cv2.GaussianBlur(gray, (5, 5), 0), scale
+
+    def changed(self, frame, regions=()):
+        """
+        True jika frame perlu dianalisis ulang. `regions` adalah (x, y, w, h)
+        wajah dari hasil sebelumnya dalam koordinat frame asli.
+        Referensi tidak berubah di sini: panggil commit(frame) setelah inferensi
+        frame tersebut berhasil, supaya frame yang gagal dianalisis tidak
+        membuat perubahannya terlewat.
+        """
+        small, scale = self._small_gray(frame)
+        now = time.time()
+        with self._lock:
+            self.checked += 1
+            reference = self._reference
+            changed = (
+                reference is None
+                or self._reference_size != frame.shape[:2]
+                or now - self._reference_time >= self.max_reuse
+            )
+            if not changed:
+                diff = cv2.absdiff(small, reference)
+                changed = self._scene_changed(diff) or self._faces_changed(diff, regions, scale)
+            if not changed:
+                self.skipped += 1
+            return changed
+
+    def commit(self, frame):
+        """Jadikan `frame` (frame yang baru selesai dianalisis) referensi baru."""
+        small, _ = self._small_gray(frame)
+        with self._lock:
+            self._reference = small
+            self._reference_size = frame.shape[:2]
+            self._reference_time = time.time()
+
+    def _scene_changed(self, diff):
+        moving = np.count_nonzero(diff > self.pixel_delta)
+        return moving > self.scene_threshold * diff.size
+
+    def _faces_changed(self, diff, regions, scale):
+        dh, dw = diff.shape[:2]
+        for x, y, w, h in regions:
+            x0, y0 = max(0, int(x * scale)), max(0, int(y * scale))
+            x1, y1 = min(dw, int((x + w) * scale) + 1), min(dh, int((y + h) * scale) + 1)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            if cv2.mean(diff[y0:y1, x0:x1])[0] > self.roi_threshold:
+                return True
+        return False
+
+    def reset(self):
+        with self._lock:
+            self._reference = None
+            self._reference_size = None
+
+    @property
+    def skip_ratio(self):
+        return self.skipped / self.checked if self.checked else 0.0
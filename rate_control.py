@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+
+from config import (
+    RATE_MIN_INTERVAL,
+    RATE_BASE_INTERVAL,
+    RATE_MAX_INTERVAL,
+    RATE_MAX_DUTY,
+    RATE_BOOST_SECONDS,
+)
+
+
+def cpu_load():
+    """Load average 1 menit per core (0 jika tidak tersedia, mis. Windows)."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return 0.0
+
+
+def scene_hints(prev_regions, regions, tolerance=0.1):
+    """
+    (motion, new_face) dari dua daftar region (x, y, w, h) berurutan.
+    motion: ada wajah yang pusatnya bergeser > `tolerance` x ukuran wajah.
+    new_face: jumlah wajah bertambah.
+    """
+    new_face = len(regions) > len(prev_regions)
+    motion = False
+    for x, y, w, h in regions:
+        if not prev_regions:
+            break
+        cx, cy = x + w / 2, y + h / 2
+        nearest = min(
+            abs(cx - (px + pw / 2)) + abs(cy - (py + ph / 2)) for px, py, pw, ph in prev_regions
+        )
+        if nearest > tolerance * max(w, h, 1):
+            motion = True
+            break
+    return motion, new_face
+
+
+class RateController:
+    """
+    Mengatur jeda antar inferensi per stream secara adaptif.
+
+    - latency: EMA durasi inferensi; jeda minimal latency / max_duty sehingga
+      inferensi memakai paling banyak `max_duty` dari waktu (latency tetap
+      terbatas saat mesin sibuk).
+    - CPU: jika load average per core > 1, jeda dikali load tersebut.
+    - aktivitas: notify(motion=True / new_face=True) menurunkan jeda ke
+      `min_interval` selama `boost_seconds`; scene statis memperpanjang jeda
+      bertahap sampai `max_interval`.
+    """
+
+    def __init__(
+        self,
+        min_interval=RATE_MIN_INTERVAL,
+        base_interval=RATE_BASE_INTERVAL,
+        max_interval=RATE_MAX_INTERVAL,
+        max_duty=RATE_MAX_DUTY,
+        boost_seconds=RATE_BOOST_SECONDS,
+        static_growth=1.5,
+        latency_alpha=0.2,
+    ):
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.max_duty = max_duty
+        self.boost_seconds = boost_seconds
+        self.static_growth = static_growth
+        self.latency_alpha = latency_alpha
+        self.latency = 0.0
+        self._idle_interval = base_interval
+        self._boost_until = 0.0
+        self._last_run = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self):
+        with self._lock:
+            if time.time() < self._boost_until:
+                interval = self.min_interval
+            else:
+                interval = self._idle_interval
+            interval = max(interval, self.latency / self.max_duty)
+        load = cpu_load()
+        if load > 1.0:
+            interval *= load
+        return max(interval, self.min_interval)
+
+    def remaining(self):
+        """Detik sampai inferensi berikutnya boleh jalan (0 jika sudah boleh)."""
+        return max(0.0, self._last_run + self.interval - time.time())
+
+    def ready(self):
+        return self.remaining() <= 0
+
+    def begin(self):
+        """Tandai mulai inferensi, kembalikan waktu mulai untuk end()."""
+        started = time.time()
+        with self._lock:
+            self._last_run = started
+        return started
+
+    def skip(self):
+        """Inferensi dilewati (mis. oleh motion gate): jadwal dihitung dari sekarang."""
+        with self._lock:
+            self._last_run = time.time()
+
+    def end(self, started):
+        elapsed = time.time() - started
+        with self._lock:
+            if self.latency == 0:
+                self.latency = elapsed
+            else:
+                a = self.latency_alpha
+                self.latency = a * elapsed + (1 - a) * self.latency
+        return elapsed
+
+    def notify(self, motion=False, new_face=False):
+        """Petunjuk scene dari hasil inferensi / motion gate."""
+        with self._lock:
+            if motion or new_face:
+                self._boost_until = time.time() + self.boost_seconds
+                self._idle_interval = self.base_interval
+            else:
+                self._idle_interval = min(
+                    self._idle_interval * self.static_growth, self.max_interval
+                )
@@ -1,6 +1,11 @@
 import cv2
 import math
 import random
+from collections import OrderedDict
+
+import numpy as np
+
+from compositing import CompositeLayer, blend_circle
 
 EMOJI_PARTICLE_COLOR = {
     "happy": (0, 255, 255),
@@ -13,25 +18,122 @@ EMOJI_PARTICLE_COLOR = {
 }
 EMOJI_MODES = ["vector", "cartoon", "neon", "cyberpunk"]
 
+# Sprite cache: jumlah fase animasi cyberpunk (frame_idx di-modulo nilai ini),
+# mendekati kelipatan periode sin() dan orbitnya agar loop nyaris tanpa lompatan.
+# Mode lain di-key dengan state visualnya yang memang terbatas, lihat _sprite_state.
+CYBERPUNK_PHASES = 189
+SPRITE_SIZE_BUCKET = 4
+# Satu strip (semua fase animasi) per (mode, emosi, ukuran); strip paling lama
+# tidak dipakai dibuang jika total sprite melebihi batas memori ini
+SPRITE_CACHE_BYTES = 192 * 1024 * 1024
+# ruang di sekitar lingkaran emoji untuk aura & partikel orbit
+SPRITE_MARGIN = 32
+
 class SuperEmojiRenderer:
-    def __init__(self, mode="neon"):
+    def __init__(self, mode="neon", cache_bytes=SPRITE_CACHE_BYTES):
         self.mode = mode
         self.colors = EMOJI_PARTICLE_COLOR
+        self.cache_bytes = cache_bytes
+        # (mode, emotion, size) -> {state animasi: sprite}
+        self._strips = OrderedDict()
+        self._strip_bytes = {}
+        self._cached_bytes = 0
 
     def set_mode(self, mode):
         if mode in EMOJI_MODES:
             self.mode = mode
 
     def draw(self, frame, center, size, emotion, frame_idx):
-        if self.mode == "vector":
+        if self.mode not in EMOJI_MODES:
+            return
+        size = max(SPRITE_SIZE_BUCKET, int(round(size / SPRITE_SIZE_BUCKET)) * SPRITE_SIZE_BUCKET)
+        key = (self.mode, emotion, size)
+        strip = self._strips.get(key)
+        if strip is None:
+            strip = self._strips[key] = {}
+            self._strip_bytes[key] = 0
+        self._strips.move_to_end(key)
+
+        state = self._sprite_state(self.mode, frame_idx)
+        sprite = strip.get(state)
+        if sprite is None:
+            sprite = self._rasterize(self.mode, emotion, size, frame_idx)
+            strip[state] = sprite
+            nbytes = sprite[0].nbytes + sprite[1].nbytes
+            self._strip_bytes[key] += nbytes
+            self._cached_bytes += nbytes
+            self._evict(keep=key)
+        self._blend(frame, center, sprite)
+
+    @staticmethod
+    def _sprite_state(mode, frame_idx):
+        """
+        Key animasi: dua frame dengan state sama menghasilkan gambar yang identik.
+        vector statis; cartoon hanya kedip / tidak; neon = jitter pupil (5 nilai)
+        x posisi orbit (12 partikel berjarak 30 derajat, bergeser 5 derajat/frame -> 6).
+        """
+        if mode == "vector":
+            return 0
+        if mode == "cartoon":
+            return (frame_idx % 25) < 3
+        if mode == "neon":
+            return int(2 * math.sin(frame_idx / 5)), frame_idx % 6
+        return frame_idx % CYBERPUNK_PHASES
+
+    def _evict(self, keep):
+        # satu strip utuh dibuang sekaligus, strip yang sedang dipakai tidak
+        while self._cached_bytes > self.cache_bytes and len(self._strips) > 1:
+            key = next(iter(self._strips))
+            if key == keep:
+                break
+            del self._strips[key]
+            self._cached_bytes -= self._strip_bytes.pop(key)
+
+    def _draw_primitives(self, frame, mode, center, size, emotion, frame_idx):
+        if mode == "vector":
             self._draw_vector(frame, center, size, emotion)
-        elif self.mode == "cartoon":
+        elif mode == "cartoon":
             self._draw_cartoon(frame, center, size, emotion, frame_idx)
-        elif self.mode == "neon":
+        elif mode == "neon":
             self._draw_neon(frame, center, size, emotion, frame_idx)
-        elif self.mode == "cyberpunk":
+        elif mode == "cyberpunk":
             self._draw_cyberpunk(frame, center, size, emotion, frame_idx)
 
+    # --- SPRITE CACHE ---
+    def _rasterize(self, mode, emotion, size, frame_idx):
+        """
+        Gambar emoji sekali di kanvas kecil, lalu ambil alpha-nya dengan menggambar
+        di atas latar hitam & putih: alpha = 1 - (putih - hitam) / 255, warna
+        (premultiplied) = hasil di latar hitam. Aura addWeighted ikut tertangkap.
+        """
+        half = size // 2 + SPRITE_MARGIN
+        center = (half, half)
+        black = np.zeros((2 * half + 1, 2 * half + 1, 3), dtype=np.uint8)
+        white = np.full_like(black, 255)
+        if mode == "cyberpunk":
+            frame_idx %= CYBERPUNK_PHASES
+        self._draw_primitives(black, mode, center, size, emotion, frame_idx)
+        self._draw_primitives(white, mode, center, size, emotion, frame_idx)
+        diff = white.astype(np.float32) - black.astype(np.float32)
+        inv_alpha = np.clip(diff.mean(axis=2, keepdims=True) / 255.0, 0.0, 1.0)
+        return black, inv_alpha.astype(np.float32), half
+
+    def _blend(self, frame, center, sprite):
+        """Alpha blend sprite hanya di ROI-nya, bukan seluruh frame."""
+        premult, inv_alpha, half = sprite
+        fh, fw = frame.shape[:2]
+        x0, y0 = center[0] - half, center[1] - half
+        x1, y1 = x0 + premult.shape[1], y0 + premult.shape[0]
+        fx0, fy0, fx1, fy1 = max(0, x0), max(0, y0), min(fw, x1), min(fh, y1)
+        if fx0 >= fx1 or fy0 >= fy1:
+            return
+        sx0, sy0 = fx0 - x0, fy0 - y0
+        sx1, sy1 = sx0 + (fx1 - fx0), sy0 + (fy1 - fy0)
+        roi = frame[fy0:fy1, fx0:fx1]
+        out = roi * inv_alpha[sy0:sy1, sx0:sx1] + premult[sy0:sy1, sx0:sx1]
+        np.clip(out, 0, 255, out=out)
+        roi[...] = out.astype(np.uint8)
+
     # --- VECTOR MODE (minimalis, futuristik clean) ---
     def _draw_vector(self, frame, center, size, emotion):
         color = self.colors.get(emotion, (255,255,0))
@@ -87,10 +189,10 @@ class SuperEmojiRenderer:
         radius = size//2
         color = self.colors.get(emotion,(255,255,0))
         # aura multi-layer
+        aura = CompositeLayer()
         for r in range(radius, radius+15, 3):
-            overlay=frame.copy()
-            cv2.circle(overlay,center,r,color,2)
-            cv2.addWeighted(overlay,0.05,frame,0.95,0,frame)
+            aura.circle(center,r,color,0.05,thickness=2)
+        aura.flush(frame)
         cv2.circle(frame,center,radius,color,-1)
         # mata + pupil
         ex, ey = radius//2,radius//3
@@ -123,9 +225,7 @@ class SuperEmojiRenderer:
         color = tuple(int(c*(0.6+0.4*pulse)) for c in base_color)
 
         # glow hologram besar
-        overlay = frame.copy()
-        cv2.circle(overlay, center, radius+25, color, -1)
-        cv2.addWeighted(overlay, 0.05, frame, 0.95, 0, frame)
+        blend_circle(frame, center, radius+25, color, 0.05)
 
         # lingkaran neon utama
         cv2.circle(frame, center, radius, color, 2)
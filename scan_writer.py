@@ -0,0 +1,157 @@
+import csv
+import os
+import queue
+import threading
+import time
+
+import cv2
+
+from config import SCAN_CSV_PATH, SCAN_QUEUE_SIZE, SCAN_FSYNC_INTERVAL
+
+CSV_HEADER = ["timestamp", "emotion", "filename"]
+
+
+class ScanWriter:
+    """
+    Penulis hasil scan di background.
+    Thread capture cukup memanggil submit(); encode JPEG, append baris CSV dan
+    fsync dilakukan di thread terpisah. Antrian dibatasi `max_queue` item: saat
+    penuh, item terlama dibuang (scan terbaru lebih berguna) sehingga capture
+    tidak pernah menunggu disk.
+    """
+
+    def __init__(
+        self,
+        csv_path=SCAN_CSV_PATH,
+        max_queue=SCAN_QUEUE_SIZE,
+        fsync_interval=SCAN_FSYNC_INTERVAL,
+        max_batch=32,
+        on_rows=None,
+    ):
+        self.csv_path = csv_path
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        # dipanggil di thread writer setelah tiap batch baris CSV ditulis
+        self.on_rows = on_rows
+        self.dropped = 0
+        self.written = 0
+        self.errors = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread = None
+
+        os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+        if not os.path.exists(csv_path):
+            with open(csv_path, "w", newline="") as f:
+                csv.writer(f).writerow(CSV_HEADER)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def submit(self, timestamp, emotion, filename, face_crop=None):
+        """Non-blocking. Kembalikan False jika ada item lama yang dibuang."""
+        crop = None
+        if face_crop is not None and face_crop.size > 0:
+            crop = face_crop.copy()
+        item = (timestamp, emotion, filename, crop)
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        try:
+            self._queue.get_nowait()
+            self.dropped += 1
+        except queue.Empty:
+            pass
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+        return False
+
+    # ===============================
+    # WORKER
+    # ===============================
+    def _drain(self):
+        try:
+            batch = [self._queue.get(timeout=0.2)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        # error disk (penuh, path salah, ...) dicatat saja; thread tetap hidup
+        # supaya scan berikutnya tetap ditulis begitu disk normal lagi
+        while not (self._stop.is_set() and self._queue.empty()):
+            try:
+                with open(self.csv_path, "a", newline="") as f:
+                    self._write_loop(f)
+                return
+            except OSError as e:
+                print("[ScanWriter Warning] CSV tidak bisa dibuka:", e)
+                self.errors += 1
+                self._stop.wait(1.0)
+
+    def _write_loop(self, f):
+        last_fsync = time.time()
+        dirty = False
+        writer = csv.writer(f)
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._drain()
+            rows = []
+            for timestamp, emotion, filename, crop in batch:
+                if crop is not None:
+                    try:
+                        if not cv2.imwrite(filename, crop):
+                            raise OSError(f"gagal menulis {filename}")
+                    except Exception as e:
+                        print("[ScanWriter Warning]", e)
+                        self.errors += 1
+                        continue
+                rows.append([timestamp, emotion, filename])
+            if rows:
+                try:
+                    writer.writerows(rows)
+                    f.flush()
+                except Exception as e:
+                    print("[ScanWriter Warning] baris CSV gagal ditulis:", e)
+                    self.errors += 1
+                    continue
+                self.written += len(rows)
+                dirty = True
+                if self.on_rows is not None:
+                    try:
+                        self.on_rows(rows)
+                    except Exception as e:
+                        print("[ScanWriter Warning]", e)
+            if dirty and time.time() - last_fsync >= self.fsync_interval:
+                try:
+                    os.fsync(f.fileno())
+                    dirty = False
+                except OSError as e:
+                    print("[ScanWriter Warning] fsync gagal:", e)
+                    self.errors += 1
+                last_fsync = time.time()
+        try:
+            f.flush()
+            os.fsync(f.fileno())
+        except OSError as e:
+            print("[ScanWriter Warning] fsync gagal:", e)
+            self.errors += 1
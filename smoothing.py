@@ -1,4 +1,12 @@
+import math
+import time
+
+import numpy as np
+
+from deepface.models.demography.labels import EMOTION_LABELS
+
 SMOOTHING_ALPHA = 0.35
+SMOOTHING_MODES = ["ema", "median", "one_euro"]
 
 def smooth_scores(prev_scores, new_scores, alpha=SMOOTHING_ALPHA):
     if prev_scores is None:
@@ -9,3 +17,174 @@ def smooth_scores(prev_scores, new_scores, alpha=SMOOTHING_ALPHA):
         n = float(new_scores.get(k, 0.0))
         out[k] = p*(1-alpha) + n*alpha
     return out
+
+
+class EmotionSmoother:
+    """
+    Smoothing skor emosi untuk semua track sekaligus.
+    Skor seluruh track disimpan dalam satu array (n_tracks, 7) berurutan sesuai
+    Emotion.labels, sehingga satu update = satu operasi NumPy untuk semua wajah.
+
+    mode:
+        - "ema": exponential moving average dengan `alpha`
+        - "median": median dari `window` skor terakhir
+        - "one_euro": one-euro filter (cutoff adaptif terhadap kecepatan perubahan)
+    hysteresis: emosi dominan baru berganti jika skornya melebihi skor emosi
+        dominan sekarang minimal sebesar nilai ini (poin persen). 0 = tanpa hysteresis.
+    """
+
+    def __init__(
+        self,
+        mode="ema",
+        alpha=SMOOTHING_ALPHA,
+        window=5,
+        min_cutoff=1.0,
+        beta=0.01,
+        d_cutoff=1.0,
+        hysteresis=0.0,
+    ):
+        if mode not in SMOOTHING_MODES:
+            raise ValueError(f"unknown smoothing mode - {mode}")
+        self.mode = mode
+        self.alpha = alpha
+        self.window = max(1, int(window))
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.hysteresis = hysteresis
+        self.labels = list(EMOTION_LABELS)
+
+        n_labels = len(self.labels)
+        self.rows = {}
+        self.scores = np.zeros((0, n_labels), dtype=np.float32)
+        self.dominant_idx = np.zeros(0, dtype=np.int64)
+        self._history = np.full((0, self.window, n_labels), np.nan, dtype=np.float32)
+        self._history_pos = np.zeros(0, dtype=np.int64)
+        self._derivative = np.zeros((0, n_labels), dtype=np.float32)
+        self._last_time = np.zeros(0, dtype=np.float64)
+
+    # ===============================
+    # ROW MANAGEMENT
+    # ===============================
+    def _ensure_rows(self, track_ids):
+        new_ids = [tid for tid in track_ids if tid not in self.rows]
+        if not new_ids:
+            return
+        n_new = len(new_ids)
+        n_labels = len(self.labels)
+        for tid in new_ids:
+            self.rows[tid] = len(self.rows)
+        self.scores = np.vstack([self.scores, np.zeros((n_new, n_labels), np.float32)])
+        self.dominant_idx = np.concatenate([self.dominant_idx, np.full(n_new, -1)])
+        self._history = np.concatenate(
+            [self._history, np.full((n_new, self.window, n_labels), np.nan, np.float32)]
+        )
+        self._history_pos = np.concatenate([self._history_pos, np.zeros(n_new, np.int64)])
+        self._derivative = np.vstack([self._derivative, np.zeros((n_new, n_labels), np.float32)])
+        self._last_time = np.concatenate([self._last_time, np.zeros(n_new)])
+
+    def retain(self, track_ids):
+        """Buang state track yang sudah tidak ada."""
+        track_ids = set(track_ids)
+        keep_ids = [tid for tid in self.rows if tid in track_ids]
+        if len(keep_ids) == len(self.rows):
+            return
+        keep = np.array([self.rows[tid] for tid in keep_ids], dtype=np.int64)
+        self.scores = self.scores[keep]
+        self.dominant_idx = self.dominant_idx[keep]
+        self._history = self._history[keep]
+        self._history_pos = self._history_pos[keep]
+        self._derivative = self._derivative[keep]
+        self._last_time = self._last_time[keep]
+        self.rows = {tid: i for i, tid in enumerate(keep_ids)}
+
+    def clear(self):
+        self.retain([])
+
+    # ===============================
+    # UPDATE
+    # ===============================
+    def to_array(self, score_dicts):
+        """List dict skor DeepFace -> array (n, 7) sesuai urutan Emotion.labels."""
+        return np.array(
+            [[float(s.get(label, 0.0)) for label in self.labels] for s in score_dicts],
+            dtype=np.float32,
+        ).reshape(-1, len(self.labels))
+
+    def update(self, track_ids, new_scores, timestamp=None):
+        """
+        Update skor beberapa track sekaligus.
+        new_scores: list dict skor (output DeepFace) atau array (n, 7).
+        """
+        track_ids = list(track_ids)
+        if not track_ids:
+            return self.scores[:0]
+        if not isinstance(new_scores, np.ndarray):
+            new_scores = self.to_array(new_scores)
+        new_scores = new_scores.astype(np.float32, copy=False)
+        now = time.time() if timestamp is None else timestamp
+
+        self._ensure_rows(track_ids)
+        idx = np.array([self.rows[tid] for tid in track_ids], dtype=np.int64)
+        fresh = self._last_time[idx] == 0
+
+        prev = self.scores[idx]
+        if self.mode == "ema":
+            out = prev * (1 - self.alpha) + new_scores * self.alpha
+        elif self.mode == "median":
+            pos = self._history_pos[idx]
+            self._history[idx, pos] = new_scores
+            self._history_pos[idx] = (pos + 1) % self.window
+            out = np.nanmedian(self._history[idx], axis=1)
+        else:
+            dt = np.where(fresh, 1 / 30.0, np.maximum(now - self._last_time[idx], 1e-3))
+            dt = dt[:, None].astype(np.float32)
+            d_alpha = self._cutoff_alpha(self.d_cutoff, dt)
+            derivative = (new_scores - prev) / dt
+            derivative = d_alpha * derivative + (1 - d_alpha) * self._derivative[idx]
+            cutoff = self.min_cutoff + self.beta * np.abs(derivative)
+            a = self._cutoff_alpha(cutoff, dt)
+            out = a * new_scores + (1 - a) * prev
+            self._derivative[idx] = np.where(fresh[:, None], 0, derivative)
+
+        # track baru langsung memakai skor mentah
+        out = np.where(fresh[:, None], new_scores, out)
+        self.scores[idx] = out
+        self._last_time[idx] = now
+        self._update_dominant(idx)
+        return out
+
+    @staticmethod
+    def _cutoff_alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def _update_dominant(self, idx):
+        scores = self.scores[idx]
+        best = np.argmax(scores, axis=1)
+        current = self.dominant_idx[idx]
+        if self.hysteresis > 0:
+            has_current = current >= 0
+            current_score = np.take_along_axis(
+                scores, np.maximum(current, 0)[:, None], axis=1
+            )[:, 0]
+            best_score = scores[np.arange(len(idx)), best]
+            switch = ~has_current | (best_score - current_score >= self.hysteresis)
+            best = np.where(switch, best, current)
+        self.dominant_idx[idx] = best
+
+    # ===============================
+    # READ
+    # ===============================
+    def get(self, track_id):
+        """Skor ter-smoothing satu track sebagai dict label -> float, atau None."""
+        row = self.rows.get(track_id)
+        if row is None:
+            return None
+        return {label: float(v) for label, v in zip(self.labels, self.scores[row])}
+
+    def dominant(self, track_id, default="neutral"):
+        row = self.rows.get(track_id)
+        if row is None or self.dominant_idx[row] < 0:
+            return default
+        return self.labels[self.dominant_idx[row]]
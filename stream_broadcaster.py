@@ -0,0 +1,91 @@
+import threading
+import time
+
+import cv2
+
+BOUNDARY_PREFIX = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+
+
+class StreamBroadcaster:
+    """
+    Encode-once MJPEG fan-out.
+    Satu thread producer mengambil frame terbaru dari FrameRing, menggambar
+    overlay lewat `render(frame, frame_idx)` dan meng-encode JPEG sekali;
+    hasilnya dibagikan ke semua viewer /stream. Viewer yang lambat tidak
+    menahan producer: ia langsung melompat ke frame terbaru (frame lama dibuang).
+    Producer hanya berjalan selama ada viewer.
+    """
+
+    def __init__(self, frame_ring, render=None, max_fps=30, jpeg_quality=95):
+        self.frame_ring = frame_ring
+        self.render = render
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), int(jpeg_quality)]
+        self._cond = threading.Condition()
+        self._payload = None
+        self._payload_seq = 0
+        self._subscribers = 0
+        self._thread = None
+
+    # ===============================
+    # PRODUCER
+    # ===============================
+    def _ensure_producer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        frame_idx = 0
+        last_seq = 0
+        while True:
+            with self._cond:
+                if self._subscribers == 0:
+                    self._thread = None
+                    return
+            started = time.time()
+            seq, frame_view = self.frame_ring.wait_newer(last_seq, timeout=0.5)
+            if frame_view is None or seq == last_seq:
+                continue
+            last_seq = seq
+            frame = frame_view.copy()
+            if self.render is not None:
+                self.render(frame, frame_idx)
+            ret, buffer = cv2.imencode(".jpg", frame, self.encode_params)
+            if ret:
+                payload = BOUNDARY_PREFIX + buffer.tobytes() + b"\r\n"
+                with self._cond:
+                    self._payload = payload
+                    self._payload_seq += 1
+                    self._cond.notify_all()
+                frame_idx += 1
+            elapsed = time.time() - started
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+
+    # ===============================
+    # SUBSCRIBERS
+    # ===============================
+    def subscribe(self, is_active=lambda: True):
+        """Generator chunk MJPEG untuk satu viewer."""
+        with self._cond:
+            self._subscribers += 1
+            self._ensure_producer()
+        last_seen = 0
+        try:
+            while is_active():
+                with self._cond:
+                    self._cond.wait_for(lambda: self._payload_seq > last_seen, timeout=0.5)
+                    if self._payload_seq == last_seen:
+                        continue
+                    last_seen = self._payload_seq
+                    payload = self._payload
+                yield payload
+        finally:
+            with self._cond:
+                self._subscribers -= 1
+
+    @property
+    def subscribers(self):
+        with self._cond:
+            return self._subscribers
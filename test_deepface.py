@@ -1,5 +1,8 @@
 # ultra_emoji_with_scatter.py
 from deepface import DeepFace
+from tracker import TrackManager
+from smoothing import EmotionSmoother
+from compositing import CompositeLayer
 import cv2
 import time
 import numpy as np
@@ -85,10 +88,10 @@ class SuperEmojiRenderer:
         radius = size//2
         color = self.colors.get(emotion,(255,255,0))
         # glow
+        glow = CompositeLayer()
         for r in range(radius,radius+15,3):
-            overlay=frame.copy()
-            cv2.circle(overlay,center,r,color,2)
-            cv2.addWeighted(overlay,0.05,frame,0.95,0,frame)
+            glow.circle(center,r,color,0.05,thickness=2)
+        glow.flush(frame)
         cv2.circle(frame,center,radius,color,-1)
         ex, ey = radius//2,radius//3
         pupil_jitter = int(2*math.sin(frame_idx/5))
@@ -223,17 +226,6 @@ class UltraEmoji:
             self.y = self.y*(1-ease) + tgt_y*ease
             self.is_scattered=False
 
-# ---------------- EMA smoothing ----------------
-def smooth_scores(prev_scores,new_scores,alpha=SMOOTHING_ALPHA):
-    if prev_scores is None:
-        return {k: float(v) for k,v in new_scores.items()}
-    out={}
-    for k in set(list(prev_scores.keys())+list(new_scores.keys())):
-        p=float(prev_scores.get(k,0.0))
-        n=float(new_scores.get(k,0.0))
-        out[k]=p*(1-alpha)+n*alpha
-    return out
-
 # ---------------- Main ----------------
 def analyze_with_bars_vector():
     cap=cv2.VideoCapture(0)
@@ -246,7 +238,8 @@ def analyze_with_bars_vector():
     frame_idx=0
     fps_start=time.time()
     emojis=[]
-    smoothed_scores=[]
+    tracks=TrackManager(emoji_factory=UltraEmoji)
+    smoother=EmotionSmoother(alpha=SMOOTHING_ALPHA)
     renderer=SuperEmojiRenderer(mode=EMOJI_MODES[EMOJI_MODE_IDX])
 
     scatter_mode=False  # toggled by user: if True emojis move away from face
@@ -260,23 +253,17 @@ def analyze_with_bars_vector():
         try:
             results=DeepFace.analyze(frame,actions=['emotion'],enforce_detection=False)
             if not isinstance(results,list): results=[results]
-            if len(results)==0:
-                emojis=[]
-                smoothed_scores=[]
-            else:
-                if len(emojis)!=len(results):
-                    # re-create emoji objects if face count changed
-                    emojis=[]
-                    smoothed_scores=[]
-                    for r in results:
-                        emojis.append(UltraEmoji(r['dominant_emotion'],r['region']['x'],r['region']['y'],r['region']['w'],r['region']['h']))
-                        smoothed_scores.append(None)
-
+            # stable face IDs: emoji lives on the track, smoothing state is keyed by track id
+            active_tracks=tracks.update(results)
+            emojis=[t.emoji for t in active_tracks]
+            # one vectorized EMA step for every face of the frame
+            smoother.update([t.id for t in active_tracks],[r.get('emotion',{}) for r in results])
+            smoother.retain([t.id for t in tracks.tracks])
+            if len(results)>0:
                 for idx,r in enumerate(results):
                     x=int(r['region']['x']); y=int(r['region']['y'])
                     ww=int(r['region']['w']); hh=int(r['region']['h'])
                     dominant=r['dominant_emotion']
-                    raw_scores=r.get('emotion',{})
 
                     # update emoji data
                     emojis[idx].update(x,y,ww,hh,scatter=scatter_mode)
@@ -288,12 +275,12 @@ def analyze_with_bars_vector():
                     cv2.putText(frame,f"EMOTION: {dominant.upper()}",(x,max(y-12,16)),cv2.FONT_HERSHEY_SIMPLEX,0.75,label_color,2)
 
                     # bars
-                    smoothed_scores[idx]=smooth_scores(smoothed_scores[idx],raw_scores)
+                    smoothed=smoother.get(active_tracks[idx].id)
                     bar_x0=min(fw-BAR_WIDTH-12,x+ww+12)
                     bar_y0=y
                     cv2.rectangle(frame,(bar_x0-6,bar_y0-6),(bar_x0+BAR_WIDTH+6,bar_y0+len(EMOTIONS_ORDER)*24+6),(10,10,10),-1)
                     for i,emo in enumerate(EMOTIONS_ORDER):
-                        val=int(smoothed_scores[idx].get(emo,0.0) if smoothed_scores[idx] is not None else 0)
+                        val=int(smoothed.get(emo,0.0) if smoothed is not None else 0)
                         val=max(0,min(100,int(round(val))))
                         length=int(BAR_MAX_PIXELS*(val/100.0))
                         y_line=bar_y0+i*24
@@ -304,8 +291,6 @@ def analyze_with_bars_vector():
                         cv2.putText(frame,f"{val:3d}%",(bar_x0+62+BAR_MAX_PIXELS+6,y_line+16),cv2.FONT_HERSHEY_SIMPLEX,0.45,(220,220,220),1)
         except Exception:
             emojis=[]
-            smoothed_scores=[]
-            pass
 
         # draw emojis (they manage their own positions)
         for e in emojis:
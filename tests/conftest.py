@@ -0,0 +1,7 @@
+import os
+import sys
+
+# modul app (config, tracker, smoothing, ...) ada di root repo, bukan package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
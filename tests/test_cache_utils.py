@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from deepface.commons import cache_utils
+from deepface.commons.cache_utils import LRUCache, perceptual_hash
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    state = {"now": 1000.0}
+    monkeypatch.setattr(cache_utils.time, "time", lambda: state["now"])
+    return state
+
+
+def test_get_and_put():
+    cache = LRUCache(max_size=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    cache.put("a", 2)
+    assert cache.get("a") == 2
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # "a" baru dipakai, jadi "b" yang dibuang
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_disabled_when_size_is_zero():
+    cache = LRUCache(max_size=0)
+    assert not cache.enabled
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_ttl_expiry(clock):
+    cache = LRUCache(max_size=4, ttl=10)
+    cache.put("a", 1)
+    clock["now"] += 10
+    assert cache.get("a") == 1
+    clock["now"] += 0.5
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_put_refreshes_ttl(clock):
+    cache = LRUCache(max_size=4, ttl=10)
+    cache.put("a", 1)
+    clock["now"] += 8
+    cache.put("a", 2)
+    clock["now"] += 8
+    assert cache.get("a") == 2
+
+
+def test_no_ttl_never_expires(clock):
+    cache = LRUCache(max_size=4, ttl=0)
+    cache.put("a", 1)
+    clock["now"] += 1e6
+    assert cache.get("a") == 1
+
+
+def test_stats_and_clear():
+    cache = LRUCache(max_size=4, ttl=5)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats() == {
+        "size": 1,
+        "max_size": 4,
+        "ttl": 5,
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": pytest.approx(2 / 3),
+    }
+    cache.clear()
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["hit_rate"] == 0.0
+
+
+def face(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(50, 200, size=(48, 48), dtype=np.uint8)
+
+
+def test_perceptual_hash_length():
+    assert len(perceptual_hash(face())) == 16 * 16 // 8
+    assert len(perceptual_hash(face(), hash_size=8)) == 8
+
+
+def test_perceptual_hash_is_stable():
+    img = face()
+    assert perceptual_hash(img) == perceptual_hash(img.copy())
+
+
+def test_perceptual_hash_ignores_brightness_shift():
+    img = face()
+    assert perceptual_hash(img) == perceptual_hash(img + 20)
+
+
+def test_perceptual_hash_differs_for_different_images():
+    assert perceptual_hash(face(0)) != perceptual_hash(face(1))
+    assert perceptual_hash(face()) != perceptual_hash(np.fliplr(face()).copy())
@@ -0,0 +1,53 @@
+import pytest
+
+from deepface.models.Detector import FacialAreaRegion
+from deepface.modules.detection import rescale_facial_area
+
+
+def test_scales_box_and_landmarks():
+    area = FacialAreaRegion(
+        x=10,
+        y=20,
+        w=30,
+        h=40,
+        left_eye=(15, 25),
+        right_eye=(35, 25),
+        confidence=0.87,
+        nose=(25, 35),
+        mouth_right=(18, 50),
+        mouth_left=(32, 50),
+    )
+    scaled = rescale_facial_area(area, 2.0)
+    assert (scaled.x, scaled.y, scaled.w, scaled.h) == (20, 40, 60, 80)
+    assert scaled.left_eye == (30, 50)
+    assert scaled.right_eye == (70, 50)
+    assert scaled.nose == (50, 70)
+    assert scaled.mouth_right == (36, 100)
+    assert scaled.mouth_left == (64, 100)
+    assert scaled.confidence == pytest.approx(0.87)
+
+
+def test_missing_landmarks_stay_none():
+    scaled = rescale_facial_area(FacialAreaRegion(x=1, y=2, w=3, h=4), 3)
+    assert (scaled.x, scaled.y, scaled.w, scaled.h) == (3, 6, 9, 12)
+    assert scaled.left_eye is None
+    assert scaled.right_eye is None
+    assert scaled.nose is None
+    assert scaled.mouth_right is None
+    assert scaled.mouth_left is None
+    assert scaled.confidence is None
+
+
+def test_rounds_to_int():
+    area = FacialAreaRegion(x=3, y=5, w=7, h=9, left_eye=(3, 7))
+    scaled = rescale_facial_area(area, 1 / 0.6)
+    assert (scaled.x, scaled.y, scaled.w, scaled.h) == (5, 8, 12, 15)
+    assert scaled.left_eye == (5, 12)
+    assert all(isinstance(v, int) for v in (scaled.x, scaled.y, scaled.w, scaled.h))
+    assert all(isinstance(v, int) for v in scaled.left_eye)
+
+
+def test_does_not_modify_input():
+    area = FacialAreaRegion(x=10, y=10, w=10, h=10, left_eye=(12, 12))
+    rescale_facial_area(area, 0.5)
+    assert (area.x, area.w, area.left_eye) == (10, 10, (12, 12))
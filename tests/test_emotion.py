@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from deepface.models.demography import Emotion
+from deepface.models.demography.labels import EMOTION_LABELS
+
+
+def test_labels_order():
+    assert EMOTION_LABELS == ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
+
+
+def test_preprocess_face_shape_and_range():
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, size=(120, 90, 3), dtype=np.uint8)
+    processed = Emotion.preprocess_face(img)
+    assert processed.shape == (48, 48, 1)
+    assert processed.dtype == np.float32
+    assert processed.min() >= 0.0
+    assert processed.max() <= 1.0
+
+
+def test_preprocess_face_square_input_fills_canvas():
+    img = np.full((96, 96, 3), 255, dtype=np.uint8)
+    processed = Emotion.preprocess_face(img)
+    assert processed == pytest.approx(np.ones((48, 48, 1), dtype=np.float32))
+
+
+def test_preprocess_face_letterbox():
+    # wajah tinggi 100 x lebar 50 -> 48 x 24 di tengah kanvas
+    img = np.full((100, 50, 3), 255, dtype=np.uint8)
+    processed = Emotion.preprocess_face(img)[:, :, 0]
+    assert (processed[:, :12] == 0).all()
+    assert (processed[:, 36:] == 0).all()
+    assert processed[:, 12:36] == pytest.approx(np.ones((48, 24)))
+
+
+def test_preprocess_face_grayscale_input():
+    gray = np.full((60, 60), 51, dtype=np.uint8)
+    bgr = np.repeat(gray[:, :, None], 3, axis=2)
+    processed = Emotion.preprocess_face(gray)
+    assert processed.shape == (48, 48, 1)
+    assert processed == pytest.approx(np.full((48, 48, 1), 0.2), abs=1e-6)
+    assert processed == pytest.approx(Emotion.preprocess_face(bgr), abs=1e-6)
+
+
+def test_preprocess_face_tiny_input():
+    processed = Emotion.preprocess_face(np.full((1, 200, 3), 255, dtype=np.uint8))
+    assert processed.shape == (48, 48, 1)
+    assert processed.max() == pytest.approx(1.0)
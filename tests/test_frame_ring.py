@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+
+from frame_ring import FrameRing
+
+
+def frame(value, shape=(4, 6, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+class FakeCapture:
+    """Meniru cv2.VideoCapture.read(image=...): menulis ke buffer jika diberikan."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.targets = []
+
+    def read(self, image=None):
+        self.targets.append(image)
+        if not self.frames:
+            return False, None
+        src = self.frames.pop(0)
+        if image is not None and image.shape == src.shape:
+            image[...] = src
+            return True, image
+        return True, src.copy()
+
+
+def test_empty_ring():
+    ring = FrameRing(size=4)
+    assert ring.latest() == (0, None)
+    assert not ring.is_valid(0)
+
+
+def test_size_has_minimum():
+    assert FrameRing(size=0).size == 2
+
+
+def test_write_and_latest():
+    ring = FrameRing(size=4)
+    ring.write(frame(1))
+    ring.write(frame(2))
+    seq, view = ring.latest()
+    assert seq == 2
+    assert (view == 2).all()
+    assert not view.flags.writeable
+    with pytest.raises(ValueError):
+        view[0, 0, 0] = 9
+
+
+def test_write_copies_source():
+    ring = FrameRing(size=4)
+    src = frame(5)
+    ring.write(src)
+    src[...] = 0
+    assert (ring.latest()[1] == 5).all()
+
+
+def test_is_valid_until_slot_may_be_overwritten():
+    ring = FrameRing(size=4)
+    ring.write(frame(1))
+    seq, _ = ring.latest()
+    ring.write(frame(2))
+    ring.write(frame(3))
+    assert ring.is_valid(seq)
+    ring.write(frame(4))
+    assert not ring.is_valid(seq)
+
+
+def test_slots_are_reused():
+    ring = FrameRing(size=2)
+    ring.write(frame(1))
+    _, first = ring.latest()
+    ring.write(frame(2))
+    ring.write(frame(3))
+    _, third = ring.latest()
+    assert np.shares_memory(first, third)
+
+
+def test_resolution_change_reallocates():
+    ring = FrameRing(size=3)
+    ring.write(frame(1))
+    ring.write(frame(2, shape=(8, 10, 3)))
+    seq, view = ring.latest()
+    assert seq == 2
+    assert view.shape == (8, 10, 3)
+
+
+def test_dtype_change_reallocates():
+    ring = FrameRing(size=3)
+    ring.write(frame(1))
+    ring.write(np.full((4, 6, 3), 0.5, dtype=np.float32))
+    _, view = ring.latest()
+    assert view.dtype == np.float32
+    assert (view == 0.5).all()
+
+
+def test_reallocation_keeps_old_views_intact():
+    ring = FrameRing(size=3)
+    ring.write(frame(1))
+    _, old = ring.latest()
+    ring.write(frame(2, shape=(8, 10, 3)))
+    ring.write(frame(3, shape=(8, 10, 3)))
+    assert (old == 1).all()
+    assert (ring.latest()[1] == 3).all()
+
+
+def test_wait_newer():
+    ring = FrameRing(size=4)
+    assert ring.wait_newer(0, timeout=0.01) == (0, None)
+    ring.write(frame(7))
+    seq, view = ring.wait_newer(0, timeout=0.01)
+    assert seq == 1
+    assert (view == 7).all()
+    # tidak ada frame lebih baru: kembali setelah timeout dengan frame terakhir
+    assert ring.wait_newer(seq, timeout=0.01)[0] == seq
+
+
+def test_capture_reads_into_slots():
+    ring = FrameRing(size=2)
+    cap = FakeCapture([frame(1), frame(2), frame(3)])
+    assert ring.capture(cap)
+    assert cap.targets[0] is None
+    assert ring.capture(cap)
+    assert ring.capture(cap)
+    # setelah alokasi pertama, read menulis langsung ke slot ring
+    assert all(target is not None for target in cap.targets[1:])
+    seq, view = ring.latest()
+    assert seq == 3
+    assert (view == 3).all()
+
+
+def test_capture_failure():
+    ring = FrameRing(size=2)
+    cap = FakeCapture([])
+    assert not ring.capture(cap)
+    assert ring.latest() == (0, None)
+
+
+def test_capture_resolution_change():
+    ring = FrameRing(size=2)
+    cap = FakeCapture([frame(1), frame(2, shape=(8, 10, 3))])
+    ring.capture(cap)
+    ring.capture(cap)
+    seq, view = ring.latest()
+    assert seq == 2
+    assert view.shape == (8, 10, 3)
+    assert (view == 2).all()
+
+
+def test_reset():
+    ring = FrameRing(size=2)
+    ring.write(frame(1))
+    ring.reset()
+    assert ring.latest() == (0, None)
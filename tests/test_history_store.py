@@ -0,0 +1,207 @@
+from datetime import datetime, timezone
+
+import pytest
+
+import history_store
+from history_store import HistoryStore, normalize_time
+
+HEADER = "timestamp,emotion,filename\n"
+
+
+def scan_line(timestamp, emotion, filename="face.jpg"):
+    return f"{timestamp},{emotion},{filename}\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "emotions_log.csv"
+    path.write_text(HEADER)
+    return path
+
+
+@pytest.fixture
+def store(tmp_path, csv_path):
+    s = HistoryStore(db_path=str(tmp_path / "history.sqlite3"), csv_path=str(csv_path))
+    yield s
+    s.close()
+
+
+def append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def fill(path, n, emotion="happy"):
+    append(path, "".join(
+        scan_line(f"2024-05-01_10-00-{i:02d}", emotion, f"{i}.jpg") for i in range(n)
+    ))
+
+
+def test_missing_csv(tmp_path):
+    s = HistoryStore(db_path=str(tmp_path / "h.sqlite3"), csv_path=str(tmp_path / "none.csv"))
+    assert s.sync_from_csv() == 0
+    assert s.query() == ([], None)
+    s.close()
+
+
+def test_pagination_with_cursor(store, csv_path):
+    fill(csv_path, 5)
+    assert store.sync_from_csv() == 5
+
+    items, cursor = store.query(limit=2)
+    assert [i["filename"] for i in items] == ["4.jpg", "3.jpg"]
+    assert cursor == items[-1]["id"]
+
+    items, cursor = store.query(limit=2, cursor=cursor)
+    assert [i["filename"] for i in items] == ["2.jpg", "1.jpg"]
+
+    items, cursor = store.query(limit=2, cursor=cursor)
+    assert [i["filename"] for i in items] == ["0.jpg"]
+    assert cursor is None
+
+
+def test_exact_page_has_no_next_cursor(store, csv_path):
+    fill(csv_path, 2)
+    store.sync_from_csv()
+    items, cursor = store.query(limit=2)
+    assert len(items) == 2
+    assert cursor is None
+
+
+def test_limit_is_clamped(store, csv_path, monkeypatch):
+    fill(csv_path, 3)
+    store.sync_from_csv()
+    assert len(store.query(limit=0)[0]) == 1
+    monkeypatch.setattr(history_store, "HISTORY_MAX_PAGE_SIZE", 2)
+    assert len(store.query(limit=50)[0]) == 2
+
+
+def test_incremental_sync(store, csv_path):
+    fill(csv_path, 2)
+    assert store.sync_from_csv() == 2
+    assert store.sync_from_csv() == 0
+
+    append(csv_path, scan_line("2024-05-01_11-00-00", "sad"))
+    assert store.sync_from_csv() == 1
+    assert len(store.query()[0]) == 3
+
+
+def test_partial_line_waits_for_newline(store, csv_path):
+    append(csv_path, "2024-05-01_11-00-00,sa")
+    assert store.sync_from_csv() == 0
+
+    append(csv_path, "d,a.jpg\n")
+    assert store.sync_from_csv() == 1
+    items, _ = store.query()
+    assert items[0]["emotion"] == "sad"
+    assert items[0]["filename"] == "a.jpg"
+
+
+def test_rotated_csv_is_reimported_from_start(store, csv_path):
+    fill(csv_path, 5)
+    store.sync_from_csv()
+
+    csv_path.write_text(HEADER + scan_line("2024-06-01_09-00-00", "fear"))
+    assert store.sync_from_csv() == 1
+    items, _ = store.query(limit=1)
+    assert items[0]["emotion"] == "fear"
+
+
+def test_offset_survives_reopen(tmp_path, csv_path):
+    db = str(tmp_path / "history.sqlite3")
+    fill(csv_path, 3)
+    HistoryStore(db_path=db, csv_path=str(csv_path)).close()
+
+    s = HistoryStore(db_path=db, csv_path=str(csv_path))
+    assert len(s.query()[0]) == 3
+    s.close()
+
+
+def test_filters(store, csv_path):
+    append(csv_path, "".join([
+        scan_line("2024-05-01_09-59-59", "happy"),
+        scan_line("2024-05-01_10-00-00", "sad"),
+        scan_line("2024-05-01_10-30-00", "happy"),
+        scan_line("2024-05-02_00-00-00", "happy"),
+    ]))
+    store.sync_from_csv()
+
+    def timestamps(**kwargs):
+        return [i["timestamp"] for i in store.query(**kwargs)[0]]
+
+    assert timestamps(emotion="sad") == ["2024-05-01_10-00-00"]
+    assert timestamps(start="2024-05-01_10-00-00", end="2024-05-01_10-30-00") == [
+        "2024-05-01_10-30-00",
+        "2024-05-01_10-00-00",
+    ]
+    # ISO: tanggal saja sebagai batas atas mencakup seluruh hari
+    assert timestamps(start="2024-05-01", end="2024-05-01", emotion="happy") == [
+        "2024-05-01_10-30-00",
+        "2024-05-01_09-59-59",
+    ]
+    assert timestamps(start="2024-05-01T10:00", end="2024-05-01 10:30") == [
+        "2024-05-01_10-30-00",
+        "2024-05-01_10-00-00",
+    ]
+
+
+def test_invalid_time_raises(store):
+    with pytest.raises(ValueError):
+        store.query(start="yesterday")
+    with pytest.raises(ValueError):
+        store.aggregate(end="2024/05/01")
+
+
+def test_aggregate(store, csv_path):
+    append(csv_path, "".join([
+        scan_line("2024-05-01_10-00-01", "happy"),
+        scan_line("2024-05-01_10-00-30", "happy"),
+        scan_line("2024-05-01_10-01-00", "sad"),
+        scan_line("2024-05-01_11-00-00", "happy"),
+    ]))
+    store.sync_from_csv()
+
+    assert store.aggregate(bucket="minute") == [
+        {"bucket": "2024-05-01_10-00", "emotion": "happy", "count": 2},
+        {"bucket": "2024-05-01_10-01", "emotion": "sad", "count": 1},
+        {"bucket": "2024-05-01_11-00", "emotion": "happy", "count": 1},
+    ]
+    assert store.aggregate(bucket="day", emotion="happy") == [
+        {"bucket": "2024-05-01", "emotion": "happy", "count": 3},
+    ]
+    assert store.aggregate(start="2024-05-01T11:00", bucket="hour") == [
+        {"bucket": "2024-05-01_11", "emotion": "happy", "count": 1},
+    ]
+    with pytest.raises(ValueError):
+        store.aggregate(bucket="week")
+
+
+@pytest.mark.parametrize(
+    "value, upper, expected",
+    [
+        ("2024-05-01_10-00-00", False, "2024-05-01_10-00-00"),
+        ("2024-05-01", False, "2024-05-01_00-00-00"),
+        ("2024-05-01", True, "2024-05-01_23-59-59"),
+        ("2024-05-01T10:00", False, "2024-05-01_10-00-00"),
+        ("2024-05-01T10:00", True, "2024-05-01_10-00-59"),
+        ("2024-05-01 10:00:05", True, "2024-05-01_10-00-05"),
+        (" 2024-05-01T10:00:05 ", False, "2024-05-01_10-00-05"),
+    ],
+)
+def test_normalize_time(value, upper, expected):
+    assert normalize_time(value, upper=upper) == expected
+
+
+def test_normalize_time_converts_offset_to_local():
+    expected = (
+        datetime(2024, 5, 1, 3, 0, 0, tzinfo=timezone.utc)
+        .astimezone()
+        .strftime(history_store.TIMESTAMP_FORMAT)
+    )
+    assert normalize_time("2024-05-01T10:00:00+07:00") == expected
+
+
+@pytest.mark.parametrize("value", ["", "yesterday", "2024/05/01", "2024-13-01"])
+def test_normalize_time_rejects_unknown_format(value):
+    with pytest.raises(ValueError):
+        normalize_time(value)
@@ -0,0 +1,121 @@
+import numpy as np
+
+from motion_gate import MotionGate
+
+
+def gate(**kwargs):
+    params = dict(
+        downscale_width=320,
+        pixel_delta=25,
+        roi_threshold=10,
+        scene_threshold=0.05,
+        max_reuse=60.0,
+    )
+    params.update(kwargs)
+    return MotionGate(**params)
+
+
+def check(g, frame, regions=()):
+    """Seperti pemanggil: frame yang berubah dianalisis lalu di-commit."""
+    changed = g.changed(frame, regions)
+    if changed:
+        g.commit(frame)
+    return changed
+
+
+def plain_frame(value=100, shape=(480, 640, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def frame_with_patch():
+    frame = plain_frame()
+    frame[100:140, 100:140] = 160
+    return frame
+
+
+def test_first_frame_and_identical_frame():
+    g = gate()
+    assert check(g, plain_frame())
+    assert not check(g, plain_frame())
+    assert g.checked == 2
+    assert g.skipped == 1
+    assert g.skip_ratio == 0.5
+
+
+def test_skip_ratio_without_checks():
+    assert gate().skip_ratio == 0.0
+
+
+def test_scene_change():
+    g = gate()
+    check(g, plain_frame(100))
+    assert check(g, plain_frame(200))
+    # frame yang sudah dianalisis menjadi referensi baru
+    assert not check(g, plain_frame(200))
+
+
+def test_changed_does_not_replace_reference():
+    g = gate()
+    check(g, plain_frame(100))
+    # inferensi frame ini gagal / dibatalkan: tidak ada commit
+    assert g.changed(plain_frame(200))
+    assert g.changed(plain_frame(200))
+    g.commit(plain_frame(200))
+    assert not g.changed(plain_frame(200))
+
+
+def test_no_reference_until_commit():
+    g = gate()
+    assert g.changed(plain_frame())
+    assert g.changed(plain_frame())
+    assert g.skipped == 0
+
+
+def test_small_change_only_detected_inside_face_regions():
+    g = gate()
+    check(g, plain_frame())
+    # patch kecil tidak cukup untuk scene_threshold
+    assert not check(g, frame_with_patch())
+
+    g = gate()
+    check(g, plain_frame())
+    assert check(g, frame_with_patch(), regions=[(90, 90, 60, 60)])
+
+
+def test_change_outside_face_region_is_ignored():
+    g = gate()
+    check(g, plain_frame())
+    assert not check(g, frame_with_patch(), regions=[(400, 300, 60, 60)])
+
+
+def test_out_of_frame_region_is_ignored():
+    g = gate()
+    check(g, plain_frame())
+    assert not check(g, frame_with_patch(), regions=[(2000, 2000, 50, 50)])
+
+
+def test_max_reuse_forces_inference():
+    g = gate(max_reuse=0)
+    assert check(g, plain_frame())
+    assert check(g, plain_frame())
+
+
+def test_resolution_change():
+    g = gate()
+    check(g, plain_frame())
+    # 640x480 dan 320x240 sama-sama menjadi 320x240 setelah diperkecil
+    assert check(g, plain_frame(shape=(240, 320, 3)))
+    assert not check(g, plain_frame(shape=(240, 320, 3)))
+
+
+def test_grayscale_input():
+    g = gate()
+    assert check(g, plain_frame(shape=(480, 640)))
+    assert not check(g, plain_frame(shape=(480, 640)))
+
+
+def test_reset():
+    g = gate()
+    check(g, plain_frame())
+    g.reset()
+    assert check(g, plain_frame())
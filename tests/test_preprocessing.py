@@ -0,0 +1,150 @@
+import threading
+
+import numpy as np
+import pytest
+
+from deepface.modules.preprocessing import (
+    TensorArena,
+    normalize_input,
+    resize_image,
+    resize_image_into,
+)
+
+
+def image(shape=(100, 50, 3), seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(1, 256, size=shape, dtype=np.uint8)
+
+
+def test_resize_image_into_matches_resize_image():
+    img = image()
+    out = np.empty((224, 224, 3), dtype=np.float32)
+    assert resize_image_into(img, out) is out
+    np.testing.assert_array_equal(out, resize_image(img, (224, 224))[0])
+
+
+def test_resize_image_shape():
+    resized = resize_image(image(), (160, 120))
+    assert resized.shape == (1, 160, 120, 3)
+    assert resized.dtype == np.float32
+
+
+def test_resize_image_into_pads_with_zeros():
+    # isi buffer dengan nilai lama untuk memastikan padding selalu ditulis ulang
+    out = np.full((48, 48, 3), np.nan, dtype=np.float32)
+    resize_image_into(image((100, 50, 3)), out)
+    assert not np.isnan(out).any()
+    assert (out[:, :12] == 0).all()
+    assert (out[:, 36:] == 0).all()
+    assert (out[:, 12:36] > 0).all()
+
+    out[...] = np.nan
+    resize_image_into(image((50, 100, 3)), out)
+    assert (out[:12] == 0).all()
+    assert (out[36:] == 0).all()
+
+
+def test_resize_image_into_scales_uint8():
+    out = np.empty((10, 10, 3), dtype=np.float32)
+    resize_image_into(np.full((20, 20, 3), 255, dtype=np.uint8), out)
+    assert out == pytest.approx(np.ones_like(out))
+
+
+def test_resize_image_into_keeps_normalized_input():
+    img = np.full((20, 20, 3), 0.5, dtype=np.float32)
+    out = np.empty((10, 10, 3), dtype=np.float32)
+    resize_image_into(img, out)
+    assert out == pytest.approx(np.full_like(out, 0.5))
+
+
+def test_resize_image_into_grayscale():
+    out = np.empty((10, 10, 1), dtype=np.float32)
+    resize_image_into(np.full((20, 20), 51, dtype=np.uint8), out)
+    assert out == pytest.approx(np.full_like(out, 0.2))
+    assert resize_image(np.full((20, 20), 51, dtype=np.uint8), (10, 10)).shape == (1, 10, 10, 1)
+
+
+def test_arena_reuses_buffer():
+    arena = TensorArena()
+    first = arena.get(2, 8, 8)
+    second = arena.get(2, 8, 8)
+    assert first.shape == (2, 8, 8, 3)
+    assert first.dtype == np.float32
+    assert np.shares_memory(first, second)
+    # batch lebih kecil memakai buffer yang sama
+    assert np.shares_memory(first, arena.get(1, 8, 8))
+
+
+def test_arena_grows_geometrically():
+    arena = TensorArena()
+    arena.get(2, 8, 8)
+    grown = arena.get(3, 8, 8)
+    assert grown.shape[0] == 3
+    assert arena.retained_bytes == 4 * 8 * 8 * 3 * 4
+    assert np.shares_memory(grown, arena.get(4, 8, 8))
+
+
+def test_arena_separates_shapes():
+    arena = TensorArena()
+    assert not np.shares_memory(arena.get(1, 8, 8), arena.get(1, 8, 8, 1))
+    assert arena.retained_bytes == 8 * 8 * 3 * 4 + 8 * 8 * 1 * 4
+
+
+def test_arena_does_not_retain_oversized_batch():
+    item_bytes = 8 * 8 * 3 * 4
+    arena = TensorArena(max_bytes=4 * item_bytes)
+    big = arena.get(5, 8, 8)
+    assert big.shape == (5, 8, 8, 3)
+    assert arena.retained_bytes == 0
+    # pertumbuhan dibatasi max_bytes
+    arena.get(3, 8, 8)
+    arena.get(4, 8, 8)
+    assert arena.retained_bytes == 4 * item_bytes
+
+
+def test_arena_evicts_other_shapes_over_budget():
+    item_bytes = 8 * 8 * 3 * 4
+    arena = TensorArena(max_bytes=4 * item_bytes)
+    arena.get(3, 8, 8)
+    arena.get(2, 4, 4)
+    assert arena.retained_bytes == 3 * item_bytes + 2 * 4 * 4 * 3 * 4
+    arena.get(4, 8, 8)
+    assert arena.retained_bytes == 4 * item_bytes
+
+
+def test_arena_trim():
+    arena = TensorArena()
+    arena.get(2, 8, 8)
+    arena.trim()
+    assert arena.retained_bytes == 0
+
+
+def test_arena_buffers_are_per_thread():
+    arena = TensorArena()
+    main = arena.get(1, 8, 8)
+    result = {}
+
+    def worker():
+        result["buffer"] = arena.get(1, 8, 8)
+        result["max_bytes"] = arena.max_bytes
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert not np.shares_memory(main, result["buffer"])
+    assert result["max_bytes"] == arena.max_bytes
+
+
+def test_normalize_input_facenet_in_place():
+    img = np.random.default_rng(0).random((1, 8, 8, 3), dtype=np.float32)
+    out = normalize_input(img, "Facenet")
+    assert out is img
+    assert out.mean() == pytest.approx(0, abs=1e-5)
+    assert out.std() == pytest.approx(1, abs=1e-4)
+
+
+def test_normalize_input_base_and_unknown():
+    img = np.ones((1, 2, 2, 3), dtype=np.float32)
+    assert normalize_input(img) is img
+    with pytest.raises(ValueError):
+        normalize_input(img.copy(), "unknown")
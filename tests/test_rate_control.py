@@ -0,0 +1,139 @@
+import pytest
+
+import rate_control
+from rate_control import RateController, scene_hints
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_control.time, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def load(monkeypatch):
+    state = {"value": 0.0}
+    monkeypatch.setattr(rate_control, "cpu_load", lambda: state["value"])
+    return state
+
+
+def controller(**kwargs):
+    params = dict(
+        min_interval=0.1,
+        base_interval=0.5,
+        max_interval=2.0,
+        max_duty=0.5,
+        boost_seconds=3.0,
+    )
+    params.update(kwargs)
+    return RateController(**params)
+
+
+def test_scene_hints():
+    face = (100, 100, 50, 50)
+    assert scene_hints([], []) == (False, False)
+    assert scene_hints([], [face]) == (False, True)
+    assert scene_hints([face], [face]) == (False, False)
+    # geser 3 px < 0.1 * 50: bukan gerakan
+    assert scene_hints([face], [(103, 100, 50, 50)]) == (False, False)
+    assert scene_hints([face], [(120, 100, 50, 50)]) == (True, False)
+    assert scene_hints([face, (300, 100, 50, 50)], [face]) == (False, False)
+    assert scene_hints([face], [face, (300, 100, 50, 50)]) == (True, True)
+
+
+def test_base_interval(clock, load):
+    assert controller().interval == pytest.approx(0.5)
+
+
+def test_boost_then_expire(clock, load):
+    rate = controller()
+    rate.notify(motion=True)
+    assert rate.interval == pytest.approx(0.1)
+    clock.now += 3.1
+    assert rate.interval == pytest.approx(0.5)
+
+
+def test_new_face_boosts(clock, load):
+    rate = controller()
+    rate.notify(new_face=True)
+    assert rate.interval == pytest.approx(0.1)
+
+
+def test_static_scene_grows_up_to_max(clock, load):
+    rate = controller()
+    rate.notify()
+    assert rate.interval == pytest.approx(0.75)
+    for _ in range(10):
+        rate.notify()
+    assert rate.interval == pytest.approx(2.0)
+    # aktivitas mengembalikan jeda idle ke base_interval
+    rate.notify(motion=True)
+    clock.now += 3.1
+    assert rate.interval == pytest.approx(0.5)
+
+
+def test_latency_bounds_interval(clock, load):
+    rate = controller()
+    started = rate.begin()
+    clock.now += 0.4
+    assert rate.end(started) == pytest.approx(0.4)
+    assert rate.latency == pytest.approx(0.4)
+    # jeda minimal latency / max_duty
+    assert rate.interval == pytest.approx(0.8)
+    rate.notify(motion=True)
+    assert rate.interval == pytest.approx(0.8)
+
+
+def test_latency_ema(clock, load):
+    rate = controller(latency_alpha=0.5)
+    started = rate.begin()
+    clock.now += 0.2
+    rate.end(started)
+    started = rate.begin()
+    clock.now += 0.4
+    rate.end(started)
+    assert rate.latency == pytest.approx(0.3)
+
+
+def test_cpu_load_scales_interval(clock, load):
+    rate = controller()
+    load["value"] = 0.9
+    assert rate.interval == pytest.approx(0.5)
+    load["value"] = 2.0
+    assert rate.interval == pytest.approx(1.0)
+
+
+def test_interval_never_below_min(clock, load):
+    rate = controller(min_interval=0.2, base_interval=0.05)
+    assert rate.interval == pytest.approx(0.2)
+
+
+def test_remaining_and_ready(clock, load):
+    rate = controller()
+    assert rate.ready()
+    rate.begin()
+    assert not rate.ready()
+    assert rate.remaining() == pytest.approx(0.5)
+    clock.now += 0.2
+    assert rate.remaining() == pytest.approx(0.3)
+    clock.now += 0.3
+    assert rate.ready()
+    assert rate.remaining() == 0.0
+
+
+def test_skip_restarts_schedule(clock, load):
+    rate = controller()
+    rate.begin()
+    clock.now += 0.4
+    rate.skip()
+    assert rate.remaining() == pytest.approx(0.5)
+    assert rate.latency == 0.0
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from smoothing import EmotionSmoother, smooth_scores
+
+
+def scores(**values):
+    out = {label: 0.0 for label in ("angry", "disgust", "fear", "happy", "sad", "surprise", "neutral")}
+    out.update(values)
+    return out
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        EmotionSmoother(mode="kalman")
+
+
+def test_new_track_uses_raw_scores():
+    for mode in ("ema", "median", "one_euro"):
+        smoother = EmotionSmoother(mode=mode)
+        smoother.update([1], [scores(happy=80, sad=20)], timestamp=1.0)
+        assert smoother.get(1)["happy"] == pytest.approx(80)
+        assert smoother.dominant(1) == "happy"
+
+
+def test_ema():
+    smoother = EmotionSmoother(mode="ema", alpha=0.5)
+    smoother.update([1], [scores(happy=100)], timestamp=1.0)
+    smoother.update([1], [scores(happy=0)], timestamp=2.0)
+    assert smoother.get(1)["happy"] == pytest.approx(50)
+    smoother.update([1], [scores(happy=0)], timestamp=3.0)
+    assert smoother.get(1)["happy"] == pytest.approx(25)
+
+
+def test_ema_matches_smooth_scores():
+    prev = scores(happy=60, sad=40)
+    new = scores(happy=20, sad=80)
+    smoother = EmotionSmoother(mode="ema", alpha=0.35)
+    smoother.update([1], [prev], timestamp=1.0)
+    smoother.update([1], [new], timestamp=2.0)
+    expected = smooth_scores(prev, new, alpha=0.35)
+    for label, value in smoother.get(1).items():
+        assert value == pytest.approx(expected[label], abs=1e-4)
+
+
+def test_median_over_window():
+    smoother = EmotionSmoother(mode="median", window=3)
+    for t, value in enumerate([10, 90, 20], start=1):
+        smoother.update([1], [scores(happy=value)], timestamp=float(t))
+    assert smoother.get(1)["happy"] == pytest.approx(20)
+    # nilai tertua (10) keluar dari window
+    smoother.update([1], [scores(happy=30)], timestamp=4.0)
+    assert smoother.get(1)["happy"] == pytest.approx(30)
+
+
+def test_one_euro_follows_gradually():
+    smoother = EmotionSmoother(mode="one_euro")
+    smoother.update([1], [scores(happy=100)], timestamp=1.0)
+    smoother.update([1], [scores(happy=0)], timestamp=1.1)
+    first = smoother.get(1)["happy"]
+    assert 0 < first < 100
+
+    t = 1.1
+    for _ in range(50):
+        t += 0.1
+        smoother.update([1], [scores(happy=0)], timestamp=t)
+    assert smoother.get(1)["happy"] < first
+
+
+def test_tracks_are_independent_and_accept_arrays():
+    smoother = EmotionSmoother(mode="ema", alpha=1.0)
+    batch = np.zeros((2, 7), dtype=np.float32)
+    batch[0, 3] = 90  # happy
+    batch[1, 4] = 90  # sad
+    smoother.update([1, 2], batch, timestamp=1.0)
+    assert smoother.dominant(1) == "happy"
+    assert smoother.dominant(2) == "sad"
+
+
+def test_hysteresis_keeps_dominant_until_lead_is_large_enough():
+    smoother = EmotionSmoother(mode="ema", alpha=1.0, hysteresis=10)
+    smoother.update([1], [scores(happy=60, sad=40)], timestamp=1.0)
+    assert smoother.dominant(1) == "happy"
+
+    smoother.update([1], [scores(happy=48, sad=52)], timestamp=2.0)
+    assert smoother.dominant(1) == "happy"
+
+    smoother.update([1], [scores(happy=45, sad=55)], timestamp=3.0)
+    assert smoother.dominant(1) == "sad"
+
+
+def test_without_hysteresis_dominant_is_argmax():
+    smoother = EmotionSmoother(mode="ema", alpha=1.0)
+    smoother.update([1], [scores(happy=60, sad=40)], timestamp=1.0)
+    smoother.update([1], [scores(happy=49, sad=51)], timestamp=2.0)
+    assert smoother.dominant(1) == "sad"
+
+
+def test_retain_drops_other_tracks():
+    smoother = EmotionSmoother(mode="ema")
+    smoother.update([1, 2, 3], [scores(happy=90), scores(sad=90), scores(fear=90)], timestamp=1.0)
+    smoother.retain([3, 1])
+    assert smoother.get(2) is None
+    assert smoother.dominant(2, default="neutral") == "neutral"
+    assert smoother.dominant(1) == "happy"
+    assert smoother.dominant(3) == "fear"
+
+    smoother.clear()
+    assert smoother.rows == {}
+    assert smoother.get(1) is None
+
+
+def test_empty_update():
+    smoother = EmotionSmoother()
+    assert len(smoother.update([], [])) == 0
@@ -0,0 +1,184 @@
+import cv2
+import numpy as np
+
+from tracker import FaceTracker, TrackManager, region_iou
+
+
+def textured_frame(seed=0, shape=(240, 320)):
+    # noise yang di-blur: cukup banyak sudut untuk goodFeaturesToTrack / optical flow
+    rng = np.random.default_rng(seed)
+    noise = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    gray = cv2.GaussianBlur(noise, (0, 0), 3)
+    gray = cv2.normalize(gray, None, 0, 255, cv2.NORM_MINMAX)
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+
+def face_result(x, y, w, h, confidence=0.9, emotion="happy"):
+    return {
+        "region": {"x": x, "y": y, "w": w, "h": h, "left_eye": None, "right_eye": None},
+        "face_confidence": confidence,
+        "dominant_emotion": emotion,
+    }
+
+
+def test_detection_runs_every_n_frames():
+    tracker = FaceTracker(detect_every=3)
+    frame = textured_frame()
+    assert tracker.needs_detection()
+
+    tracker.reset(frame, [face_result(100, 80, 60, 60)])
+    assert not tracker.needs_detection()
+    tracker.track(frame)
+    tracker.track(frame)
+    assert not tracker.needs_detection()
+    tracker.track(frame)
+    assert tracker.needs_detection()
+
+
+def test_stable_tracks_double_the_detection_interval():
+    tracker = FaceTracker(detect_every=2)
+    frame = textured_frame()
+    tracker.reset(frame, [face_result(100, 80, 60, 60)])
+    tracker.track(frame)
+    tracker.track(frame)
+    assert tracker.needs_detection()
+    assert not tracker.needs_detection(stable=True)
+    tracker.track(frame)
+    tracker.track(frame)
+    assert tracker.needs_detection(stable=True)
+
+
+def test_box_follows_moving_content():
+    tracker = FaceTracker(detect_every=10)
+    frame = textured_frame()
+    tracker.reset(frame, [face_result(100, 80, 60, 60)])
+
+    # isi frame bergeser 5 px ke kanan, 3 px ke bawah
+    moved = np.roll(frame, shift=(3, 5), axis=(0, 1))
+    results = tracker.track(moved)
+
+    region = results[0]["region"]
+    assert abs(region["x"] - 105) <= 1
+    assert abs(region["y"] - 83) <= 1
+    assert (region["w"], region["h"]) == (60, 60)
+    assert not tracker.lost
+
+
+def test_reset_does_not_alias_caller_results():
+    tracker = FaceTracker()
+    frame = textured_frame()
+    original = face_result(100, 80, 60, 60)
+    tracker.reset(frame, [original])
+    tracker.track(np.roll(frame, shift=(3, 5), axis=(0, 1)))
+    assert original["region"]["x"] == 100
+
+
+def test_no_face_result_is_not_tracked():
+    tracker = FaceTracker()
+    frame = textured_frame()
+    tracker.reset(frame, [face_result(0, 0, 320, 240, confidence=0)])
+    results = tracker.track(np.roll(frame, shift=(3, 5), axis=(0, 1)))
+    assert (results[0]["region"]["x"], results[0]["region"]["y"]) == (0, 0)
+
+
+def test_resolution_change_loses_tracks():
+    tracker = FaceTracker(detect_every=10)
+    tracker.reset(textured_frame(), [face_result(100, 80, 60, 60)])
+    tracker.track(textured_frame(shape=(120, 160)))
+    assert tracker.lost
+    assert tracker.needs_detection()
+
+
+def test_force_detection():
+    tracker = FaceTracker(detect_every=10)
+    frame = textured_frame()
+    tracker.reset(frame, [face_result(100, 80, 60, 60)])
+    tracker.force_detection()
+    assert tracker.lost
+    assert tracker.needs_detection()
+    tracker.reset(frame, [face_result(100, 80, 60, 60)])
+    assert not tracker.lost
+
+
+def region(x, y, w, h):
+    return {"x": x, "y": y, "w": w, "h": h}
+
+
+def test_region_iou():
+    assert region_iou(region(0, 0, 10, 10), region(0, 0, 10, 10)) == 1.0
+    assert region_iou(region(0, 0, 10, 10), region(20, 20, 10, 10)) == 0.0
+    # 5x10 overlap, union 150
+    assert region_iou(region(0, 0, 10, 10), region(5, 0, 10, 10)) == 50 / 150
+    assert region_iou(region(0, 0, 0, 0), region(0, 0, 0, 0)) == 0.0
+
+
+def test_same_face_keeps_its_id():
+    manager = TrackManager(iou_threshold=0.3)
+    first = manager.update([face_result(100, 100, 50, 50)])
+    second = manager.update([face_result(104, 102, 50, 50)])
+    assert first[0].id == second[0].id
+    assert second[0].hits == 2
+    assert second[0].region["x"] == 104
+
+
+def test_new_face_gets_new_id_in_result_order():
+    manager = TrackManager(iou_threshold=0.3)
+    (a,) = manager.update([face_result(100, 100, 50, 50)])
+    tracks = manager.update([face_result(300, 100, 50, 50), face_result(102, 100, 50, 50)])
+    assert tracks[1].id == a.id
+    assert tracks[0].id != a.id
+    assert len(manager.tracks) == 2
+
+
+def test_best_overlap_wins_when_two_faces_compete():
+    manager = TrackManager(iou_threshold=0.1)
+    left, right = manager.update([face_result(100, 100, 50, 50), face_result(160, 100, 50, 50)])
+    # kedua hasil tumpang tindih dengan track kiri, yang paling mirip yang mendapat ID-nya
+    tracks = manager.update([face_result(130, 100, 50, 50), face_result(101, 100, 50, 50)])
+    assert tracks[1].id == left.id
+    assert tracks[0].id == right.id
+
+
+def test_missed_track_is_kept_for_max_misses():
+    manager = TrackManager(iou_threshold=0.3, max_misses=2)
+    (track,) = manager.update([face_result(100, 100, 50, 50)])
+    manager.update([])
+    manager.update([])
+    assert [t.id for t in manager.tracks] == [track.id]
+    (back,) = manager.update([face_result(100, 100, 50, 50)])
+    assert back.id == track.id
+    assert back.misses == 0
+
+    manager.update([])
+    manager.update([])
+    manager.update([])
+    assert manager.tracks == []
+    (new,) = manager.update([face_result(100, 100, 50, 50)])
+    assert new.id != track.id
+
+
+def test_emoji_is_created_once_per_track():
+    created = []
+
+    def factory(emotion, x, y, w, h):
+        created.append((emotion, x, y, w, h))
+        return object()
+
+    manager = TrackManager(emoji_factory=factory, iou_threshold=0.3)
+    (first,) = manager.update([face_result(100, 100, 50, 50, emotion="sad")])
+    (second,) = manager.update([face_result(101, 100, 50, 50, emotion="happy")])
+    assert created == [("sad", 100, 100, 50, 50)]
+    assert first.emoji is second.emoji
+
+
+def test_all_stable():
+    manager = TrackManager(iou_threshold=0.3, stable_hits=3)
+    assert not manager.all_stable()
+    for _ in range(2):
+        manager.update([face_result(100, 100, 50, 50)])
+    assert not manager.all_stable()
+    manager.update([face_result(100, 100, 50, 50)])
+    assert manager.all_stable()
+    # wajah baru belum stabil
+    manager.update([face_result(100, 100, 50, 50), face_result(300, 100, 50, 50)])
+    assert not manager.all_stable()
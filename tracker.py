@@ -0,0 +1,222 @@
+import cv2
+import numpy as np
+
+from config import (
+    TRACK_DETECT_EVERY,
+    TRACK_MIN_CONFIDENCE,
+    TRACK_IOU_THRESHOLD,
+    TRACK_MAX_MISSES,
+    TRACK_STABLE_HITS,
+)
+
+
+def region_iou(a, b):
+    """IoU dua region DeepFace (dict x, y, w, h)."""
+    ax2, ay2 = a["x"] + a["w"], a["y"] + a["h"]
+    bx2, by2 = b["x"] + b["w"], b["y"] + b["h"]
+    iw = min(ax2, bx2) - max(a["x"], b["x"])
+    ih = min(ay2, by2) - max(a["y"], b["y"])
+    if iw <= 0 or ih <= 0:
+        return 0.0
+    inter = iw * ih
+    union = a["w"] * a["h"] + b["w"] * b["h"] - inter
+    return inter / union if union > 0 else 0.0
+
+
+class FaceTracker:
+    """
+    Detect-once, track-between-detections.
+    DeepFace.analyze cukup dijalankan tiap `detect_every` frame; di antaranya kotak
+    wajah digeser mengikuti optical flow (Lucas-Kanade) dari titik-titik fitur di
+    dalam kotak. Deteksi ulang dipaksa jika titik yang masih terlacak turun di
+    bawah `min_confidence` (rasio terhadap jumlah titik awal).
+    """
+
+    def __init__(
+        self,
+        detect_every=TRACK_DETECT_EVERY,
+        min_confidence=TRACK_MIN_CONFIDENCE,
+        max_points=30,
+    ):
+        self.detect_every = max(1, int(detect_every))
+        self.min_confidence = min_confidence
+        self.max_points = max_points
+        self.results = []
+        self._prev_gray = None
+        self._points = []
+        self._initial_points = []
+        self._boxes = []
+        self._since_detection = self.detect_every
+        self._lost = False
+
+    def needs_detection(self, stable=False):
+        # semua track stabil -> interval deteksi diperpanjang 2x
+        interval = self.detect_every * 2 if stable else self.detect_every
+        return self._lost or self._since_detection >= interval
+
+    def force_detection(self):
+        self._lost = True
+
+    @property
+    def lost(self):
+        return self._lost
+
+    def reset(self, frame, results):
+        """Simpan hasil DeepFace.analyze terbaru dan ambil titik fitur tiap wajah."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self.results = [dict(r, region=dict(r["region"])) for r in results]
+        self._points = []
+        self._initial_points = []
+        self._boxes = []
+        for r in self.results:
+            region = r["region"]
+            x, y, w, h = (int(region[k]) for k in ("x", "y", "w", "h"))
+            pts = None
+            # face_confidence 0 = tidak ada wajah (region seluruh frame), tidak dilacak
+            if r.get("face_confidence", 0) > 0:
+                roi = gray[y : y + h, x : x + w]
+                if roi.size > 0:
+                    pts = cv2.goodFeaturesToTrack(
+                        roi, maxCorners=self.max_points, qualityLevel=0.01, minDistance=5
+                    )
+                    if pts is not None:
+                        pts = pts + np.float32([x, y])
+            self._points.append(pts)
+            self._initial_points.append(0 if pts is None else len(pts))
+            self._boxes.append([float(x), float(y)])
+        self._prev_gray = gray
+        self._since_detection = 0
+        self._lost = False
+        return self.results
+
+    def track(self, frame):
+        """Geser kotak wajah hasil deteksi terakhir ke posisi di frame ini."""
+        self._since_detection += 1
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self._prev_gray is None or self._prev_gray.shape != gray.shape:
+            self._lost = True
+            self._prev_gray = gray
+            return self.results
+
+        fh, fw = gray.shape
+        for i, r in enumerate(self.results):
+            pts = self._points[i]
+            if pts is None or len(pts) == 0:
+                continue
+            new_pts, status, _ = cv2.calcOpticalFlowPyrLK(
+                self._prev_gray, gray, pts, None, winSize=(15, 15), maxLevel=2
+            )
+            good = status.reshape(-1) == 1 if new_pts is not None else np.zeros(0, bool)
+            if good.sum() / max(1, self._initial_points[i]) < self.min_confidence:
+                self._lost = True
+            if not good.any():
+                self._points[i] = None
+                continue
+
+            dx, dy = np.median((new_pts[good] - pts[good]).reshape(-1, 2), axis=0)
+            self._points[i] = new_pts[good].reshape(-1, 1, 2)
+
+            region = r["region"]
+            self._boxes[i][0] = float(np.clip(self._boxes[i][0] + dx, 0, fw - 1))
+            self._boxes[i][1] = float(np.clip(self._boxes[i][1] + dy, 0, fh - 1))
+            region["x"] = int(round(self._boxes[i][0]))
+            region["y"] = int(round(self._boxes[i][1]))
+            for key in ("left_eye", "right_eye"):
+                if region.get(key) is not None:
+                    ex, ey = region[key]
+                    region[key] = (int(round(ex + dx)), int(round(ey + dy)))
+
+        self._prev_gray = gray
+        return self.results
+
+
+class Track:
+    """Satu wajah dengan ID tetap; emoji menempel di sini, skor smoothing memakai `id`."""
+
+    def __init__(self, track_id, result, emoji=None):
+        self.id = track_id
+        self.result = result
+        self.emoji = emoji
+        self.hits = 1
+        self.misses = 0
+
+    @property
+    def region(self):
+        return self.result["region"]
+
+
+class TrackManager:
+    """
+    Memberi ID tetap ke setiap wajah antar frame dengan greedy IoU matching pada
+    `region`. Track yang tidak cocok tetap disimpan sampai `max_misses` frame agar
+    wajah yang sempat hilang sebentar kembali ke ID (dan state) yang sama.
+    """
+
+    def __init__(
+        self,
+        emoji_factory=None,
+        iou_threshold=TRACK_IOU_THRESHOLD,
+        max_misses=TRACK_MAX_MISSES,
+        stable_hits=TRACK_STABLE_HITS,
+    ):
+        self.emoji_factory = emoji_factory
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.stable_hits = stable_hits
+        self.tracks = []
+        self._next_id = 1
+
+    def _new_track(self, result):
+        emoji = None
+        if self.emoji_factory is not None:
+            region = result["region"]
+            emoji = self.emoji_factory(
+                result.get("dominant_emotion", "neutral"),
+                region["x"],
+                region["y"],
+                region["w"],
+                region["h"],
+            )
+        track = Track(self._next_id, result, emoji)
+        self._next_id += 1
+        self.tracks.append(track)
+        return track
+
+    def update(self, results):
+        """Cocokkan hasil frame ini ke track, kembalikan track aktif sesuai urutan `results`."""
+        pairs = []
+        for ti, track in enumerate(self.tracks):
+            for ri, r in enumerate(results):
+                score = region_iou(track.region, r["region"])
+                if score >= self.iou_threshold:
+                    pairs.append((score, ti, ri))
+        pairs.sort(reverse=True)
+
+        matched_tracks = set()
+        assigned = [None] * len(results)
+        for _, ti, ri in pairs:
+            if ti in matched_tracks or assigned[ri] is not None:
+                continue
+            track = self.tracks[ti]
+            track.result = results[ri]
+            track.hits += 1
+            track.misses = 0
+            matched_tracks.add(ti)
+            assigned[ri] = track
+
+        for ti, track in enumerate(self.tracks):
+            if ti not in matched_tracks:
+                track.misses += 1
+        self.tracks = [t for t in self.tracks if t.misses <= self.max_misses]
+
+        for ri, r in enumerate(results):
+            if assigned[ri] is None:
+                assigned[ri] = self._new_track(r)
+        return assigned
+
+    def all_stable(self):
+        active = [t for t in self.tracks if t.misses == 0]
+        return len(active) > 0 and all(t.hits >= self.stable_hits for t in active)
+
+    def clear(self):
+        self.tracks = []